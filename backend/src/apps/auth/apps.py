@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ApiAuthConfig(AppConfig):
+    name = "apps.auth"
+    label = "api_auth"
+
+    def ready(self):
+        from apps.auth import signals  # noqa: F401
@@ -0,0 +1,268 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+
+
+class TokenCache:
+    """
+    Bounded in-process LRU of resolved tokens with a per-entry TTL.
+
+    Every entry keeps the revocation version of its token in the shared
+    cache, read before the token was resolved. Callers compare it with the
+    current version on each hit, so a token revoked by another process is
+    refused right away; the invalidation signals also drop the entries of
+    their own process.
+    """
+
+    def __init__(self, max_size, timeout):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """The ``(token, version)`` cached for ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, token, version = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return token, version
+
+    def set(self, key, token, version=None):
+        if self.max_size <= 0 or self.timeout <= 0:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.timeout, token, version)
+            self._keys_by_user.setdefault(token.user_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def delete_user(self, user_id):
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[1].user_id
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache():
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                options = settings.TOKEN_AUTH_CACHE
+                _token_cache = TokenCache(options["MAX_SIZE"], options["TIMEOUT"])
+    return _token_cache
+
+
+def get_shared_cache():
+    alias = settings.TOKEN_AUTH_CACHE.get("CACHE_ALIAS")
+    return caches[alias] if alias else None
+
+
+def get_shared_key(key):
+    return f"auth:token:{key}:entry"
+
+
+def get_version_key(key):
+    return f"auth:token:{key}:version"
+
+
+def revoke(shared_cache, keys):
+    """
+    Give ``keys`` new versions, which every process checks before using a
+    token it cached. The versions outlive every entry cached before them.
+    """
+    options = settings.TOKEN_AUTH_CACHE
+    shared_cache.set_many(
+        {get_version_key(key): uuid.uuid4().hex for key in keys},
+        max(options["TIMEOUT"], options["SHARED_TIMEOUT"]),
+    )
+    shared_cache.delete_many([get_shared_key(key) for key in keys])
+
+
+def invalidate_token(key):
+    get_token_cache().delete(key)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        revoke(shared_cache, [key])
+
+
+def invalidate_user(user_id, keys=()):
+    get_token_cache().delete_user(user_id)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None and keys:
+        revoke(shared_cache, keys)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in ``TokenAuthentication`` that caches resolved tokens.
+
+    Lookups go to the in-process LRU first, then to the Django cache named by
+    ``TOKEN_AUTH_CACHE["CACHE_ALIAS"]``, and only then to the database. A
+    local hit still reads the token's revocation version from that cache,
+    one small read instead of a query. Without that cache nothing is cached,
+    since no process could tell the others about a revoked token. Each
+    request gets its own copy of the cached token and user.
+    ``aauthenticate`` does the same for async views without blocking the
+    event loop.
+    """
+
+    def authenticate(self, request):
+        key = self.get_key(request)
+        if key is None:
+            return None
+        return self.authenticate_credentials(key)
+
+    async def aauthenticate(self, request):
+        key = self.get_key(request)
+        if key is None:
+            return None
+        return await self.aauthenticate_credentials(key)
+
+    def get_key(self, request):
+        """Parse the token key out of the header, as ``authenticate`` does."""
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) == 1:
+            msg = _("Invalid token header. No credentials provided.")
+            raise exceptions.AuthenticationFailed(msg)
+        elif len(auth) > 2:
+            msg = _("Invalid token header. Token string should not contain spaces.")
+            raise exceptions.AuthenticationFailed(msg)
+        try:
+            return auth[1].decode()
+        except UnicodeError:
+            msg = _(
+                "Invalid token header. "
+                "Token string should not contain invalid characters."
+            )
+            raise exceptions.AuthenticationFailed(msg)
+
+    def authenticate_credentials(self, key):
+        shared_cache = get_shared_cache()
+        if shared_cache is None:
+            return self.get_credentials(self.get_token(key))
+
+        token_cache = get_token_cache()
+        entry = token_cache.get(key)
+        if entry is not None:
+            token, version = entry
+            if shared_cache.get(get_version_key(key)) == version:
+                return self.get_credentials(token)
+
+        shared = shared_cache.get_many([get_version_key(key), get_shared_key(key)])
+        version, token = self.read_shared(key, shared)
+        if token is None:
+            token = self.get_token(key)
+            shared_cache.set(
+                get_shared_key(key),
+                (token, version),
+                settings.TOKEN_AUTH_CACHE["SHARED_TIMEOUT"],
+            )
+        token_cache.set(key, token, version)
+        return self.get_credentials(token)
+
+    async def aauthenticate_credentials(self, key):
+        shared_cache = get_shared_cache()
+        if shared_cache is None:
+            return self.get_credentials(await self.aget_token(key))
+
+        token_cache = get_token_cache()
+        entry = token_cache.get(key)
+        if entry is not None:
+            token, version = entry
+            if await shared_cache.aget(get_version_key(key)) == version:
+                return self.get_credentials(token)
+
+        shared = await shared_cache.aget_many(
+            [get_version_key(key), get_shared_key(key)]
+        )
+        version, token = self.read_shared(key, shared)
+        if token is None:
+            token = await self.aget_token(key)
+            await shared_cache.aset(
+                get_shared_key(key),
+                (token, version),
+                settings.TOKEN_AUTH_CACHE["SHARED_TIMEOUT"],
+            )
+        token_cache.set(key, token, version)
+        return self.get_credentials(token)
+
+    def read_shared(self, key, shared):
+        """
+        The current version of ``key`` and its shared token, ``None`` when
+        missing or cached under an older version.
+        """
+        version = shared.get(get_version_key(key))
+        token, token_version = shared.get(get_shared_key(key), (None, None))
+        return version, token if token_version == version else None
+
+    def get_credentials(self, token):
+        token = clone_token(token)
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        return (token.user, token)
+
+    def get_token(self, key):
+        model = self.get_model()
+        try:
+            return model.objects.select_related("user").get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+    async def aget_token(self, key):
+        model = self.get_model()
+        try:
+            return await model.objects.select_related("user").aget(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+
+def clone_token(token):
+    token = copy.copy(token)
+    token.user = copy.copy(token.user)
+    return token
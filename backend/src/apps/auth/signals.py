@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from apps.auth.authentication import invalidate_token, invalidate_user
+
+
+@receiver(post_delete, sender=Token, dispatch_uid="invalidate_deleted_token")
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User, dispatch_uid="invalidate_saved_user")
+def invalidate_saved_user(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    keys = Token.objects.filter(user=instance).values_list("key", flat=True)
+    invalidate_user(instance.pk, keys)
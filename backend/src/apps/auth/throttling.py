@@ -0,0 +1,234 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class Window:
+    """Where ``now`` falls in the fixed windows of ``duration`` seconds."""
+
+    __slots__ = ("index", "elapsed", "remaining", "weight")
+
+    def __init__(self, duration, now):
+        index, self.elapsed = divmod(now, duration)
+        self.index = int(index)
+        self.remaining = duration - self.elapsed
+        # Share of the previous window still inside the sliding window.
+        self.weight = self.remaining / duration
+
+
+class ClientState:
+    """What one process knows about one client in one scope."""
+
+    __slots__ = ("window", "previous", "tokens", "blocked_until")
+
+    def __init__(self):
+        self.window = None
+        self.previous = 0
+        self.tokens = 0
+        self.blocked_until = 0.0
+
+
+class ThrottleStore:
+    """Bounded in-process LRU of ``ClientState`` by ``(scope, ident)``."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self._states = OrderedDict()
+
+    def get(self, key):
+        """The state of ``key``, created if missing; call with ``lock`` held."""
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = ClientState()
+            while len(self._states) > self.max_size:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(key)
+        return state
+
+    def clear(self):
+        with self.lock:
+            self._states.clear()
+
+
+_throttle_store = None
+_throttle_store_lock = threading.Lock()
+
+
+def get_throttle_store():
+    global _throttle_store
+    if _throttle_store is None:
+        with _throttle_store_lock:
+            if _throttle_store is None:
+                _throttle_store = ThrottleStore(settings.THROTTLE["MAX_CLIENTS"])
+    return _throttle_store
+
+
+class LeasedRateThrottle(BaseThrottle):
+    """
+    Sliding-window rate limit per user (per IP when anonymous) and scope.
+
+    The scope is the view's ``throttle_scope``, else ``list`` for safe
+    methods and ``write`` for the others; rates come from
+    ``DEFAULT_THROTTLE_RATES``. Requests are counted in fixed windows in the
+    ``THROTTLE["CACHE_ALIAS"]`` cache, and the current window plus the
+    overlapping share of the previous one must stay within the rate.
+
+    To skip the cache on most requests, a process takes a lease of
+    ``THROTTLE["LEASE_FRACTION"]`` of the rate with one ``incr`` and spends
+    it locally. Unspent leases count as used, so with several processes a
+    client may be limited slightly early, never late. A throttled client is
+    rejected in-process until its ``Retry-After`` is up.
+    """
+
+    cache_format = "throttle:{scope}:{ident}:{window}"
+
+    def __init__(self):
+        self.wait_time = None
+
+    def allow_request(self, request, view):
+        check = self.start(request, view)
+        if isinstance(check, bool):
+            return check
+        key, window, state = check
+
+        previous = state.previous
+        if state.window != window.index:
+            previous = self.cache.get(self.get_cache_key(key, window.index - 1), 0)
+        current = self.claim(self.get_cache_key(key, window.index))
+        return self.finish(window, state, previous, current)
+
+    async def aallow_request(self, request, view):
+        check = self.start(request, view)
+        if isinstance(check, bool):
+            return check
+        key, window, state = check
+
+        previous = state.previous
+        if state.window != window.index:
+            previous = await self.cache.aget(
+                self.get_cache_key(key, window.index - 1), 0
+            )
+        current = await self.aclaim(self.get_cache_key(key, window.index))
+        return self.finish(window, state, previous, current)
+
+    def wait(self):
+        return self.wait_time
+
+    @property
+    def cache(self):
+        return caches[settings.THROTTLE["CACHE_ALIAS"]]
+
+    def get_scope(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if scope:
+            return scope
+        return "list" if request.method in SAFE_METHODS else "write"
+
+    def get_client_ident(self, request):
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def get_cache_key(self, key, window):
+        scope, ident = key
+        return self.cache_format.format(scope=scope, ident=ident, window=window)
+
+    def start(self, request, view):
+        """
+        Decide in-process if possible.
+
+        Returns the decision when there is no rate for the scope or the local
+        state decides, and ``(key, window, state)`` when the cache must be
+        asked.
+        """
+        scope = self.get_scope(request, view)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+        if rate is None:
+            return True
+        self.limit, self.duration = self.parse_rate(rate)
+        self.lease = max(1, int(self.limit * settings.THROTTLE["LEASE_FRACTION"]))
+        self.now = time.time()
+
+        key = (scope, self.get_client_ident(request))
+        window = Window(self.duration, self.now)
+        store = get_throttle_store()
+        with store.lock:
+            state = store.get(key)
+            if state.blocked_until > self.now:
+                self.wait_time = state.blocked_until - self.now
+                return False
+            if state.window == window.index and state.tokens > 0:
+                state.tokens -= 1
+                return True
+        return key, window, state
+
+    def claim(self, key):
+        """Add a lease to the shared counter of ``key``, return the new count."""
+        self.cache.add(key, 0, self.duration * 2)
+        try:
+            return self.cache.incr(key, self.lease)
+        except ValueError:
+            # Evicted between add and incr.
+            self.cache.set(key, self.lease, self.duration * 2)
+            return self.lease
+
+    async def aclaim(self, key):
+        await self.cache.aadd(key, 0, self.duration * 2)
+        try:
+            return await self.cache.aincr(key, self.lease)
+        except ValueError:
+            await self.cache.aset(key, self.lease, self.duration * 2)
+            return self.lease
+
+    def finish(self, window, state, previous, current):
+        used = previous * window.weight + current - self.lease
+        granted = int(min(self.lease, self.limit - used))
+        with get_throttle_store().lock:
+            if state.window != window.index:
+                state.window, state.previous, state.tokens = window.index, previous, 0
+            if granted >= 1:
+                state.tokens += granted - 1
+                return True
+            self.wait_time = self.get_wait(window, previous, current)
+            state.blocked_until = self.now + self.wait_time
+            return False
+
+    def get_wait(self, window, previous, current):
+        """Seconds until the sliding count leaves room for one request."""
+        room = self.limit - 1
+        if current <= room and previous:
+            # The previous window slides out far enough during this one.
+            fade = self.duration * (1 - (room - current) / previous)
+            return max(fade - window.elapsed, 1.0)
+        # This window must slide out far enough once it is the previous one.
+        fade = self.duration * (1 - room / max(current, 1))
+        return window.remaining + max(fade, 0.0)
+
+    def parse_rate(self, rate):
+        """``"100/min"`` as ``(100, 60)``, like ``SimpleRateThrottle``."""
+        num, period = rate.split("/")
+        duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+        return int(num), duration
+
+
+async def acheck_throttles(view, request):
+    """``APIView.check_throttles`` awaiting throttles that support it."""
+    durations = []
+    for throttle in view.get_throttles():
+        if hasattr(throttle, "aallow_request"):
+            allowed = await throttle.aallow_request(request, view)
+        else:
+            allowed = throttle.allow_request(request, view)
+        if not allowed:
+            durations.append(throttle.wait())
+    if durations:
+        durations = [duration for duration in durations if duration is not None]
+        view.throttled(request, max(durations, default=None))
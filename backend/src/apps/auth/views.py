@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 class AuthViewSet(viewsets.ViewSet):
     permission_classes = [AllowAny]
+    throttle_scope = "auth"
 
     def get_permissions(self):
         if self.action == "logout":
@@ -1,6 +1,27 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class TicketsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tickets"
+
+    def ready(self):
+        from apps.tickets import checks  # noqa: F401
+        from apps.tickets.models import Ticket
+        from apps.tickets.signals import (
+            count_deleted_ticket,
+            install_search_index,
+            invalidate_ticket_cache,
+            publish_deleted_ticket,
+            publish_saved_ticket,
+            track_ticket_status,
+        )
+
+        post_migrate.connect(install_search_index, sender=self)
+        post_save.connect(invalidate_ticket_cache, sender=Ticket)
+        post_delete.connect(invalidate_ticket_cache, sender=Ticket)
+        post_save.connect(track_ticket_status, sender=Ticket)
+        post_delete.connect(count_deleted_ticket, sender=Ticket)
+        post_save.connect(publish_saved_ticket, sender=Ticket)
+        post_delete.connect(publish_deleted_ticket, sender=Ticket)
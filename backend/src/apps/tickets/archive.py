@@ -0,0 +1,90 @@
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from apps.tickets.cache import bump_generation
+from apps.tickets.enums import TicketStatus
+from apps.tickets.feed import DELETED, publish_tickets
+from apps.tickets.models import ArchivedTicket, Ticket, TicketTombstone
+
+INCLUDE_ARCHIVED_PARAM = "include_archived"
+ARCHIVED_FIELDS = (
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+def include_archived(request):
+    """Whether the request asked for archived tickets as well."""
+    value = request.GET.get(INCLUDE_ARCHIVED_PARAM, "")
+    return value.strip().lower() in ("1", "true")
+
+
+def archive_batch(before, batch_size, using=DEFAULT_DB_ALIAS):
+    """
+    Move up to ``batch_size`` tickets closed before ``before`` to the archive.
+
+    The rows are locked (skipping rows locked by a writer, where supported),
+    copied and deleted in one short transaction. The delete skips the ticket
+    signals: archiving is not a deletion, the counters and history stay as
+    they are. The tickets do leave the default list, so syncing clients get a
+    tombstone for each and open event streams a ``deleted`` event. Returns
+    the number of tickets moved.
+    """
+    with transaction.atomic(using=using):
+        rows = list(
+            Ticket.objects.using(using)
+            .select_for_update(skip_locked=True)
+            .filter(status=TicketStatus.CLOSED, updated_at__lt=before)
+            .order_by("updated_at")
+            .values(*ARCHIVED_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+        now = timezone.now()
+        ArchivedTicket.objects.using(using).bulk_create(
+            [ArchivedTicket(**row, archived_at=now) for row in rows]
+        )
+        delete_closed(using, [row["id"] for row in rows])
+        TicketTombstone.objects.using(using).bulk_create(
+            [
+                TicketTombstone(
+                    ticket_id=row["id"], user_id=row["user_id"], deleted_at=now
+                )
+                for row in rows
+            ]
+        )
+        for user_id in {row["user_id"] for row in rows}:
+            bump_generation(user_id)
+        publish_tickets(
+            [Ticket(id=row["id"], user_id=row["user_id"]) for row in rows],
+            DELETED,
+            using=using,
+        )
+    return len(rows)
+
+
+def delete_closed(using, ids):
+    """Delete the closed tickets of ``ids`` with one plain DELETE."""
+    connection = connections[using]
+    pk = Ticket._meta.pk
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(Ticket._meta.db_table)} "
+            f"WHERE {connection.ops.quote_name(pk.column)} "
+            f"IN ({', '.join(['%s'] * len(ids))}) AND status = %s",
+            [pk.get_db_prep_value(id, connection) for id in ids]
+            + [TicketStatus.CLOSED],
+        )
+
+
+def archive_tickets(before, batch_size=1000, using=DEFAULT_DB_ALIAS):
+    """Archive every ticket closed before ``before``, one batch at a time."""
+    archived = 0
+    while moved := archive_batch(before, batch_size, using=using):
+        archived += moved
+    return archived
@@ -0,0 +1,254 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.auth.throttling import acheck_throttles
+from apps.tickets.archive import include_archived
+from apps.tickets.cache import TicketResponseCache
+from apps.tickets.conditional import (
+    aget_list_validators,
+    get_detail_validators,
+    get_not_modified_response,
+    set_validators,
+)
+from apps.tickets.feed import get_broker, stream_events
+from apps.tickets.models import Ticket
+from apps.tickets.representation import get_values_representation
+from apps.tickets.views import TicketViewSet
+from utils.db.routers import ause_replica
+
+
+class ResolvedAuthentication:
+    """Hand a result computed by an async authenticator to a DRF ``Request``."""
+
+    def __init__(self, authenticator, result):
+        self.authenticator = authenticator
+        self.result = result
+
+    def authenticate(self, request):
+        return self.result
+
+    def authenticate_header(self, request):
+        return self.authenticator.authenticate_header(request)
+
+
+async def aauthenticate(request, authenticators):
+    """
+    Run the authenticators the way ``Request`` would, off the event loop.
+
+    Authenticators with an ``aauthenticate`` coroutine are awaited, others
+    run in the thread pool.
+    """
+    resolved = []
+    for authenticator in authenticators:
+        if hasattr(authenticator, "aauthenticate"):
+            result = await authenticator.aauthenticate(request)
+        else:
+            result = await sync_to_async(authenticator.authenticate)(request)
+        resolved.append(ResolvedAuthentication(authenticator, result))
+        if result is not None:
+            break
+    return resolved
+
+
+class AsyncTicketView(View):
+    """
+    Native async versions of the hot ``TicketViewSet`` actions.
+
+    The view runs the same negotiation, authentication, permission, filter,
+    pagination and exception handling code as the viewset, but awaits the
+    database and cache calls, so a worker keeps serving other requests while
+    one waits on a slow client or query. Methods without an async action,
+    non-JSON requests (the browsable API) and reads of archived tickets go to
+    the regular viewset in a worker thread.
+    """
+
+    view_is_async = True
+    actions = {}
+
+    @classmethod
+    def get_sync_view(cls):
+        if "sync_view" not in cls.__dict__:
+            cls.sync_view = TicketViewSet.as_view(cls.actions)
+        return cls.sync_view
+
+    @classmethod
+    def get_action_map(cls):
+        # HEAD is served by the GET action, as on the viewset.
+        if "get" in cls.actions and "head" not in cls.actions:
+            return {**cls.actions, "head": cls.actions["get"]}
+        return cls.actions
+
+    async def dispatch(self, request, *args, **kwargs):
+        action = self.get_action_map().get(request.method.lower())
+        handler = getattr(self, action, None) if action else None
+        if handler is None or include_archived(request):
+            return await self.delegate(request, *args, **kwargs)
+
+        view = self.get_viewset(request, action, args, kwargs)
+        request = view.initialize_request(request, *args, **kwargs)
+        view.request = request
+        view.headers = view.default_response_headers
+        try:
+            renderer, media_type = view.perform_content_negotiation(request)
+            if renderer.format != "json":
+                return await self.delegate(request._request, *args, **kwargs)
+            request.accepted_renderer = renderer
+            request.accepted_media_type = media_type
+            version, scheme = view.determine_version(request, *args, **kwargs)
+            request.version, request.versioning_scheme = version, scheme
+
+            request.authenticators = await aauthenticate(
+                request, request.authenticators
+            )
+            view.check_permissions(request)
+            await acheck_throttles(view, request)
+            if action in view.replica_actions:
+                await ause_replica(request.user.pk)
+            response = await handler(view, request, **kwargs)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        return self.render(view, request, response, *args, **kwargs)
+
+    async def delegate(self, request, *args, **kwargs):
+        return await sync_to_async(self.get_sync_view())(request, *args, **kwargs)
+
+    def get_viewset(self, request, action, args, kwargs):
+        """Set up a ``TicketViewSet`` the way its ``as_view`` closure does."""
+        view = TicketViewSet()
+        view.action_map = self.get_action_map()
+        for method, name in view.action_map.items():
+            # Async-only actions, like the event stream, have no sync handler.
+            if hasattr(view, name):
+                setattr(view, method, getattr(view, name))
+        view.action = action
+        view.request = request
+        view.args = args
+        view.kwargs = kwargs
+        view.format_kwarg = view.get_format_suffix(**kwargs)
+        return view
+
+    @staticmethod
+    def render(view, request, response, *args, **kwargs):
+        response = view.finalize_response(request, response, *args, **kwargs)
+        if isinstance(response, Response) and not response.is_rendered:
+            response.render()
+        return response
+
+    async def options(self, request, *args, **kwargs):
+        return await self.delegate(request, *args, **kwargs)
+
+
+class TicketListAsyncView(AsyncTicketView):
+    actions = {"get": "list", "post": "create"}
+
+    async def list(self, view, request):
+        cache = TicketResponseCache(request)
+        response = await cache.aget()
+        if response is not None:
+            return response
+
+        etag, last_modified = await aget_list_validators(request, view.get_queryset())
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return set_validators(response, etag, last_modified)
+
+        representation = get_values_representation(view.get_serializer_class())
+        queryset = view.get_values_queryset(representation)
+        page = await view.paginator.apaginate_queryset(queryset, request, view)
+        response = view.get_paginated_response(representation.many(page))
+
+        response = self.render(
+            view, request, set_validators(response, etag, last_modified)
+        )
+        await cache.aset(response, etag, last_modified)
+        return response
+
+    async def create(self, view, request):
+        serializer = view.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # The sync save: the ticket and the work of its post_save receivers
+        # (counters, history, cache generation, feed) commit together.
+        await sync_to_async(view.perform_create)(serializer)
+
+        headers = view.get_success_headers(serializer.data)
+        return Response(
+            serializer.data, status=status.HTTP_201_CREATED, headers=headers
+        )
+
+
+class TicketDetailAsyncView(AsyncTicketView):
+    actions = {
+        "get": "retrieve",
+        "put": "update",
+        "patch": "partial_update",
+        "delete": "destroy",
+    }
+
+    async def retrieve(self, view, request, pk):
+        cache = TicketResponseCache(request)
+        response = await cache.aget()
+        if response is not None:
+            return response
+
+        queryset = view.filter_queryset(view.get_queryset())
+        try:
+            instance = await queryset.aget(pk=pk)
+        except (Ticket.DoesNotExist, DjangoValidationError, ValueError, TypeError):
+            raise Http404
+        view.check_object_permissions(request, instance)
+
+        etag, last_modified = get_detail_validators(request, instance)
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return set_validators(response, etag, last_modified)
+
+        response = Response(view.get_serializer(instance).data)
+        response = self.render(
+            view, request, set_validators(response, etag, last_modified)
+        )
+        await cache.aset(response, etag, last_modified)
+        return response
+
+
+class TicketEventStreamView(AsyncTicketView):
+    """
+    Server-sent events for every change to the user's tickets.
+
+    Events are ``created`` and ``updated`` with the ticket, ``deleted`` with
+    its id, and ``reset`` when the client missed events and must refetch.
+    Reconnecting clients resume after their ``Last-Event-ID`` header (or the
+    ``last_event_id`` query parameter). Only routed under ASGI, where an
+    open stream costs no thread.
+    """
+
+    actions = {"get": "events"}
+
+    @classmethod
+    def get_action_map(cls):
+        # No HEAD, the stream never ends.
+        return cls.actions
+
+    async def events(self, view, request):
+        last_event_id = request.headers.get(
+            "Last-Event-ID"
+        ) or request.query_params.get("last_event_id")
+        subscription = await get_broker().subscribe(request.user.pk, last_event_id)
+        scope = getattr(request._request, "scope", {})
+        response = StreamingHttpResponse(
+            stream_events(subscription, scope.get("disconnected")),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # Keep nginx from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def options(self, request, *args, **kwargs):
+        response = HttpResponse()
+        response["Allow"] = "GET, OPTIONS"
+        return response
@@ -0,0 +1,161 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from apps.tickets.cache import bump_generation
+from apps.tickets.counters import change_counts, count_tickets
+from apps.tickets.enums import get_transition_sources
+from apps.tickets.feed import CREATED, UPDATED, publish_tickets
+from apps.tickets.history import new_status_event, record_status_events
+from apps.tickets.models import Ticket, TicketStatusEvent
+from apps.tickets.serializers import (
+    TITLE_EXISTS_MESSAGE,
+    TicketCreateSerializer,
+    get_transition_error,
+    title_conflict_as_validation_error,
+)
+
+
+CHANGED_MESSAGE = "The ticket was changed by another request."
+
+
+def bulk_create_tickets(items, context):
+    """
+    Validate and insert many tickets for the requesting user.
+
+    Every item is validated on its own, title collisions with existing tickets
+    are found with one query, and the valid items are inserted with
+    ``bulk_create`` in ``TICKET_BULK_CREATE_BATCH_SIZE`` chunks inside one
+    transaction. Returns one result per item, in payload order.
+    """
+    user = context["request"].user
+    results = [None] * len(items)
+    valid = []
+
+    for index, item in enumerate(items):
+        serializer = TicketCreateSerializer(data=item, context=context)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            results[index] = {"index": index, "errors": serializer.errors}
+
+    titles = {data["title"] for _, data in valid}
+    taken = set(
+        Ticket.objects.filter(user=user, title__in=titles).values_list(
+            "title", flat=True
+        )
+    )
+
+    tickets = []
+    for index, data in valid:
+        if data["title"] in taken:
+            results[index] = {
+                "index": index,
+                "errors": {"title": [TITLE_EXISTS_MESSAGE]},
+            }
+            continue
+        taken.add(data["title"])
+        tickets.append((index, Ticket(**data)))
+
+    with title_conflict_as_validation_error():
+        Ticket.objects.bulk_create(
+            [ticket for _, ticket in tickets],
+            batch_size=settings.TICKET_BULK_CREATE_BATCH_SIZE,
+        )
+        count_tickets(ticket for _, ticket in tickets)
+        record_status_events([new_status_event(ticket) for _, ticket in tickets])
+        publish_tickets([ticket for _, ticket in tickets], CREATED)
+    if tickets:
+        bump_generation(user.pk)
+
+    for index, ticket in tickets:
+        data = TicketCreateSerializer(ticket, context=context).data
+        results[index] = {"index": index, "ticket": data}
+    return results
+
+
+def get_current_statuses(user, ids):
+    """The status of each of the user's tickets in ``ids``, row locked."""
+    return dict(
+        Ticket.objects.select_for_update()
+        .filter(user=user, id__in=ids)
+        .values_list("id", "status")
+    )
+
+
+def update_status(user, ids, source, target, now):
+    """
+    Move the user's tickets of ``ids`` still in ``source`` to ``target``.
+
+    Returns the ids the UPDATE changed, from ``RETURNING``, so the caller
+    knows the previous status of every row moved even when the earlier read
+    was not locked (SQLite has no ``SELECT ... FOR UPDATE``).
+    """
+    connection = connections[router.db_for_write(Ticket)]
+    quote = connection.ops.quote_name
+    pk = Ticket._meta.pk
+    stamp = Ticket._meta.get_field("updated_at").get_db_prep_value(now, connection)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(Ticket._meta.db_table)} "
+            "SET status = %s, updated_at = %s, changed_at = %s "
+            "WHERE user_id = %s AND status = %s "
+            f"AND {quote(pk.column)} IN ({', '.join(['%s'] * len(ids))}) "
+            f"RETURNING {quote(pk.column)}",
+            [target, stamp, stamp, user.pk, source]
+            + [pk.get_db_prep_value(id, connection) for id in ids],
+        )
+        return {pk.to_python(id) for (id,) in cursor.fetchall()}
+
+
+def bulk_transition_tickets(user, ids, target):
+    """
+    Move the user's tickets to ``target`` with one UPDATE per source status.
+
+    The current statuses are read once, under a row lock where the database
+    supports it, so skipped ids can be reported with the reason. Each UPDATE
+    only matches rows still in its source status, and the counters, history
+    and events follow the rows it returned, so a ticket changed in between
+    is neither moved from a wrong status nor counted twice.
+    Returns ``(updated_ids, skipped)``.
+    """
+    sources = get_transition_sources(target)
+    with transaction.atomic():
+        current = get_current_statuses(user, ids)
+        previous = {}
+        now = timezone.now()
+        for source in sorted(sources):
+            candidates = [pk for pk in ids if current.get(pk) == source]
+            if candidates:
+                for pk in update_status(user, candidates, source, target, now):
+                    previous[pk] = source
+        updated = [pk for pk in ids if pk in previous]
+        if updated:
+            changes = Counter({target: len(updated)})
+            changes.subtract(previous.values())
+            change_counts(user.pk, changes)
+            record_status_events(
+                [
+                    TicketStatusEvent(
+                        ticket_id=pk,
+                        user_id=user.pk,
+                        previous_status=previous[pk],
+                        status=target,
+                        created_at=now,
+                    )
+                    for pk in updated
+                ]
+            )
+            publish_tickets(Ticket.objects.filter(id__in=updated), UPDATED)
+            bump_generation(user.pk)
+
+    skipped = []
+    for pk in ids:
+        if pk not in current:
+            skipped.append({"id": pk, "errors": ["Not found."]})
+        elif pk not in previous:
+            error = get_transition_error(current[pk], target) or CHANGED_MESSAGE
+            skipped.append({"id": pk, "status": current[pk], "errors": [error]})
+    return updated, skipped
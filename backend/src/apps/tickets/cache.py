@@ -0,0 +1,120 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+
+from apps.tickets.conditional import get_not_modified_response, set_validators
+
+
+def get_cache():
+    return caches[settings.TICKET_CACHE_ALIAS]
+
+
+def get_generation_key(user_id):
+    return f"tickets:generation:{user_id}"
+
+
+def new_generation():
+    # A fresh random value rather than an increment: concurrent bumps can
+    # never land on the same value, and a generation lost to eviction can
+    # never come back and revive old entries.
+    return os.urandom(8).hex()
+
+
+def get_generation(user_id):
+    cache = get_cache()
+    key = get_generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, new_generation(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+async def aget_generation(user_id):
+    cache = get_cache()
+    key = get_generation_key(user_id)
+    generation = await cache.aget(key)
+    if generation is None:
+        await cache.aadd(key, new_generation(), timeout=None)
+        generation = await cache.aget(key)
+    return generation
+
+
+def bump_generation(user_id):
+    """
+    Invalidate every cached ticket response of the user in O(1).
+
+    The generation changes right away and once more after commit, so a reader
+    that cached pre-commit rows in between is invalidated as well.
+    """
+    key = get_generation_key(user_id)
+    get_cache().set(key, new_generation(), timeout=None)
+    transaction.on_commit(lambda: get_cache().set(key, new_generation(), timeout=None))
+
+
+class TicketResponseCache:
+    """
+    Rendered ticket responses keyed by user, generation and request.
+
+    Only JSON responses are cached. A hit is served, or answered with 304,
+    without touching the database or the serializer.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.enabled = request.accepted_renderer.format == "json"
+
+    def get_key(self, generation):
+        user_id = self.request.user.pk
+        request_key = (
+            f"{self.request.get_full_path()}|{self.request.accepted_media_type}"
+        )
+        digest = hashlib.md5(request_key.encode()).hexdigest()
+        return f"tickets:response:{user_id}:{generation}:{digest}"
+
+    def get(self):
+        if not self.enabled:
+            return None
+        self.key = self.get_key(get_generation(self.request.user.pk))
+        return self.get_response(get_cache().get(self.key))
+
+    async def aget(self):
+        if not self.enabled:
+            return None
+        self.key = self.get_key(await aget_generation(self.request.user.pk))
+        return self.get_response(await get_cache().aget(self.key))
+
+    def get_response(self, entry):
+        if entry is None:
+            return None
+        etag, last_modified, content, content_type = entry
+        response = get_not_modified_response(self.request, etag, last_modified)
+        if response is None:
+            response = HttpResponse(content, content_type=content_type)
+        return set_validators(response, etag, last_modified)
+
+    def set(self, response, etag, last_modified):
+        """Store ``response`` once it is rendered."""
+        if not self.enabled or response.status_code != 200:
+            return
+
+        def store(rendered):
+            entry = self.get_entry(rendered, etag, last_modified)
+            get_cache().set(self.key, entry, settings.TICKET_CACHE_TIMEOUT)
+
+        response.add_post_render_callback(store)
+
+    async def aset(self, response, etag, last_modified):
+        """Store an already rendered ``response``."""
+        if not self.enabled or response.status_code != 200:
+            return
+        entry = self.get_entry(response, etag, last_modified)
+        await get_cache().aset(self.key, entry, settings.TICKET_CACHE_TIMEOUT)
+
+    @staticmethod
+    def get_entry(response, etag, last_modified):
+        return (etag, last_modified, response.content, response["Content-Type"])
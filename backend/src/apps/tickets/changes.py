@@ -0,0 +1,155 @@
+import base64
+import binascii
+import datetime
+import json
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound
+
+from apps.tickets.models import Ticket, TicketTombstone
+from apps.tickets.representation import get_values_representation
+from apps.tickets.serializers import TicketDetailSerializer
+
+# Sorts before every ticket id of the same instant.
+MIN_ID = uuid.UUID(int=0)
+INVALID_CURSOR_MESSAGE = "Invalid cursor"
+
+
+class CursorExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "Cursor expired, download the full ticket list again."
+    default_code = "cursor_expired"
+
+
+def encode_cursor(position):
+    moment, ticket_id = position
+    raw = json.dumps([moment.isoformat(), str(ticket_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(encoded):
+    """
+    The ``(moment, ticket_id)`` position of a changes cursor.
+
+    Cursors older than the tombstone retention are refused: deletions after
+    them may already be compacted away.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        moment, ticket_id = json.loads(raw)
+        moment = datetime.datetime.fromisoformat(moment)
+        ticket_id = uuid.UUID(ticket_id)
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise NotFound(INVALID_CURSOR_MESSAGE)
+    if timezone.is_naive(moment):
+        raise NotFound(INVALID_CURSOR_MESSAGE)
+    if moment < get_retention_start():
+        raise CursorExpired()
+    return moment, ticket_id
+
+
+def get_retention_start():
+    return timezone.now() - datetime.timedelta(
+        days=settings.TICKET_TOMBSTONE_RETENTION_DAYS
+    )
+
+
+def get_settled_position():
+    """
+    The newest position no commit in flight can still land before.
+
+    ``changed_at`` is stamped before the transaction commits, so a row may
+    become visible with an older timestamp than rows already served. Pages
+    stop ``TICKET_CHANGES_SETTLE_SECONDS`` short of now, and the changes of
+    that window are served once it has passed instead of being missed.
+    """
+    settle = datetime.timedelta(seconds=settings.TICKET_CHANGES_SETTLE_SECONDS)
+    return timezone.now() - settle, MIN_ID
+
+
+def after(position, moment_field, id_field):
+    moment, ticket_id = position
+    return Q(**{f"{moment_field}__gt": moment}) | Q(
+        **{moment_field: moment, f"{id_field}__gt": ticket_id}
+    )
+
+
+def get_changes(user, position, limit):
+    """
+    Tickets changed and tickets deleted after ``position``, oldest first.
+
+    Tickets are ordered by ``changed_at``, stamped by every write, so imported
+    tickets show up even with an old ``updated_at``. Both are range scans on a
+    ``(user, moment, id)`` index up to the settled position, merged and cut to
+    ``limit``. Returns the page as ``(tickets, deleted, cursor, has_more)``;
+    follow ``cursor`` while ``has_more``.
+    """
+    settled = get_settled_position()
+    representation = get_values_representation(TicketDetailSerializer)
+    tickets = representation.values(
+        Ticket.objects.filter(user=user, changed_at__lt=settled[0])
+        .filter(after(position, "changed_at", "id"))
+        .order_by("changed_at", "id"),
+        "changed_at",
+    )[: limit + 1]
+    tombstones = (
+        TicketTombstone.objects.filter(user=user, deleted_at__lt=settled[0])
+        .filter(after(position, "deleted_at", "ticket_id"))
+        .order_by("deleted_at", "ticket_id")
+        .values_list("deleted_at", "ticket_id")
+    )[: limit + 1]
+
+    changes = sorted(
+        [((row["changed_at"], row["id"]), row) for row in tickets]
+        + [((deleted_at, pk), None) for deleted_at, pk in tombstones],
+        key=lambda change: change[0],
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    # Never past the settled position, where commits in flight may land.
+    cursor = changes[-1][0] if has_more else max(position, settled)
+
+    page_tickets = representation.many([row for _, row in changes if row])
+    deleted = [
+        {"id": str(pk), "deleted_at": deleted_at}
+        for (deleted_at, pk), row in changes
+        if row is None
+    ]
+    return page_tickets, deleted, encode_cursor(cursor), has_more
+
+
+def delete_ticket(ticket):
+    """Delete ``ticket`` and leave a tombstone for syncing clients."""
+    # ``delete`` clears the primary key.
+    ticket_id, using = ticket.pk, ticket._state.db
+    with transaction.atomic(using=using):
+        ticket.delete()
+        TicketTombstone.objects.using(using).create(
+            ticket_id=ticket_id, user_id=ticket.user_id, deleted_at=timezone.now()
+        )
+
+
+def compact_tombstones(before, batch_size=1000, using=None):
+    """
+    Delete tombstones older than ``before`` in batches of ``batch_size``.
+
+    Each batch is its own short transaction, so compaction never holds locks
+    on the whole table. Returns the number of tombstones deleted.
+    """
+    tombstones = TicketTombstone.objects.db_manager(using)
+    deleted = 0
+    while True:
+        ids = list(
+            tombstones.filter(deleted_at__lt=before)
+            .order_by("deleted_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += tombstones.filter(pk__in=ids).delete()[0]
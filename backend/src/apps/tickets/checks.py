@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def get_shared_cache_users():
+    """What relies on each cache alias being shared by every worker."""
+    users = {}
+    for alias, user in (
+        (settings.TICKET_CACHE_ALIAS, "ticket response cache"),
+        (settings.TOKEN_AUTH_CACHE.get("CACHE_ALIAS"), "token revocations"),
+        ("default", "sticky primary reads"),
+        (settings.THROTTLE["CACHE_ALIAS"], "rate limits"),
+    ):
+        if alias:
+            users.setdefault(alias, []).append(user)
+    return users
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Warn when a process-local cache backs state every worker must see: each
+    worker would serve stale responses, accept revoked tokens and count its
+    own rate limits.
+    """
+    if settings.DEBUG:
+        return []
+    return [
+        checks.Warning(
+            f"The {alias!r} cache is local to each process, but "
+            f"{', '.join(users)} must be shared by all workers.",
+            hint="Set DJANGO_CACHE_BACKEND to file or redis.",
+            id="tickets.W001",
+        )
+        for alias, users in get_shared_cache_users().items()
+        if isinstance(caches[alias], LocMemCache)
+    ]
@@ -0,0 +1,65 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode())
+    return quote_etag(digest.hexdigest())
+
+
+def get_list_validators(request, queryset):
+    """
+    Validators for a list response, from one indexed aggregate.
+
+    Any create, update or delete changes either the row count or the newest
+    ``updated_at``; the full path and media type pin the representation.
+    There is no ``Last-Modified``: the newest ``updated_at`` does not advance
+    when a ticket is deleted, archived or imported with an older stamp.
+    """
+    state = queryset.order_by().aggregate(count=Count("pk"), last=Max("updated_at"))
+    return make_list_validators(request, state)
+
+
+async def aget_list_validators(request, queryset):
+    state = await queryset.order_by().aaggregate(
+        count=Count("pk"), last=Max("updated_at")
+    )
+    return make_list_validators(request, state)
+
+
+def make_list_validators(request, state):
+    etag = make_etag(
+        request.user.pk,
+        state["count"],
+        state["last"].isoformat() if state["last"] else "",
+        request.get_full_path(),
+        request.accepted_media_type,
+    )
+    return etag, None
+
+
+def get_detail_validators(request, instance):
+    etag = make_etag(
+        instance.pk, instance.updated_at.isoformat(), request.accepted_media_type
+    )
+    return etag, instance.updated_at
+
+
+def get_not_modified_response(request, etag, last_modified):
+    """Return a 304 response when the client copy is current, else None."""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_vary_headers(response, ["Authorization"])
+    return response
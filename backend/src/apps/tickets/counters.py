@@ -0,0 +1,94 @@
+from collections import Counter, defaultdict
+
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, transaction
+from django.db.models import Count, F
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import ArchivedTicket, Ticket, TicketStatusCount
+
+
+def change_counts(user_id, changes, using=None):
+    """
+    Add ``changes`` (``{status: delta}``) to the counters of ``user_id``.
+
+    Every counter moves with one ``UPDATE ... SET count = count + delta``, so
+    concurrent writers never lose an update. The row of a status is created
+    on its first increment; statuses are visited in a fixed order so two
+    writers never wait on each other's rows.
+    """
+    manager = TicketStatusCount.objects.db_manager(using)
+    for status, delta in sorted(changes.items()):
+        if not delta:
+            continue
+        counter = manager.filter(user_id=user_id, status=status)
+        if counter.update(count=F("count") + delta) or delta < 0:
+            continue
+        try:
+            with transaction.atomic(using=manager.db):
+                manager.create(user_id=user_id, status=status, count=delta)
+        except IntegrityError:
+            # Created by a concurrent writer in between.
+            counter.update(count=F("count") + delta)
+
+
+def count_tickets(tickets, using=None):
+    """Count newly inserted tickets (objects or row dicts) per user."""
+    changes = defaultdict(Counter)
+    for ticket in tickets:
+        if isinstance(ticket, dict):
+            changes[ticket["user_id"]][ticket["status"]] += 1
+        else:
+            changes[ticket.user_id][ticket.status] += 1
+    for user_id, counts in changes.items():
+        change_counts(user_id, counts, using=using)
+
+
+def get_status_counts(user_id):
+    counts = dict.fromkeys(TicketStatus.values, 0)
+    counts.update(
+        TicketStatusCount.objects.filter(user_id=user_id).values_list("status", "count")
+    )
+    return counts
+
+
+def rebuild_counts(user_ids=None, using=DEFAULT_DB_ALIAS):
+    """
+    Recompute the counters from ``tickets`` and ``tickets_archive``, with one
+    ``GROUP BY`` query each.
+
+    Archiving is not a deletion, archived tickets keep being counted. On
+    Postgres both tables are locked against writes (reads go on) until the
+    new counters are committed, so no change slips in between the count and
+    the swap. Returns the number of counter rows written.
+    """
+    sources = [
+        Ticket.objects.using(using).order_by(),
+        ArchivedTicket.objects.using(using).order_by(),
+    ]
+    counters = TicketStatusCount.objects.using(using)
+    if user_ids is not None:
+        sources = [source.filter(user_id__in=user_ids) for source in sources]
+        counters = counters.filter(user_id__in=user_ids)
+
+    connection = connections[using]
+    with transaction.atomic(using=using):
+        if connection.vendor == "postgresql":
+            tables = ", ".join(
+                connection.ops.quote_name(source.model._meta.db_table)
+                for source in sources
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {tables} IN SHARE MODE")
+        counts = Counter()
+        for source in sources:
+            rows = source.values_list("user_id", "status").annotate(count=Count("pk"))
+            counts.update({(user_id, status): count for user_id, status, count in rows})
+        counters.delete()
+        created = TicketStatusCount.objects.using(using).bulk_create(
+            [
+                TicketStatusCount(user_id=user_id, status=status, count=count)
+                for (user_id, status), count in counts.items()
+            ],
+            batch_size=1000,
+        )
+    return len(created)
@@ -6,3 +6,18 @@ class TicketStatus(models.TextChoices):
     IN_PROGRESS = "in_progress", "In Progress"
     RESOLVED = "resolved", "Resolved"
     CLOSED = "closed", "Closed"
+
+
+STATUS_TRANSITIONS = {
+    TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CLOSED],
+    TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.OPEN],
+    TicketStatus.RESOLVED: [TicketStatus.CLOSED, TicketStatus.IN_PROGRESS],
+    TicketStatus.CLOSED: [],
+}
+
+
+def get_transition_sources(target):
+    """Return the statuses a ticket may move to ``target`` from."""
+    return [
+        source for source, targets in STATUS_TRANSITIONS.items() if target in targets
+    ]
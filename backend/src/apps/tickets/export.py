@@ -0,0 +1,47 @@
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_FIELDS = {
+    "id": "id",
+    "user": "user__username",
+    "title": "title",
+    "description": "description",
+    "status": "status",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+class Echo:
+    """File-like object whose ``write`` hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def get_export_rows(queryset, chunk_size):
+    """Stream plain tuples through a server-side cursor, no model instances."""
+    return queryset.values_list(*EXPORT_FIELDS.values()).iterator(chunk_size=chunk_size)
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS.keys())
+    for row in rows:
+        yield writer.writerow(
+            value.isoformat() if hasattr(value, "isoformat") else value for value in row
+        )
+
+
+def iter_ndjson(rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    columns = list(EXPORT_FIELDS.keys())
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", iter_csv),
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+}
@@ -0,0 +1,298 @@
+import asyncio
+import functools
+import json
+import logging
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.module_loading import import_string
+
+from apps.tickets.serializers import TicketDetailSerializer
+from utils import uuid7
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+# Sent instead of events the client can no longer get: refetch the list.
+RESET = "reset"
+
+
+class Event:
+    __slots__ = ("id", "user_id", "type", "data")
+
+    def __init__(self, user_id, type, data, id=None):
+        # uuid7 strings sort in publication order; "" sends no id.
+        self.id = str(uuid7()) if id is None else id
+        self.user_id = user_id
+        self.type = type
+        self.data = data
+
+    def encode(self):
+        """The event in the ``text/event-stream`` format."""
+        lines = [f"event: {self.type}", f"data: {json.dumps(self.data)}"]
+        if self.id:
+            lines.insert(0, f"id: {self.id}")
+        return "\n".join(lines) + "\n\n"
+
+    def to_json(self):
+        return json.dumps([self.id, self.user_id, self.type, self.data])
+
+    @classmethod
+    def from_json(cls, payload):
+        id, user_id, type, data = json.loads(payload)
+        return cls(user_id, type, data, id=id)
+
+
+class Subscription:
+    """
+    Events of one user for one stream, bounded by ``max_pending``.
+
+    Events are pushed from any thread and read on the event loop. A client
+    that falls ``max_pending`` events behind loses them and gets one
+    ``reset`` event instead, so a slow consumer costs bounded memory and
+    never slows the publishers down.
+    """
+
+    def __init__(self, broker, user_id, max_pending, replay=()):
+        self.broker = broker
+        self.user_id = user_id
+        self.max_pending = max_pending
+        self.loop = asyncio.get_running_loop()
+        self.pending = deque(replay)
+        self.ready = asyncio.Event()
+        self.closed = False
+        if self.pending:
+            self.ready.set()
+
+    def push(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self.append, event)
+        except RuntimeError:
+            # The loop of a finished stream is closed.
+            pass
+
+    def append(self, event):
+        if self.closed:
+            return
+        if len(self.pending) >= self.max_pending:
+            self.pending.clear()
+            event = Event(self.user_id, RESET, {}, id=event.id)
+        self.pending.append(event)
+        self.ready.set()
+
+    def close(self):
+        self.closed = True
+        self.ready.set()
+        self.broker.unsubscribe(self)
+
+    async def get(self, timeout):
+        """Pending events, ``[]`` after ``timeout`` seconds, ``None`` if closed."""
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        if self.closed:
+            return None
+        self.ready.clear()
+        events = list(self.pending)
+        self.pending.clear()
+        return events
+
+
+class BaseBroker:
+    """
+    Pub/sub for ticket change events, fanned out to the streams of a process.
+
+    ``publish`` runs in the writing request with all events of the write and
+    must only deliver committed changes. Every process keeps the last
+    ``TICKET_FEED_HISTORY`` events it delivered, so a reconnecting client
+    resumes from its ``Last-Event-ID`` when that event is still known and
+    gets a ``reset`` otherwise.
+    """
+
+    def __init__(self):
+        self.history = deque(maxlen=settings.TICKET_FEED_HISTORY)
+        self.subscriptions = {}
+        self.lock = threading.Lock()
+
+    def publish(self, events, using=DEFAULT_DB_ALIAS):
+        raise NotImplementedError
+
+    def deliver_all(self, events):
+        for event in events:
+            self.deliver(event)
+
+    def deliver(self, event):
+        with self.lock:
+            self.history.append(event)
+            subscriptions = list(self.subscriptions.get(event.user_id, ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    async def subscribe(self, user_id, last_event_id=None):
+        # Registering and reading the history under one lock leaves no gap
+        # and no duplicate between the replay and the live events.
+        with self.lock:
+            replay = self.get_replay(user_id, last_event_id)
+            subscription = Subscription(
+                self, user_id, settings.TICKET_FEED_MAX_PENDING, replay
+            )
+            self.subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.subscriptions.pop(subscription.user_id, None)
+
+    def get_replay(self, user_id, last_event_id):
+        """
+        The events of ``user_id`` delivered after ``last_event_id``.
+
+        Ids are stamped at publication, before commit, so they do not follow
+        the delivery order: the replay starts after the position of the event
+        in the history, not at the ids greater than it.
+        """
+        if not last_event_id:
+            return []
+        for position, event in enumerate(self.history):
+            if event.id == last_event_id:
+                break
+        else:
+            # Older than anything kept: the client may have missed events.
+            newest = self.history[-1].id if self.history else ""
+            return [Event(user_id, RESET, {}, id=newest)]
+        return [
+            event
+            for event in list(self.history)[position + 1 :]
+            if event.user_id == user_id
+        ]
+
+
+class InProcessBroker(BaseBroker):
+    """Delivers to the streams of the publishing process, on commit."""
+
+    def publish(self, events, using=DEFAULT_DB_ALIAS):
+        events = list(events)
+        transaction.on_commit(lambda: self.deliver_all(events), using=using)
+
+
+class PostgresBroker(BaseBroker):
+    """
+    Fans events out to every process with ``NOTIFY``/``LISTEN``.
+
+    ``pg_notify`` runs in the writing transaction, so Postgres delivers the
+    event on commit and drops it on rollback. Each process listens on one
+    dedicated async connection, opened with the first stream. A batch of
+    events is sent with one statement, not one round trip per event.
+    """
+
+    channel = "ticket_events"
+    reconnect_delay = 1
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+
+    def publish(self, events, using=DEFAULT_DB_ALIAS):
+        payloads = [event.to_json() for event in events]
+        if not payloads:
+            return
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                [self.channel, payloads],
+            )
+
+    async def subscribe(self, user_id, last_event_id=None):
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen())
+        return await super().subscribe(user_id, last_event_id)
+
+    def get_connection_params(self):
+        params = connections[DEFAULT_DB_ALIAS].get_connection_params()
+        for name in ("cursor_factory", "context", "prepare_threshold", "pool"):
+            params.pop(name, None)
+        return params
+
+    async def listen(self):
+        from psycopg import AsyncConnection, OperationalError, sql
+
+        while True:
+            try:
+                async with await AsyncConnection.connect(
+                    **self.get_connection_params(), autocommit=True
+                ) as connection:
+                    await connection.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self.channel))
+                    )
+                    async for notify in connection.notifies():
+                        self.deliver(Event.from_json(notify.payload))
+            except OperationalError:
+                logger.exception("Ticket feed listener lost its connection")
+            # Events sent while not listening are lost, start clients over.
+            self.reset_all()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def reset_all(self):
+        with self.lock:
+            self.history.clear()
+            subscriptions = [s for group in self.subscriptions.values() for s in group]
+        for subscription in subscriptions:
+            subscription.push(Event(subscription.user_id, RESET, {}, id=""))
+
+
+@functools.cache
+def get_broker():
+    return import_string(settings.TICKET_FEED_BROKER)()
+
+
+def ticket_event(ticket, type):
+    if type == DELETED:
+        data = {"id": str(ticket.pk)}
+    else:
+        data = TicketDetailSerializer(ticket).data
+    return Event(ticket.user_id, type, data)
+
+
+def publish_tickets(tickets, type, using=DEFAULT_DB_ALIAS):
+    events = [ticket_event(ticket, type) for ticket in tickets]
+    get_broker().publish(events, using=using)
+
+
+def publish_reset(user_ids, using=DEFAULT_DB_ALIAS):
+    """Tell the streams of ``user_ids`` to refetch, after bulk imports."""
+    events = [Event(user_id, RESET, {}) for user_id in user_ids]
+    get_broker().publish(events, using=using)
+
+
+async def stream_events(subscription, disconnected=None):
+    """
+    Yield ``text/event-stream`` chunks until the client goes away.
+
+    A comment line every ``TICKET_FEED_HEARTBEAT`` seconds keeps proxies from
+    closing an idle stream.
+    """
+    watcher = None
+    if disconnected is not None:
+        watcher = asyncio.ensure_future(disconnected.wait())
+        watcher.add_done_callback(lambda _: subscription.close())
+    try:
+        yield f"retry: {settings.TICKET_FEED_RETRY_MS}\n\n"
+        while (
+            events := await subscription.get(settings.TICKET_FEED_HEARTBEAT)
+        ) is not None:
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            yield "".join(event.encode() for event in events)
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        subscription.close()
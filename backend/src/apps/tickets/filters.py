@@ -0,0 +1,85 @@
+import datetime
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.search import RANK_ALIAS, get_search_backend
+
+
+class TicketFilterBackend(BaseFilterBackend):
+    """Filter tickets by status, created/updated date range and title prefix."""
+
+    date_params = {
+        "created_after": "created_at__gte",
+        "created_before": "created_at__lt",
+        "updated_after": "updated_at__gte",
+        "updated_before": "updated_at__lt",
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        filters = {}
+        errors = {}
+
+        if params.get("status"):
+            statuses = params["status"].split(",")
+            invalid = [value for value in statuses if value not in TicketStatus.values]
+            if invalid:
+                errors["status"] = [f"Invalid status: {', '.join(invalid)}."]
+            else:
+                filters["status__in"] = statuses
+
+        for param, lookup in self.date_params.items():
+            if not params.get(param):
+                continue
+            value = parse_datetime_param(params[param])
+            if value is None:
+                errors[param] = ["Enter a valid date or date/time."]
+            else:
+                filters[lookup] = value
+
+        if params.get("title"):
+            filters["title__startswith"] = params["title"]
+
+        if errors:
+            raise ValidationError(errors)
+        return queryset.filter(**filters)
+
+
+class TicketSearchFilter(BaseFilterBackend):
+    """
+    Full-text search with ``?q=``.
+
+    Results are ranked by relevance unless an explicit ``ordering`` was
+    requested, so this backend must run after ``OrderingFilter``.
+    """
+
+    search_param = "q"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        queryset = get_search_backend().search(queryset, query)
+        if request.query_params.get("ordering"):
+            return queryset
+        return queryset.order_by(f"-{RANK_ALIAS}", "-created_at", "id")
+
+
+def parse_datetime_param(value):
+    """Parse an ISO date or date/time, treating naive values as local time."""
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            if date is None:
+                return None
+            parsed = datetime.datetime.combine(date, datetime.time.min)
+    except ValueError:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
@@ -0,0 +1,130 @@
+import datetime
+
+from django.db import connections
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import TicketStatusEvent
+
+PERCENTILES = (50, 90, 99)
+
+# Seconds from the ``start`` to the ``end`` timestamp column.
+DURATION_SQL = {
+    "postgresql": "EXTRACT(EPOCH FROM {end} - {start})",
+    "sqlite": "(julianday({end}) - julianday({start})) * 86400.0",
+}
+
+
+def new_status_event(ticket, previous_status="", created_at=None):
+    """The event of ``ticket`` (an object or a row dict) entering its status."""
+    if isinstance(ticket, dict):
+        ticket_id, user_id, status = ticket["id"], ticket["user_id"], ticket["status"]
+        created_at = created_at or ticket["created_at"]
+    else:
+        ticket_id, user_id, status = ticket.pk, ticket.user_id, ticket.status
+        created_at = created_at or ticket.updated_at
+    return TicketStatusEvent(
+        ticket_id=ticket_id,
+        user_id=user_id,
+        previous_status=previous_status,
+        status=status,
+        created_at=created_at,
+    )
+
+
+def record_status_events(events, using=None):
+    TicketStatusEvent.objects.db_manager(using).bulk_create(events, batch_size=1000)
+
+
+def get_time_in_status(user_id, since):
+    """
+    Count, mean and percentiles in seconds of the time spent in each status.
+
+    One query pairs every event with the next event of its ticket (``LEAD``),
+    ranks the intervals per status (``ROW_NUMBER``) and aggregates them. The
+    percentiles use the nearest-rank method, so the same SQL runs on SQLite
+    and Postgres. Only intervals that started after ``since`` and have ended
+    are counted; the ``(user, created_at)`` index bounds the scan.
+    """
+    queryset = TicketStatusEvent.objects.all()
+    connection = connections[queryset.db]
+    table = connection.ops.quote_name(TicketStatusEvent._meta.db_table)
+    duration = DURATION_SQL[connection.vendor].format(start="created_at", end="left_at")
+    percentiles = ", ".join(
+        f"MAX(CASE WHEN position = (total * {percentile} + 99) / 100 THEN seconds END)"
+        for percentile in PERCENTILES
+    )
+    sql = f"""
+        SELECT status, COUNT(*), AVG(seconds), {percentiles}
+        FROM (
+            SELECT
+                status,
+                seconds,
+                ROW_NUMBER() OVER (PARTITION BY status ORDER BY seconds) AS position,
+                COUNT(*) OVER (PARTITION BY status) AS total
+            FROM (
+                SELECT status, {duration} AS seconds
+                FROM (
+                    SELECT
+                        status,
+                        created_at,
+                        LEAD(created_at) OVER (
+                            PARTITION BY ticket_id ORDER BY created_at, id
+                        ) AS left_at
+                    FROM {table}
+                    WHERE user_id = %s AND created_at >= %s
+                ) intervals
+                WHERE left_at IS NOT NULL
+            ) durations
+        ) ranked
+        GROUP BY status
+    """
+    params = [user_id, connection.ops.adapt_datetimefield_value(since)]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    stats = {
+        status: {"count": 0, "mean": None, **{f"p{p}": None for p in PERCENTILES}}
+        for status in TicketStatus.values
+    }
+    for status, count, mean, *values in rows:
+        stats[status] = {
+            "count": count,
+            "mean": round(float(mean), 1),
+            **{
+                f"p{percentile}": round(float(value), 1)
+                for percentile, value in zip(PERCENTILES, values)
+            },
+        }
+    return stats
+
+
+def get_throughput(user_id, since):
+    """
+    Tickets that entered each status per day, created tickets count as open.
+
+    Grouped by local day in the database; days without events are listed with
+    zero counts.
+    """
+    rows = (
+        TicketStatusEvent.objects.filter(user_id=user_id, created_at__gte=since)
+        .annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values_list("day", "status")
+        .annotate(count=Count("pk"))
+    )
+    days = {}
+    for day, status, count in rows:
+        days.setdefault(day, dict.fromkeys(TicketStatus.values, 0))[status] = count
+
+    first, last = timezone.localdate(since), timezone.localdate()
+    return [
+        {"date": day, **days.get(day, dict.fromkeys(TicketStatus.values, 0))}
+        for day in (
+            first + datetime.timedelta(days=offset)
+            for offset in range((last - first).days + 1)
+        )
+    ]
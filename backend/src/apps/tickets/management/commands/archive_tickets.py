@@ -0,0 +1,29 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tickets.archive import archive_tickets
+
+
+class Command(BaseCommand):
+    help = (
+        "Move tickets closed more than DAYS days ago from the tickets table to "
+        "the archive, in short batches. Run it daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TICKET_ARCHIVE_AFTER_DAYS,
+            help="Archive tickets closed more than DAYS days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, days, batch_size, database, **options):
+        before = timezone.now() - datetime.timedelta(days=days)
+        archived = archive_tickets(before, batch_size=batch_size, using=database)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tickets"))
@@ -0,0 +1,98 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+
+from utils import uuid7
+
+SCHEMES = {
+    "uuid4": uuid.uuid4,
+    "uuid7": uuid7,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare insert throughput and primary key index size for random "
+        "(uuid4) and time-ordered (uuid7) keys on scratch tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the scratch tables."
+        )
+
+    def handle(self, *args, rows, batch_size, database, keep, **options):
+        connection = connections[database]
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Unsupported database vendor: {connection.vendor}")
+
+        self.stdout.write(f"{rows} rows on {connection.vendor}, batch {batch_size}")
+        for scheme, generate in SCHEMES.items():
+            table = f"benchmark_pk_{scheme}"
+            self.create_table(connection, table)
+            try:
+                elapsed = self.insert_rows(
+                    connection, table, generate, rows, batch_size
+                )
+                index_size = self.get_index_size(connection, table)
+            finally:
+                if not keep:
+                    self.drop_table(connection, table)
+            size = (
+                "unavailable"
+                if index_size is None
+                else f"{index_size / 1024 / 1024:.1f} MiB"
+            )
+            self.stdout.write(
+                f"{scheme}: {rows / elapsed:,.0f} rows/s, "
+                f"{elapsed:.2f}s, pk index {size}"
+            )
+
+    def create_table(self, connection, table):
+        id_type = "uuid" if connection.vendor == "postgresql" else "char(32)"
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(
+                f"CREATE TABLE {table} (id {id_type} PRIMARY KEY, payload text)"
+            )
+
+    def drop_table(self, connection, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+    def insert_rows(self, connection, table, generate, rows, batch_size):
+        adapt = (
+            (lambda value: value)
+            if connection.vendor == "postgresql"
+            else (lambda value: value.hex)
+        )
+        sql = f"INSERT INTO {table} (id, payload) VALUES (%s, %s)"
+        started = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            count = min(batch_size, rows - offset)
+            params = [(adapt(generate()), "x" * 32) for _ in range(count)]
+            with transaction.atomic(using=connection.alias):
+                with connection.cursor() as cursor:
+                    cursor.executemany(sql, params)
+        return time.perf_counter() - started
+
+    def get_index_size(self, connection, table):
+        """The primary key index size in bytes, None if it cannot be read."""
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SELECT pg_relation_size(%s)", [f"{table}_pkey"])
+            else:
+                # dbstat only exists in SQLite built with SQLITE_ENABLE_DBSTAT_VTAB.
+                try:
+                    cursor.execute(
+                        "SELECT SUM(pgsize) FROM dbstat WHERE name = %s",
+                        [f"sqlite_autoindex_{table}_1"],
+                    )
+                except OperationalError:
+                    return None
+            return cursor.fetchone()[0] or 0
@@ -0,0 +1,68 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.tickets.models import Ticket
+from apps.tickets.renderers import TicketJSONRenderer, orjson
+from apps.tickets.representation import get_values_representation
+from apps.tickets.serializers import TicketListSerializer
+from utils import uuid7
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rendering a page of tickets through TicketListSerializer and "
+        "JSONRenderer with the .values() fast path and TicketJSONRenderer. "
+        "Scratch tickets are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, rows, page_size, repeat, **options):
+        with transaction.atomic():
+            user = User.objects.create(username=f"benchmark-{uuid7().hex}")
+            Ticket.objects.bulk_create(
+                (
+                    Ticket(user=user, title=f"Ticket {n}", description="x" * 200)
+                    for n in range(rows)
+                ),
+                batch_size=5000,
+            )
+            queryset = Ticket.objects.filter(user=user).order_by("-created_at", "id")
+            paths = {
+                "serializer": lambda: self.render_serializer(queryset[:page_size]),
+                "values": lambda: self.render_values(queryset[:page_size]),
+            }
+            contents = {name: render() for name, render in paths.items()}
+            if contents["serializer"] != contents["values"]:
+                raise CommandError("The two paths rendered different output.")
+
+            self.stdout.write(
+                f"{rows} rows, page {page_size}, {repeat} pages, "
+                f"orjson {'on' if orjson else 'off'}"
+            )
+            for name, render in paths.items():
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    render()
+                elapsed = (time.perf_counter() - started) / repeat
+                self.stdout.write(
+                    f"{name}: {elapsed * 1000:.2f} ms/page, "
+                    f"{page_size / elapsed:,.0f} rows/s"
+                )
+            transaction.set_rollback(True)
+
+    def render_serializer(self, queryset):
+        data = TicketListSerializer(queryset, many=True).data
+        return JSONRenderer().render({"results": data})
+
+    def render_values(self, queryset):
+        representation = get_values_representation(TicketListSerializer)
+        data = representation.many(representation.values(queryset))
+        return TicketJSONRenderer().render({"results": data})
@@ -0,0 +1,29 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tickets.changes import compact_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the tombstones of deleted tickets older than the retention "
+        "window; sync cursors from before it are refused from then on."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TICKET_TOMBSTONE_RETENTION_DAYS,
+            help="Keep tombstones of the last DAYS days.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, days, batch_size, database, **options):
+        before = timezone.now() - datetime.timedelta(days=days)
+        deleted = compact_tombstones(before, batch_size=batch_size, using=database)
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} ticket tombstones"))
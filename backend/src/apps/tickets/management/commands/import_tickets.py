@@ -0,0 +1,266 @@
+import csv
+import itertools
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from apps.tickets.cache import bump_generation
+from apps.tickets.counters import count_tickets
+from apps.tickets.enums import TicketStatus
+from apps.tickets.feed import publish_reset
+from apps.tickets.history import new_status_event, record_status_events
+from apps.tickets.models import Ticket
+from apps.tickets.serializers import TITLE_EXISTS_MESSAGE, TicketCreateSerializer
+from utils import uuid7
+
+COPY_COLUMNS = [
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "changed_at",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tickets from a CSV or NDJSON file with columns user (username), "
+        "title, description and optional id, status, created_at, updated_at. "
+        "Uses COPY on Postgres and bulk_create elsewhere, committing one batch "
+        "at a time and resuming from the last committed batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--format", choices=["csv", "ndjson"])
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="Checkpoint file, defaults to <path>.checkpoint.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and start from the first row.",
+        )
+        parser.add_argument(
+            "--max-errors",
+            type=int,
+            default=20,
+            help="Number of rejected rows to print.",
+        )
+
+    def handle(self, *args, path, batch_size, database, restart, **options):
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format in ("json", "jsonl"):
+            file_format = "ndjson"
+        if file_format not in ("csv", "ndjson"):
+            raise CommandError("Cannot infer the format, pass --format.")
+
+        self.connection = connections[database]
+        self.max_errors = options["max_errors"]
+        self.validator = TicketCreateSerializer()
+        self.user_ids = {}
+        checkpoint = options["checkpoint"] or path.with_name(f"{path.name}.checkpoint")
+
+        done = 0 if restart else self.read_checkpoint(checkpoint, path)
+        if done:
+            self.stdout.write(f"Resuming after row {done} from {checkpoint}")
+
+        imported = rejected = 0
+        started = time.perf_counter()
+        with path.open(newline="", encoding="utf-8") as handle:
+            records = read_records(handle, file_format)
+            records = itertools.islice(enumerate(records, start=1), done, None)
+            while batch := list(itertools.islice(records, batch_size)):
+                tickets, errors = self.prepare_batch(batch)
+                with transaction.atomic(using=database):
+                    self.insert(tickets)
+                    count_tickets(tickets, using=database)
+                    record_status_events(
+                        [new_status_event(row) for row in tickets], using=database
+                    )
+                    user_ids = {row["user_id"] for row in tickets}
+                    for user_id in user_ids:
+                        bump_generation(user_id)
+                    publish_reset(user_ids, using=database)
+                done = batch[-1][0]
+                self.write_checkpoint(checkpoint, path, done)
+
+                imported += len(tickets)
+                rejected += len(errors)
+                self.report_errors(errors, rejected - len(errors))
+                rate = imported / max(time.perf_counter() - started, 1e-9)
+                self.stdout.write(
+                    f"Row {done}: {imported} imported, {rejected} rejected, "
+                    f"{rate:,.0f} rows/s"
+                )
+
+        checkpoint.unlink(missing_ok=True)
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {imported} tickets, rejected {rejected}")
+        )
+
+    def prepare_batch(self, batch):
+        """Validate one batch, resolving users and title collisions in bulk."""
+        batch = [(n, r if isinstance(r, dict) else {}) for n, r in batch]
+        self.resolve_users({str(record.get("user", "")) for _, record in batch})
+
+        rows, errors = [], []
+        for number, record in batch:
+            try:
+                rows.append((number, self.clean(record)))
+            except serializers.ValidationError as error:
+                errors.append((number, error.detail))
+
+        taken = set(
+            Ticket.objects.using(self.connection.alias)
+            .filter(
+                user_id__in={row["user_id"] for _, row in rows},
+                title__in={row["title"] for _, row in rows},
+            )
+            .values_list("user_id", "title")
+        )
+        tickets = []
+        for number, row in rows:
+            key = (row["user_id"], row["title"])
+            if key in taken:
+                errors.append((number, {"title": [TITLE_EXISTS_MESSAGE]}))
+                continue
+            taken.add(key)
+            tickets.append(row)
+        return tickets, errors
+
+    def resolve_users(self, usernames):
+        missing = usernames - self.user_ids.keys()
+        if not missing:
+            return
+        found = dict(
+            User.objects.using(self.connection.alias)
+            .filter(username__in=missing)
+            .values_list("username", "id")
+        )
+        for username in missing:
+            self.user_ids[username] = found.get(username)
+
+    def clean(self, record):
+        """Apply the TicketCreateSerializer field rules to one record."""
+        errors = {}
+        row = {}
+
+        user_id = self.user_ids.get(str(record.get("user", "")))
+        if user_id is None:
+            errors["user"] = ["Unknown username."]
+        row["user_id"] = user_id
+
+        for name in ("title", "description"):
+            try:
+                value = self.validator.fields[name].run_validation(
+                    record.get(name, serializers.empty)
+                )
+                row[name] = getattr(self.validator, f"validate_{name}")(value)
+            except serializers.ValidationError as error:
+                errors[name] = error.detail
+
+        row["status"] = record.get("status") or TicketStatus.OPEN
+        if row["status"] not in TicketStatus.values:
+            errors["status"] = [f"Invalid status: {row['status']}."]
+
+        try:
+            row["id"] = uuid.UUID(record["id"]) if record.get("id") else uuid7()
+        except (TypeError, ValueError, AttributeError):
+            errors["id"] = ["Must be a valid UUID."]
+
+        now = timezone.now()
+        for name in ("created_at", "updated_at"):
+            value = record.get(name)
+            try:
+                parsed = parse_datetime(value) if isinstance(value, str) else None
+            except ValueError:
+                parsed = None
+            if value and parsed is None:
+                errors[name] = ["Enter a valid date/time."]
+            elif parsed is not None and timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            row[name] = parsed or now
+        # Imported tickets are new to syncing clients, whatever their dates.
+        row["changed_at"] = now
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return row
+
+    def insert(self, tickets):
+        if not tickets:
+            return
+        if self.connection.vendor == "postgresql":
+            self.copy(tickets)
+        else:
+            self.bulk_create(tickets)
+
+    def bulk_create(self, tickets):
+        manager = Ticket.objects.using(self.connection.alias)
+        objs = manager.bulk_create([Ticket(**row) for row in tickets], batch_size=500)
+        # bulk_create stamps auto_now(_add) fields, put the imported values back.
+        for obj, row in zip(objs, tickets):
+            obj.created_at, obj.updated_at = row["created_at"], row["updated_at"]
+        manager.bulk_update(objs, ["created_at", "updated_at"], batch_size=500)
+
+    def copy(self, tickets):
+        """Stream rows with COPY FROM STDIN through the psycopg 3 cursor."""
+        table = self.connection.ops.quote_name(Ticket._meta.db_table)
+        columns = ", ".join(COPY_COLUMNS)
+        with self.connection.cursor() as cursor:
+            with cursor.cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for row in tickets:
+                    copy.write_row([row[column] for column in COPY_COLUMNS])
+
+    def report_errors(self, errors, already_reported):
+        for number, detail in errors[: max(self.max_errors - already_reported, 0)]:
+            self.stderr.write(f"Row {number} rejected: {json.dumps(detail)}")
+
+    def read_checkpoint(self, checkpoint, path):
+        if not checkpoint.exists():
+            return 0
+        state = json.loads(checkpoint.read_text())
+        if state.get("path") != str(path.resolve()):
+            raise CommandError(
+                f"{checkpoint} belongs to {state.get('path')}, pass --restart "
+                "or another --checkpoint."
+            )
+        return int(state["rows"])
+
+    def write_checkpoint(self, checkpoint, path, rows):
+        state = {"path": str(path.resolve()), "rows": rows}
+        temporary = checkpoint.with_name(f"{checkpoint.name}.tmp")
+        temporary.write_text(json.dumps(state))
+        os.replace(temporary, checkpoint)
+
+
+def read_records(handle, file_format):
+    if file_format == "csv":
+        yield from csv.DictReader(handle)
+        return
+    for number, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            raise CommandError(f"Line {number} is not valid JSON: {error}")
@@ -0,0 +1,64 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.tickets.partitioning import (
+    EVENTS_TABLE,
+    add_months,
+    create_month_partition,
+    detach_month_partition,
+    get_month_partitions,
+    get_month_start,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly ticket status event partitions of the coming "
+        "months and detach the ones past the retention. Run it daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=settings.TICKET_EVENT_PARTITIONS_AHEAD,
+            help="Create partitions up to AHEAD months after the current one.",
+        )
+        parser.add_argument(
+            "--retain",
+            type=int,
+            default=settings.TICKET_EVENT_RETENTION_MONTHS,
+            help="Detach partitions older than RETAIN months, 0 keeps all.",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, ahead, retain, database, **options):
+        connection = connections[database]
+        if connection.vendor != "postgresql" or not is_partitioned(
+            connection, EVENTS_TABLE
+        ):
+            raise CommandError(
+                f"{EVENTS_TABLE} is not partitioned, run partition_tickets on a "
+                f"Postgres database first."
+            )
+
+        this_month = get_month_start(datetime.datetime.now(datetime.timezone.utc))
+        existing = set(get_month_partitions(connection))
+        for offset in range(ahead + 1):
+            month = add_months(this_month, offset)
+            if month not in existing:
+                name = create_month_partition(connection, month)
+                self.stdout.write(f"Created {name}")
+
+        if retain:
+            oldest = add_months(this_month, -retain)
+            for month in sorted(existing):
+                if month < oldest:
+                    name = detach_month_partition(connection, month)
+                    self.stdout.write(f"Detached {name}")
+
+        self.stdout.write(self.style.SUCCESS("Ticket partitions are up to date"))
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.tickets.partitioning import (
+    TICKETS_TABLE,
+    is_partitioned,
+    partition_tables,
+    unpartition_tables,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Hash-partition tickets by user and split ticket status events into "
+        "monthly partitions on Postgres, or turn them back into plain tables "
+        "with --undo. Copies both tables under an exclusive lock, run it in a "
+        "maintenance window."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--partitions",
+            type=int,
+            default=settings.TICKET_PARTITIONS,
+            help="Number of hash partitions of tickets.",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=settings.TICKET_EVENT_PARTITIONS_AHEAD,
+            help="Create event partitions up to AHEAD months after the current one.",
+        )
+        parser.add_argument(
+            "--undo",
+            action="store_true",
+            help="Turn the partitioned tables back into plain tables.",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, partitions, ahead, undo, database, **options):
+        connection = connections[database]
+        if connection.vendor != "postgresql":
+            raise CommandError("Ticket partitioning needs a Postgres database.")
+        if partitions < 1:
+            raise CommandError("--partitions must be at least 1.")
+
+        if is_partitioned(connection, TICKETS_TABLE) != undo:
+            state = "not partitioned" if undo else "already partitioned"
+            self.stdout.write(f"{TICKETS_TABLE} is {state}, nothing to do")
+            return
+        with connection.schema_editor() as schema_editor:
+            if undo:
+                unpartition_tables(schema_editor)
+            else:
+                partition_tables(schema_editor, partitions, ahead)
+        done = "Unpartitioned" if undo else "Partitioned"
+        self.stdout.write(self.style.SUCCESS(f"{done} ticket tables"))
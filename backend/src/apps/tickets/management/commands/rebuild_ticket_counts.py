@@ -0,0 +1,31 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.counters import rebuild_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per-user ticket status counters from the tickets and "
+        "the archive, for all users or only the given usernames."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("usernames", nargs="*")
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, usernames, database, **options):
+        user_ids = None
+        if usernames:
+            found = dict(
+                User.objects.using(database)
+                .filter(username__in=usernames)
+                .values_list("username", "id")
+            )
+            missing = sorted(set(usernames) - found.keys())
+            if missing:
+                raise CommandError(f"Unknown users: {', '.join(missing)}")
+            user_ids = list(found.values())
+
+        rows = rebuild_counts(user_ids, using=database)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} ticket counters"))
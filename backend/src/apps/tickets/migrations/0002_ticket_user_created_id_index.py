@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["user", "-created_at", "id"], name="tickets_user_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0002_ticket_user_created_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["user", "status", "-created_at"], name="tickets_user_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                condition=models.Q(("status", "closed"), _negated=True),
+                fields=["user", "-created_at"],
+                name="tickets_user_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["user", "updated_at"], name="tickets_user_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["user", "title"],
+                name="tickets_user_title_idx",
+                opclasses=["int4_ops", "varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+from apps.tickets.search import install_search_backend, uninstall_search_backend
+
+
+def install(apps, schema_editor):
+    install_search_backend(schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_search_backend(schema_editor)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0003_ticket_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:21
+
+from django.db import migrations, models
+import utils.ids
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0004_ticket_search_index"),
+    ]
+
+    # The default is applied in Python, so existing uuid4 ids stay valid and
+    # the column needs no change (SQLite would otherwise rebuild the table).
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="ticket",
+                    name="id",
+                    field=models.UUIDField(
+                        db_column="id",
+                        default=utils.ids.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+            ],
+        ),
+    ]
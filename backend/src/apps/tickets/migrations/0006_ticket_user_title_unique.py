@@ -0,0 +1,51 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:23
+
+from django.db import migrations, models
+
+TITLE_MAX_LENGTH = 30
+
+
+def rename_duplicate_titles(apps, schema_editor):
+    """
+    Suffix repeated titles of a user with " (2)", " (3)", ... so the unique
+    constraint can be added; the oldest ticket keeps its title.
+    """
+    Ticket = apps.get_model("tickets", "Ticket")
+    tickets = Ticket.objects.using(schema_editor.connection.alias)
+    duplicates = (
+        tickets.order_by()
+        .values("user_id", "title")
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        user_tickets = tickets.filter(user_id=duplicate["user_id"])
+        taken = set(user_tickets.values_list("title", flat=True))
+        renamed = user_tickets.filter(title=duplicate["title"]).order_by(
+            "created_at", "id"
+        )[1:]
+        number = 1
+        for ticket in renamed:
+            title = ticket.title
+            while title in taken:
+                number += 1
+                suffix = f" ({number})"
+                title = ticket.title[: TITLE_MAX_LENGTH - len(suffix)] + suffix
+            taken.add(title)
+            tickets.filter(pk=ticket.pk).update(title=title)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0005_ticket_id_uuid7"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_titles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="ticket",
+            constraint=models.UniqueConstraint(
+                fields=("user", "title"), name="tickets_user_title_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:48
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+
+def fill_status_counts(apps, schema_editor):
+    Ticket = apps.get_model("tickets", "Ticket")
+    TicketStatusCount = apps.get_model("tickets", "TicketStatusCount")
+    using = schema_editor.connection.alias
+    rows = (
+        Ticket.objects.using(using)
+        .order_by()
+        .values_list("user_id", "status")
+        .annotate(count=Count("pk"))
+    )
+    TicketStatusCount.objects.using(using).bulk_create(
+        [
+            TicketStatusCount(user_id=user_id, status=status, count=count)
+            for user_id, status, count in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tickets", "0006_ticket_user_title_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketStatusCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_status_counts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ticket status count",
+                "verbose_name_plural": "ticket status counts",
+                "db_table": "ticket_status_counts",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="ticketstatuscount",
+            constraint=models.UniqueConstraint(
+                fields=("user", "status"), name="ticket_status_counts_unique"
+            ),
+        ),
+        migrations.RunPython(fill_status_counts, migrations.RunPython.noop),
+    ]
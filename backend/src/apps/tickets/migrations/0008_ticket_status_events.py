@@ -0,0 +1,87 @@
+# Generated by Django 4.2.23 on 2026-10-18 04:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tickets", "0007_ticket_status_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketStatusEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ticket_id", models.UUIDField()),
+                (
+                    "previous_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_status_events",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ticket status event",
+                "verbose_name_plural": "ticket status events",
+                "db_table": "ticket_status_events",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "created_at"],
+                        name="ticket_events_user_created_idx",
+                    ),
+                    models.Index(
+                        fields=["ticket_id", "created_at"],
+                        name="ticket_events_ticket_idx",
+                    ),
+                ],
+            },
+        ),
+        # Existing tickets start their history in their current status,
+        # entered at their last update.
+        migrations.RunSQL(
+            "INSERT INTO ticket_status_events "
+            "(ticket_id, user_id, previous_status, status, created_at) "
+            "SELECT id, user_id, '', status, updated_at FROM tickets",
+            migrations.RunSQL.noop,
+        ),
+    ]
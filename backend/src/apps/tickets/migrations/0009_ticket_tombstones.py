@@ -0,0 +1,53 @@
+# Generated by Django 4.2.23 on 2026-10-18 05:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tickets", "0008_ticket_status_events"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ticket_id", models.UUIDField()),
+                ("deleted_at", models.DateTimeField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_tombstones",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ticket tombstone",
+                "verbose_name_plural": "ticket tombstones",
+                "db_table": "ticket_tombstones",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "deleted_at", "ticket_id"],
+                        name="ticket_tombstones_user_idx",
+                    ),
+                    models.Index(
+                        fields=["deleted_at"], name="ticket_tombstones_deleted_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
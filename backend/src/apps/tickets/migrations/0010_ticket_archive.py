@@ -0,0 +1,69 @@
+# Generated by Django 4.2.23 on 2026-10-18 05:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tickets", "0009_ticket_tombstones"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTicket",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("title", models.CharField(max_length=30)),
+                ("description", models.TextField(max_length=500)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "archived ticket",
+                "verbose_name_plural": "archived tickets",
+                "db_table": "tickets_archive",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                condition=models.Q(("status", "closed")),
+                fields=["updated_at"],
+                name="tickets_closed_updated_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedticket",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="archived_tickets",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedticket",
+            index=models.Index(
+                fields=["user", "-created_at", "id"], name="tickets_archive_user_idx"
+            ),
+        ),
+    ]
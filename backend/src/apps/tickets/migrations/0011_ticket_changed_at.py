@@ -0,0 +1,37 @@
+# Generated by Django 4.2.23 on 2026-10-18 05:28
+
+from django.db import migrations, models
+
+
+def copy_updated_at(apps, schema_editor):
+    """Start the changes feed where ``updated_at`` left it."""
+    Ticket = apps.get_model("tickets", "Ticket")
+    Ticket.objects.using(schema_editor.connection.alias).update(
+        changed_at=models.F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0010_ticket_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticket",
+            name="changed_at",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="ticket",
+            name="changed_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["user", "changed_at", "id"], name="tickets_user_changed_idx"
+            ),
+        ),
+    ]
@@ -1,20 +1,21 @@
-import uuid
-
 from django.contrib.auth.models import User
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.db.models import Q
 
 from apps.tickets.enums import TicketStatus
-from utils import TimestampedModel
+from utils import TimestampedModel, uuid7
 
 # Create your models here.
 
+TITLE_UNIQUE_CONSTRAINT = "tickets_user_title_unique"
+
 
 class Ticket(TimestampedModel):
     """Model representing a support ticket in the system."""
 
     id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, editable=False, db_column="id"
+        primary_key=True, default=uuid7, editable=False, db_column="id"
     )
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tickets")
@@ -25,11 +26,195 @@ class Ticket(TimestampedModel):
         choices=TicketStatus.choices,
         default=TicketStatus.OPEN,
     )
+    # Position in the changes feed, stamped by every write, including the
+    # bulk ones that keep an imported ``updated_at``.
+    changed_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Ticket {self.id} - {self.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored status, to count a status change once the ticket is saved.
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
     class Meta:
         db_table = "tickets"
         verbose_name = "ticket"
         verbose_name_plural = "tickets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "title"], name=TITLE_UNIQUE_CONSTRAINT
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "id"],
+                name="tickets_user_created_id_idx",
+            ),
+            models.Index(
+                fields=["user", "status", "-created_at"],
+                name="tickets_user_status_idx",
+            ),
+            models.Index(
+                fields=["user", "-created_at"],
+                name="tickets_user_active_idx",
+                condition=~Q(status=TicketStatus.CLOSED),
+            ),
+            models.Index(
+                fields=["user", "updated_at"],
+                name="tickets_user_updated_idx",
+            ),
+            models.Index(
+                fields=["user", "changed_at", "id"],
+                name="tickets_user_changed_idx",
+            ),
+            # Closed tickets waiting for archive_tickets, few at any time.
+            models.Index(
+                fields=["updated_at"],
+                name="tickets_closed_updated_idx",
+                condition=Q(status=TicketStatus.CLOSED),
+            ),
+            # Pattern ops let Postgres serve ``title LIKE 'prefix%'`` from
+            # the index under any collation; other backends ignore them.
+            models.Index(
+                fields=["user", "title"],
+                name="tickets_user_title_idx",
+                opclasses=["int4_ops", "varchar_pattern_ops"],
+            ),
+        ]
+
+
+class ArchivedTicket(models.Model):
+    """
+    A closed ticket moved out of ``tickets`` by ``archive_tickets``.
+
+    Closed tickets can no longer change, so the copy keeps the original
+    timestamps and is read-only. Lists and details include it only with
+    ``?include_archived=true``, keeping the hot table and its indexes small.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_tickets"
+    )
+    title = models.CharField(max_length=30)
+    description = models.TextField(max_length=500)
+    status = models.CharField(max_length=20, choices=TicketStatus.choices)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Archived ticket {self.id} - {self.title}"
+
+    class Meta:
+        db_table = "tickets_archive"
+        verbose_name = "archived ticket"
+        verbose_name_plural = "archived tickets"
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "id"],
+                name="tickets_archive_user_idx",
+            ),
+        ]
+
+
+class TicketStatusCount(models.Model):
+    """
+    Number of tickets per user and status, archived ones included, kept in
+    step with ``tickets``.
+
+    Rows are adjusted with ``F()`` updates in the transaction of every ticket
+    write, so the stats endpoint reads at most four rows instead of counting
+    the user's tickets. ``rebuild_ticket_counts`` recomputes them.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="ticket_status_counts"
+    )
+    status = models.CharField(max_length=20, choices=TicketStatus.choices)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id} {self.status}: {self.count}"
+
+    class Meta:
+        db_table = "ticket_status_counts"
+        verbose_name = "ticket status count"
+        verbose_name_plural = "ticket status counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "status"], name="ticket_status_counts_unique"
+            ),
+        ]
+
+
+class TicketStatusEvent(models.Model):
+    """
+    Append-only record of every status a ticket entered.
+
+    Written in the transaction of the ticket write, one row per creation and
+    per transition (``previous_status`` is blank on creation). The ticket is
+    referenced by id only, so the history outlives deleted tickets.
+    """
+
+    ticket_id = models.UUIDField()
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="ticket_status_events"
+    )
+    previous_status = models.CharField(
+        max_length=20, choices=TicketStatus.choices, blank=True
+    )
+    status = models.CharField(max_length=20, choices=TicketStatus.choices)
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.ticket_id} {self.previous_status} -> {self.status}"
+
+    class Meta:
+        db_table = "ticket_status_events"
+        verbose_name = "ticket status event"
+        verbose_name_plural = "ticket status events"
+        indexes = [
+            models.Index(
+                fields=["user", "created_at"],
+                name="ticket_events_user_created_idx",
+            ),
+            models.Index(
+                fields=["ticket_id", "created_at"],
+                name="ticket_events_ticket_idx",
+            ),
+        ]
+
+
+class TicketTombstone(models.Model):
+    """
+    Marker of a deleted ticket, for clients that sync changes since a cursor.
+
+    Kept for ``TICKET_TOMBSTONE_RETENTION_DAYS``; ``compact_ticket_tombstones``
+    deletes older ones and cursors from before that point are refused.
+    """
+
+    ticket_id = models.UUIDField()
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="ticket_tombstones"
+    )
+    deleted_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.ticket_id} deleted at {self.deleted_at}"
+
+    class Meta:
+        db_table = "ticket_tombstones"
+        verbose_name = "ticket tombstone"
+        verbose_name_plural = "ticket tombstones"
+        indexes = [
+            models.Index(
+                fields=["user", "deleted_at", "ticket_id"],
+                name="ticket_tombstones_user_idx",
+            ),
+            models.Index(fields=["deleted_at"], name="ticket_tombstones_deleted_idx"),
+        ]
@@ -0,0 +1,164 @@
+import base64
+import binascii
+import datetime
+import json
+import uuid
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TicketCursorPagination(BasePagination):
+    """
+    Keyset pagination over the queryset ordering.
+
+    The cursor stores the ordering values of the last row on the page, so the
+    next page is a range scan on the matching index instead of an OFFSET.
+    The ordering always ends on the unique ``id`` to keep it stable.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+    ordering = ("-created_at", "id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        results = list(self.get_page_queryset(queryset, request))
+        return self.set_page(results)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        return self.set_page([row async for row in queryset.aiterator()])
+
+    def get_page_queryset(self, queryset, request):
+        """Return the slice holding the page plus one row to detect a next page."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position))
+        return queryset[: self.page_size + 1]
+
+    def paginate_union(self, querysets, request):
+        """
+        Page through the rows of several ``.values()`` querysets of the same
+        shape, ordered like the first one.
+
+        Each queryset gets the keyset filter and the page limit on its own, so
+        every side stays a short index range scan, and the database merges
+        them in one ``UNION ALL``.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(querysets[0])
+        limit = self.page_size + 1
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            keyset = self.get_keyset_filter(position)
+            querysets = [queryset.filter(keyset) for queryset in querysets]
+        parts = [queryset.order_by(*self.ordering) for queryset in querysets]
+        if connections[querysets[0].db].features.supports_slicing_ordering_in_compound:
+            parts = [part[:limit] for part in parts]
+        else:
+            # SQLite refuses LIMIT in the parts of a UNION, not in a subquery.
+            parts = [
+                part.order_by().filter(pk__in=part.values("pk")[:limit])
+                for part in parts
+            ]
+        first, *rest = parts
+        union = first.union(*rest, all=True).order_by(*self.ordering)
+        return self.set_page(list(union[:limit]))
+
+    def set_page(self, results):
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        ordering = [
+            field for field in queryset.query.order_by if isinstance(field, str)
+        ] or list(self.ordering)
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering.append("id")
+        return tuple(ordering)
+
+    def get_keyset_filter(self, values):
+        """Build ``(a, b) > (x, y)`` as ``a > x OR (a = x AND b > y)``."""
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            lookup = "lt" if field.startswith("-") else "gt"
+            step = Q(**{f"{field.lstrip('-')}__{lookup}": values[index]})
+            for previous, value in zip(self.ordering[:index], values[:index]):
+                step &= Q(**{previous.lstrip("-"): value})
+            condition |= step
+        return condition
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [get_position_value(last, field) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values)
+        )
+
+    def encode_cursor(self, values):
+        payload = {"o": list(self.ordering), "v": values}
+        raw = json.dumps(payload, separators=(",", ":"), default=encode_value)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            ordering, values = tuple(payload["o"]), payload["v"]
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != self.ordering:
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+
+def get_position_value(row, field):
+    name = field.lstrip("-")
+    if name == "pk":
+        name = "id"
+    if isinstance(row, dict):
+        return row[name]
+    return getattr(row, name)
+
+
+def encode_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
@@ -0,0 +1,288 @@
+import datetime
+import re
+
+from django.db import models, transaction
+
+from apps.tickets.models import Ticket, TicketStatusEvent
+from apps.tickets.search import install_search_backend
+
+TICKETS_TABLE = "tickets"
+EVENTS_TABLE = "ticket_status_events"
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def get_month_start(moment):
+    return datetime.date(moment.year, moment.month, 1)
+
+
+def get_month_partition_name(table, month):
+    return f"{table}_{month.year:04d}_{month.month:02d}"
+
+
+def get_month_bounds(month):
+    """The UTC ``FROM`` and ``TO`` literals of the partition of ``month``."""
+    return tuple(
+        f"'{start.isoformat()} 00:00:00+00:00'"
+        for start in (month, add_months(month, 1))
+    )
+
+
+def rebuild_table(schema_editor, model, primary_key, partition_by=None, partitions=()):
+    """
+    Recreate the table of ``model`` with its rows, partitioned or plain.
+
+    The copy is built without indexes, filled with one ``INSERT ... SELECT``
+    and then gets the primary key, indexes, constraints and foreign keys of
+    ``model``. Runs in the transaction of ``schema_editor`` and holds an
+    exclusive lock on the table throughout, so convert large tables in a
+    maintenance window.
+    """
+    quote = schema_editor.quote_name
+    table = model._meta.db_table
+    old = f"{table}_unpartitioned" if partition_by else f"{table}_partitioned"
+    columns = ", ".join(quote(field.column) for field in model._meta.concrete_fields)
+
+    schema_editor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(old)}")
+    create = (
+        f"CREATE TABLE {quote(table)} (LIKE {quote(old)} "
+        f"INCLUDING DEFAULTS INCLUDING GENERATED)"
+    )
+    if partition_by:
+        create += f" PARTITION BY {partition_by}"
+    schema_editor.execute(create)
+    auto_field = model._meta.auto_field
+    if auto_field is not None:
+        # LIKE leaves identity columns out, but copies a nextval() default
+        # (serial columns from before Django 4.1, partitioned tables), which
+        # names the sequence owned by the old table and dropped with it.
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ALTER COLUMN {quote(auto_field.column)} "
+            f"DROP DEFAULT"
+        )
+    for name, bounds in partitions:
+        schema_editor.execute(
+            f"CREATE TABLE {quote(name)} PARTITION OF {quote(table)} {bounds}"
+        )
+    schema_editor.execute(
+        f"INSERT INTO {quote(table)} ({columns}) SELECT {columns} FROM {quote(old)}"
+    )
+    schema_editor.execute(f"DROP TABLE {quote(old)}")
+
+    key = ", ".join(quote(column) for column in primary_key)
+    schema_editor.execute(f"ALTER TABLE {quote(table)} ADD PRIMARY KEY ({key})")
+    for index in get_indexes(model):
+        schema_editor.execute(index.create_sql(model, schema_editor))
+    for constraint in model._meta.constraints:
+        schema_editor.execute(constraint.create_sql(model, schema_editor))
+    for field in model._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            schema_editor.execute(get_foreign_key_sql(schema_editor, model, field))
+    if auto_field is not None:
+        set_auto_field_sequence(schema_editor, table, auto_field.column, partition_by)
+
+
+def get_indexes(model):
+    """The ``Meta.indexes`` of ``model`` and one index per ``db_index`` field."""
+    table = model._meta.db_table
+    indexes = list(model._meta.indexes)
+    for field in model._meta.local_fields:
+        if field.db_index and not field.unique:
+            name = f"{table}_{field.column}_idx"
+            indexes.append(models.Index(fields=[field.name], name=name))
+    return indexes
+
+
+def get_foreign_key_sql(schema_editor, model, field):
+    quote = schema_editor.quote_name
+    table = model._meta.db_table
+    to_table = field.target_field.model._meta.db_table
+    to_column = field.target_field.column
+    return schema_editor.sql_create_fk % {
+        "table": quote(table),
+        "name": quote(f"{table}_{field.column}_fk_{to_table}_{to_column}"),
+        "column": quote(field.column),
+        "to_table": quote(to_table),
+        "to_column": quote(to_column),
+        "deferrable": schema_editor.connection.ops.deferrable_sql(),
+    }
+
+
+def set_auto_field_sequence(schema_editor, table, column, partitioned):
+    """
+    Number new rows after the copied ones.
+
+    Plain tables get the identity column Django creates; partitioned tables
+    only support identity columns from Postgres 17, so they get an owned
+    sequence, which Django's ``sqlsequencereset`` handles the same way.
+    """
+    quote = schema_editor.quote_name
+    if partitioned:
+        sequence = quote(f"{table}_{column}_seq")
+        schema_editor.execute(
+            f"CREATE SEQUENCE {sequence} OWNED BY {quote(table)}.{quote(column)}"
+        )
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ALTER COLUMN {quote(column)} "
+            f"SET DEFAULT nextval('{sequence}')"
+        )
+    else:
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ALTER COLUMN {quote(column)} "
+            f"ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, %s), "
+        f"COALESCE(MAX({quote(column)}), 0) + 1, false) FROM {quote(table)}",
+        [table, column],
+    )
+
+
+def get_ticket_partitions(count):
+    return [
+        (
+            f"{TICKETS_TABLE}_p{remainder}",
+            f"FOR VALUES WITH (MODULUS {count}, REMAINDER {remainder})",
+        )
+        for remainder in range(count)
+    ]
+
+
+def get_event_partitions(first_month, last_month):
+    partitions = []
+    month = first_month
+    while month <= last_month:
+        start, end = get_month_bounds(month)
+        partitions.append(
+            (
+                get_month_partition_name(EVENTS_TABLE, month),
+                f"FOR VALUES FROM ({start}) TO ({end})",
+            )
+        )
+        month = add_months(month, 1)
+    # Catches events outside the monthly partitions instead of failing them.
+    partitions.append((f"{EVENTS_TABLE}_default", "DEFAULT"))
+    return partitions
+
+
+def partition_tables(schema_editor, partitions, months_ahead):
+    """
+    Hash-partition ``tickets`` by user into ``partitions`` tables and
+    range-partition the status events by month, on Postgres.
+
+    Every ticket query filters on the user, so it is pruned to one partition,
+    and the primary key ``(id, user_id)`` and the ``(user, title)`` unique
+    constraint both hold the partition key, as Postgres requires. A monthly
+    range would need ``created_at`` in the title constraint and lose the
+    uniqueness. The append-only events are split by ``created_at`` month, up
+    to ``months_ahead`` months after the current one, so the analytics range
+    scans are pruned and old months can be detached with
+    ``manage_ticket_partitions``.
+    """
+    connection = schema_editor.connection
+    rebuild_table(
+        schema_editor,
+        Ticket,
+        primary_key=["id", "user_id"],
+        partition_by="HASH (user_id)",
+        partitions=get_ticket_partitions(partitions),
+    )
+    install_search_backend(schema_editor)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(created_at) FROM {EVENTS_TABLE}")
+        (oldest,) = cursor.fetchone()
+    this_month = get_month_start(datetime.datetime.now(datetime.timezone.utc))
+    first_month = this_month
+    if oldest is not None:
+        first_month = min(
+            get_month_start(oldest.astimezone(datetime.timezone.utc)), this_month
+        )
+    rebuild_table(
+        schema_editor,
+        TicketStatusEvent,
+        primary_key=["id", "created_at"],
+        partition_by="RANGE (created_at)",
+        partitions=get_event_partitions(
+            first_month, add_months(this_month, months_ahead)
+        ),
+    )
+
+
+def unpartition_tables(schema_editor):
+    """Turn both tables back into the plain tables of the migrations."""
+    rebuild_table(schema_editor, Ticket, ["id"])
+    install_search_backend(schema_editor)
+    rebuild_table(schema_editor, TicketStatusEvent, ["id"])
+
+
+def is_partitioned(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [table],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_month_partitions(connection, table=EVENTS_TABLE):
+    """The months of the monthly partitions attached to ``table``."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND pg_table_is_visible(p.oid)",
+            [table],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+    pattern = re.compile(rf"{re.escape(table)}_(\d{{4}})_(\d{{2}})")
+    return sorted(
+        datetime.date(int(match[1]), int(match[2]), 1)
+        for match in map(pattern.fullmatch, names)
+        if match
+    )
+
+
+def create_month_partition(connection, month, table=EVENTS_TABLE):
+    """
+    Attach the partition of ``month`` to ``table``.
+
+    Rows of that month that already landed in the default partition are
+    moved into the new partition first, otherwise Postgres refuses to attach
+    it.
+    """
+    quote = connection.ops.quote_name
+    name = get_month_partition_name(table, month)
+    default = f"{table}_default"
+    start, end = get_month_bounds(month)
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {quote(default)} "
+            f"WHERE created_at >= {start} AND created_at < {end} RETURNING *) "
+            f"INSERT INTO {quote(name)} SELECT * FROM moved"
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+    return name
+
+
+def detach_month_partition(connection, month, table=EVENTS_TABLE):
+    """
+    Detach the partition of ``month``; it stays as a plain table to archive
+    or drop.
+    """
+    quote = connection.ops.quote_name
+    name = get_month_partition_name(table, month)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}")
+    return name
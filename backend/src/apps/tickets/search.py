@@ -0,0 +1,180 @@
+import re
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db.models import BooleanField, FloatField, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from apps.tickets.models import Ticket
+
+RANK_ALIAS = "search_rank"
+
+
+class BaseSearchBackend:
+    """
+    Full-text search over ``Ticket.title`` and ``Ticket.description``.
+
+    Backends keep a database-side index in sync with the ``tickets`` table and
+    turn a user query into a ranked, filtered queryset. ``install`` must be
+    idempotent because it runs from both the migration and ``post_migrate``.
+    """
+
+    vendor = None
+
+    def install(self, schema_editor):
+        raise NotImplementedError
+
+    def uninstall(self, schema_editor):
+        raise NotImplementedError
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+    def supports(self, connection):
+        return connection.vendor == self.vendor
+
+    @property
+    def table(self):
+        return Ticket._meta.db_table
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Stored ``tsvector`` column with a GIN index, queried with ``@@``."""
+
+    vendor = "postgresql"
+    config = "simple"
+    column = "search_vector"
+    index_name = "tickets_search_vector_idx"
+
+    def install(self, schema_editor):
+        quote = schema_editor.quote_name
+        schema_editor.execute(
+            f"ALTER TABLE {quote(self.table)} ADD COLUMN IF NOT EXISTS "
+            f"{quote(self.column)} tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{self.config}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(description, '')), 'B')"
+            f") STORED"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote(self.index_name)} "
+            f"ON {quote(self.table)} USING GIN ({quote(self.column)})"
+        )
+
+    def uninstall(self, schema_editor):
+        quote = schema_editor.quote_name
+        schema_editor.execute(f"DROP INDEX IF EXISTS {quote(self.index_name)}")
+        schema_editor.execute(
+            f"ALTER TABLE {quote(self.table)} DROP COLUMN IF EXISTS "
+            f"{quote(self.column)}"
+        )
+
+    def search(self, queryset, query):
+        column = f'"{self.table}"."{self.column}"'
+        tsquery = "websearch_to_tsquery(%s, %s)"
+        params = [self.config, query]
+        return queryset.annotate(
+            **{
+                RANK_ALIAS: RawSQL(
+                    f"ts_rank({column}, {tsquery})", params, output_field=FloatField()
+                )
+            }
+        ).filter(RawSQL(f"{column} @@ {tsquery}", params, output_field=BooleanField()))
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    FTS5 shadow table with external content, kept in sync by triggers.
+
+    The FTS rows are keyed by the ``tickets`` rowid, which ``VACUUM`` and
+    table rebuilds may renumber; ``install`` reindexes after a rebuild, call
+    ``rebuild`` after vacuuming the database.
+    """
+
+    vendor = "sqlite"
+    fts_table = "tickets_fts"
+    title_weight = 10.0
+    description_weight = 1.0
+
+    def install(self, schema_editor):
+        fts, table = self.fts_table, self.table
+        # Missing triggers mean the FTS table is new or ``tickets`` was rebuilt
+        # by a schema change, which renumbers rowids; reindex in both cases.
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = %s",
+                [f"{fts}_ai"],
+            )
+            in_sync = cursor.fetchone() is not None
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"title, description, content='{table}', content_rowid='rowid')"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, title, description) "
+            f"VALUES (new.rowid, new.title, new.description); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, title, description) "
+            f"VALUES ('delete', old.rowid, old.title, old.description); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au "
+            f"AFTER UPDATE OF title, description ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, title, description) "
+            f"VALUES ('delete', old.rowid, old.title, old.description); "
+            f"INSERT INTO {fts}(rowid, title, description) "
+            f"VALUES (new.rowid, new.title, new.description); END"
+        )
+        if not in_sync:
+            self.rebuild(schema_editor.connection)
+
+    def uninstall(self, schema_editor):
+        fts = self.fts_table
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {fts}")
+
+    def rebuild(self, connection=default_connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"
+            )
+
+    def search(self, queryset, query):
+        match = self.to_match_expression(query)
+        if not match:
+            return queryset.annotate(**{RANK_ALIAS: Value(0.0)}).none()
+        fts, table = self.fts_table, self.table
+        rank = (
+            f"(SELECT -bm25({fts}, {self.title_weight}, {self.description_weight}) "
+            f'FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = "{table}".rowid)'
+        )
+        condition = f'"{table}".rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)'
+        return queryset.annotate(
+            **{RANK_ALIAS: RawSQL(rank, [match], output_field=FloatField())}
+        ).filter(RawSQL(condition, [match], output_field=BooleanField()))
+
+    @staticmethod
+    def to_match_expression(query):
+        """Quote every word so user input cannot inject FTS5 query syntax."""
+        terms = re.findall(r"\w+", query)
+        return " ".join(f'"{term}"' for term in terms)
+
+
+def get_search_backend():
+    return import_string(settings.TICKET_SEARCH_BACKEND)()
+
+
+def install_search_backend(schema_editor):
+    backend = get_search_backend()
+    if backend.supports(schema_editor.connection):
+        backend.install(schema_editor)
+
+
+def uninstall_search_backend(schema_editor):
+    backend = get_search_backend()
+    if backend.supports(schema_editor.connection):
+        backend.uninstall(schema_editor)
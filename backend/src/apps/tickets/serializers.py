@@ -1,10 +1,62 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
-from apps.tickets.enums import TicketStatus
-from apps.tickets.models import Ticket
+from apps.tickets.enums import STATUS_TRANSITIONS, TicketStatus
+from apps.tickets.models import TITLE_UNIQUE_CONSTRAINT, Ticket
+from core.timing import TimedSerializerMixin
+
+TITLE_EXISTS_MESSAGE = "A ticket with this title already exists."
+
+
+def is_title_conflict(error):
+    """Tell whether an IntegrityError comes from the per-user title constraint."""
+    diag = getattr(error.__cause__, "diag", None)
+    if diag is not None and diag.constraint_name:
+        # A partitioned table reports the constraint of the partition, named
+        # by Postgres, but the key columns are the same.
+        return diag.constraint_name == TITLE_UNIQUE_CONSTRAINT or (
+            diag.message_detail or ""
+        ).startswith("Key (user_id, title)=")
+    message = str(error)
+    return (
+        TITLE_UNIQUE_CONSTRAINT in message
+        or "tickets.user_id, tickets.title" in message
+    )
+
+
+@contextmanager
+def title_conflict_as_validation_error():
+    """Report a duplicate title caught by the database as a field error."""
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as error:
+        if not is_title_conflict(error):
+            raise
+        raise serializers.ValidationError({"title": [TITLE_EXISTS_MESSAGE]})
+
+
+class UniqueTitleMixin:
+    """
+    Rely on the ``(user, title)`` unique constraint instead of a lookup query.
 
+    The write is a single statement and stays correct when two clients
+    submit the same title at once.
+    """
 
-class TicketListSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        with title_conflict_as_validation_error():
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        with title_conflict_as_validation_error():
+            return super().update(instance, validated_data)
+
+
+class TicketListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for listing tickets - minimal fields"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -21,7 +73,7 @@ class TicketListSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user", "created_at"]
 
 
-class TicketDetailSerializer(serializers.ModelSerializer):
+class TicketDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for detailed ticket view"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -40,7 +92,9 @@ class TicketDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user", "created_at", "updated_at"]
 
 
-class TicketCreateSerializer(serializers.ModelSerializer):
+class TicketCreateSerializer(
+    TimedSerializerMixin, UniqueTitleMixin, serializers.ModelSerializer
+):
     """Serializer for creating new tickets"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -56,17 +110,13 @@ class TicketCreateSerializer(serializers.ModelSerializer):
             "created_at",
         ]
         read_only_fields = ["id", "user", "status", "created_at"]
+        validators = []
 
     def validate_title(self, value):
         if len(value) < 3:
             raise serializers.ValidationError(
                 "Title must be at least 3 characters long."
             )
-        user = self.context["request"].user
-        if Ticket.objects.filter(title=value, user=user).exists():
-            raise serializers.ValidationError(
-                "A ticket with this title already exists."
-            )
         return value
 
     def validate_description(self, value):
@@ -77,26 +127,22 @@ class TicketCreateSerializer(serializers.ModelSerializer):
         return value
 
 
-class TicketUpdateSerializer(serializers.ModelSerializer):
+class TicketUpdateSerializer(
+    TimedSerializerMixin, UniqueTitleMixin, serializers.ModelSerializer
+):
     """Serializer for updating tickets"""
 
     class Meta:
         model = Ticket
         fields = ["title", "description", "status", "updated_at"]
         read_only_fields = ["updated_at"]
+        validators = []
 
     def validate_title(self, value):
         if len(value) < 3:
             raise serializers.ValidationError(
                 "Title must be at least 3 characters long."
             )
-        queryset = Ticket.objects.filter(title=value, user=self.context["request"].user)
-        if self.instance:
-            queryset = queryset.exclude(pk=self.instance.pk)
-        if queryset.exists():
-            raise serializers.ValidationError(
-                "A ticket with this title already exists."
-            )
         return value
 
     def validate_description(self, value):
@@ -109,19 +155,44 @@ class TicketUpdateSerializer(serializers.ModelSerializer):
     def validate_status(self, value):
         if not self.instance:
             return value
-        current_status = self.instance.status
-        allowed_transitions = {
-            TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CLOSED],
-            TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.OPEN],
-            TicketStatus.RESOLVED: [TicketStatus.CLOSED, TicketStatus.IN_PROGRESS],
-            TicketStatus.CLOSED: [],
-        }
-        if current_status == TicketStatus.CLOSED:
-            raise serializers.ValidationError(
-                "Cannot modify status of a closed ticket."
-            )
-        if value not in allowed_transitions.get(current_status, []):
+        error = get_transition_error(self.instance.status, value)
+        if error:
+            raise serializers.ValidationError(error)
+        return value
+
+
+class TicketBulkStatusSerializer(serializers.Serializer):
+    """Serializer for moving many tickets to one status"""
+
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+    status = serializers.ChoiceField(choices=TicketStatus.choices)
+
+    def validate_ids(self, value):
+        max_items = settings.TICKET_BULK_MAX_ITEMS
+        if len(value) > max_items:
             raise serializers.ValidationError(
-                f"Cannot change status from {current_status} to {value}."
+                f"Cannot update more than {max_items} tickets at once."
             )
-        return value
+        return list(dict.fromkeys(value))
+
+
+class TicketAnalyticsQuerySerializer(serializers.Serializer):
+    """Query parameters of the ticket analytics endpoint"""
+
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
+
+
+class TicketChangesQuerySerializer(serializers.Serializer):
+    """Query parameters of the ticket changes endpoint"""
+
+    since = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+
+def get_transition_error(current_status, target_status):
+    """Describe why a status change is not allowed, or return None."""
+    if current_status == TicketStatus.CLOSED:
+        return "Cannot modify status of a closed ticket."
+    if target_status not in STATUS_TRANSITIONS.get(current_status, []):
+        return f"Cannot change status from {current_status} to {target_status}."
+    return None
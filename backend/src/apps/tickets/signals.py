@@ -0,0 +1,45 @@
+from django.db import connections
+
+from apps.tickets.cache import bump_generation
+from apps.tickets.counters import change_counts
+from apps.tickets.feed import CREATED, DELETED, UPDATED, publish_tickets
+from apps.tickets.history import new_status_event, record_status_events
+from apps.tickets.search import install_search_backend
+
+
+def install_search_index(sender, using, **kwargs):
+    """Create the search index on databases built without migrations."""
+    with connections[using].schema_editor() as schema_editor:
+        install_search_backend(schema_editor)
+
+
+def invalidate_ticket_cache(sender, instance, **kwargs):
+    bump_generation(instance.user_id)
+
+
+def track_ticket_status(sender, instance, created, raw, using, update_fields, **kwargs):
+    """Count the status of a saved ticket and record the status change."""
+    if raw or (update_fields is not None and "status" not in update_fields):
+        return
+    previous = instance.__dict__.get("_loaded_status")
+    if created:
+        change_counts(instance.user_id, {instance.status: 1}, using=using)
+        record_status_events([new_status_event(instance)], using=using)
+    elif previous is not None and previous != instance.status:
+        change_counts(instance.user_id, {previous: -1, instance.status: 1}, using=using)
+        record_status_events([new_status_event(instance, previous)], using=using)
+    instance._loaded_status = instance.status
+
+
+def count_deleted_ticket(sender, instance, using, **kwargs):
+    status = instance.__dict__.get("_loaded_status") or instance.status
+    change_counts(instance.user_id, {status: -1}, using=using)
+
+
+def publish_saved_ticket(sender, instance, created, raw, using, **kwargs):
+    if not raw:
+        publish_tickets([instance], CREATED if created else UPDATED, using=using)
+
+
+def publish_deleted_ticket(sender, instance, using, **kwargs):
+    publish_tickets([instance], DELETED, using=using)
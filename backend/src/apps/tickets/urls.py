@@ -1,4 +1,5 @@
-from django.urls import URLPattern, URLResolver, include, path
+from django.urls import URLPattern, URLResolver, include, path, re_path
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.routers import DefaultRouter
 
 from apps.tickets.views import TicketViewSet
@@ -6,6 +7,48 @@ from apps.tickets.views import TicketViewSet
 router = DefaultRouter()
 router.register(r"", TicketViewSet, basename="tickets")
 
+
+def get_async_urls():
+    """
+    The router URLs with list and detail served by the async views, plus the
+    server-sent events stream.
+
+    The async views only pay off under an ASGI server; under WSGI every
+    request would cross into an event loop and back.
+    """
+    from apps.tickets.async_views import (
+        TicketDetailAsyncView,
+        TicketEventStreamView,
+        TicketListAsyncView,
+    )
+
+    async_views = {
+        "tickets-list": TicketListAsyncView,
+        "tickets-detail": TicketDetailAsyncView,
+    }
+    # Ahead of the detail route, which would take "events" for an id.
+    urls = [
+        re_path(
+            r"^events/$",
+            csrf_exempt(TicketEventStreamView.as_view()),
+            name="tickets-events",
+        )
+    ]
+    for url in router.urls:
+        view = async_views.get(url.name)
+        if view is None or "format" in url.pattern.regex.groupindex:
+            urls.append(url)
+        else:
+            urls.append(
+                re_path(
+                    url.pattern.regex.pattern,
+                    csrf_exempt(view.as_view()),
+                    name=url.name,
+                )
+            )
+    return urls
+
+
 urlpatterns: list[URLPattern | URLResolver] = [
     path("", include(router.urls)),
 ]
@@ -1,16 +1,51 @@
+import datetime
 import logging
 
-from rest_framework import mixins, permissions, viewsets
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import filters, mixins, permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 
+from apps.tickets.archive import INCLUDE_ARCHIVED_PARAM, include_archived
+from apps.tickets.bulk import bulk_create_tickets, bulk_transition_tickets
+from apps.tickets.cache import TicketResponseCache
+from apps.tickets.changes import (
+    decode_cursor,
+    delete_ticket,
+    encode_cursor,
+    get_changes,
+    get_settled_position,
+)
+from apps.tickets.conditional import (
+    get_detail_validators,
+    get_list_validators,
+    get_not_modified_response,
+    set_validators,
+)
+from apps.tickets.counters import get_status_counts
 from apps.tickets.enums import TicketStatus
-from apps.tickets.models import Ticket
+from apps.tickets.export import EXPORT_FORMATS, get_export_rows
+from apps.tickets.filters import TicketFilterBackend, TicketSearchFilter
+from apps.tickets.history import get_throughput, get_time_in_status
+from apps.tickets.models import ArchivedTicket, Ticket
+from apps.tickets.pagination import TicketCursorPagination
+from apps.tickets.renderers import TicketJSONRenderer
+from apps.tickets.representation import get_values_representation
 from apps.tickets.serializers import (
+    TicketAnalyticsQuerySerializer,
+    TicketBulkStatusSerializer,
+    TicketChangesQuerySerializer,
     TicketCreateSerializer,
     TicketDetailSerializer,
     TicketListSerializer,
     TicketUpdateSerializer,
 )
+from utils.db.routers import use_replica
 
 # Create your views here.
 
@@ -26,10 +61,30 @@ class TicketViewSet(
     viewsets.GenericViewSet,
 ):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TicketCursorPagination
+    renderer_classes = [TicketJSONRenderer, BrowsableAPIRenderer]
+    filter_backends = [
+        TicketFilterBackend,
+        filters.OrderingFilter,
+        TicketSearchFilter,
+    ]
+    ordering_fields = ["created_at", "updated_at", "title", "status"]
+    ordering = ["-created_at", "id"]
     lookup_field = "pk"
+    # Read-only actions served from a read replica, see utils.db.routers.
+    replica_actions = ("list", "retrieve", "export", "stats", "analytics")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.action in self.replica_actions:
+            use_replica(request.user.pk)
 
     def get_queryset(self):
-        return Ticket.objects.filter(user=self.request.user).order_by("-created_at")
+        if self.action == "export" and self.request.user.is_staff:
+            return Ticket.objects.order_by("-created_at", "id")
+        return Ticket.objects.filter(user=self.request.user).order_by(
+            "-created_at", "id"
+        )
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -39,10 +94,211 @@ class TicketViewSet(
             return TicketCreateSerializer
         elif self.action in ["update", "partial_update"]:
             return TicketUpdateSerializer
+        elif self.action == "bulk_transition":
+            return TicketBulkStatusSerializer
+        elif self.action == "analytics":
+            return TicketAnalyticsQuerySerializer
+        elif self.action == "changes":
+            return TicketChangesQuerySerializer
         else:
             return TicketDetailSerializer
 
+    def list(self, request, *args, **kwargs):
+        cache = TicketResponseCache(request)
+        response = cache.get()
+        if response is not None:
+            return response
+
+        etag, last_modified = get_list_validators(request, self.get_queryset())
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = self.list_values()
+            cache.set(response, etag, last_modified)
+        return set_validators(response, etag, last_modified)
+
+    def list_values(self):
+        """``ListModelMixin.list`` on ``.values()`` rows, same output."""
+        representation = get_values_representation(self.get_serializer_class())
+        queryset = self.get_values_queryset(representation)
+        if include_archived(self.request):
+            return self.list_with_archive(representation, queryset)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(representation.many(page))
+        return Response(representation.many(queryset))
+
+    def list_with_archive(self, representation, queryset):
+        """The list over ``tickets`` and ``tickets_archive`` together."""
+        if self.request.query_params.get(TicketSearchFilter.search_param):
+            raise ValidationError(
+                {INCLUDE_ARCHIVED_PARAM: ["Search does not cover archived tickets."]}
+            )
+        archived = self.filter_queryset(
+            ArchivedTicket.objects.filter(user=self.request.user)
+        )
+        archived = representation.values(archived, *queryset.query.values_select)
+        page = self.paginator.paginate_union([queryset, archived], self.request)
+        return self.get_paginated_response(representation.many(page))
+
+    def get_values_queryset(self, representation):
+        queryset = self.filter_queryset(self.get_queryset())
+        # The paginator reads the ordering values from the rows.
+        ordering = [
+            field.lstrip("-")
+            for field in queryset.query.order_by
+            if isinstance(field, str)
+        ]
+        return representation.values(queryset, *ordering)
+
+    def retrieve(self, request, *args, **kwargs):
+        cache = TicketResponseCache(request)
+        response = cache.get()
+        if response is not None:
+            return response
+
+        instance = self.get_object()
+        etag, last_modified = get_detail_validators(request, instance)
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            serializer = self.get_serializer(instance)
+            response = Response(serializer.data)
+            cache.set(response, etag, last_modified)
+        return set_validators(response, etag, last_modified)
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.action != "retrieve" or not include_archived(self.request):
+                raise
+        # Archived tickets are read-only, only retrieve falls back to them.
+        return get_object_or_404(
+            ArchivedTicket.objects.filter(user=self.request.user),
+            pk=self.kwargs[self.lookup_field],
+        )
+
+    def perform_content_negotiation(self, request, force=False):
+        # Exports and event streams are not rendered, any Accept header is fine.
+        return super().perform_content_negotiation(
+            request, force=force or self.action in ("export", "events")
+        )
+
     def perform_destroy(self, instance):
         if instance.status == TicketStatus.CLOSED:
             raise ValidationError(detail="You can't delete closed ticket", code=400)
-        instance.delete()
+        delete_ticket(instance)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"errors": ["Expected a non-empty list of tickets."]})
+        max_items = settings.TICKET_BULK_MAX_ITEMS
+        if len(items) > max_items:
+            raise ValidationError(
+                {"errors": [f"Cannot create more than {max_items} tickets at once."]}
+            )
+
+        results = bulk_create_tickets(items, self.get_serializer_context())
+        created = sum("ticket" in result for result in results)
+        logger.info("User %s bulk created %s tickets", request.user.username, created)
+
+        if created == len(results):
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {"created": created, "failed": len(results) - created, "results": results},
+            status=response_status,
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk/status")
+    def bulk_transition(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target = serializer.validated_data["status"]
+
+        updated, skipped = bulk_transition_tickets(
+            request.user, serializer.validated_data["ids"], target
+        )
+        logger.info(
+            "User %s moved %s tickets to %s",
+            request.user.username,
+            len(updated),
+            target,
+        )
+        return Response({"status": target, "updated": updated, "skipped": skipped})
+
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        counts = get_status_counts(request.user.pk)
+        return Response({**counts, "total": sum(counts.values())})
+
+    @action(detail=False, methods=["get"])
+    def analytics(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        days = serializer.validated_data["days"]
+
+        since = timezone.now() - datetime.timedelta(days=days)
+        return Response(
+            {
+                "days": days,
+                "since": since,
+                "time_in_status": get_time_in_status(request.user.pk, since),
+                "throughput": get_throughput(request.user.pk, since),
+            }
+        )
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        since = serializer.validated_data.get("since")
+        if not since:
+            # Start here, then download the list and sync from the cursor.
+            return Response(
+                {
+                    "cursor": encode_cursor(get_settled_position()),
+                    "has_more": False,
+                    "tickets": [],
+                    "deleted": [],
+                }
+            )
+
+        tickets, deleted, cursor, has_more = get_changes(
+            request.user, decode_cursor(since), serializer.validated_data["limit"]
+        )
+        return Response(
+            {
+                "cursor": cursor,
+                "has_more": has_more,
+                "tickets": tickets,
+                "deleted": deleted,
+            }
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"export_format": [f"Choose one of: {', '.join(EXPORT_FORMATS)}."]}
+            )
+        content_type, iter_lines = EXPORT_FORMATS[export_format]
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # The rows are read after the request returns, pin the database now.
+        queryset = queryset.using(queryset.db)
+        rows = get_export_rows(queryset, settings.TICKET_EXPORT_CHUNK_SIZE)
+        response = StreamingHttpResponse(iter_lines(rows), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="tickets.{export_format}"'
+        )
+        logger.info(
+            "User %s exported tickets as %s", request.user.username, export_format
+        )
+        return response
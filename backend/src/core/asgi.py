@@ -9,8 +9,19 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+from core.disconnect import ASGIDisconnectEvent
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.base")
+os.environ.setdefault("TICKET_ASYNC_VIEWS", "1")
+os.environ.setdefault("DJANGO_DB_POOL", "1")
 
 application = get_asgi_application()
+application = ASGIDisconnectEvent(application, path_prefixes=["/api/tickets/events/"])
+
+if settings.SERVE_STATIC_FILES:
+    from core.static import ASGIStaticFiles
+
+    application = ASGIStaticFiles(application)
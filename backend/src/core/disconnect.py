@@ -0,0 +1,47 @@
+import asyncio
+
+
+class ASGIDisconnectEvent:
+    """
+    Tell long-lived responses under ``path_prefixes`` that the client left.
+
+    Django 4.2 stops reading ``receive`` once the request body is in, so a
+    streaming response never learns about the disconnect and would run
+    forever. Requests under the prefixes get an ``asyncio.Event`` as
+    ``scope["disconnected"]`` (``request.scope`` in the view), set when the
+    server reports ``http.disconnect``.
+    """
+
+    def __init__(self, application, path_prefixes):
+        self.application = application
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            return await self.application(scope, receive, send)
+
+        disconnected = asyncio.Event()
+        body_received = asyncio.Event()
+
+        async def receive_body():
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            elif not message.get("more_body", False):
+                body_received.set()
+            return message
+
+        async def watch():
+            # Django is done with receive once the body is in.
+            await body_received.wait()
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await self.application(
+                {**scope, "disconnected": disconnected}, receive_body, send
+            )
+        finally:
+            watcher.cancel()
@@ -0,0 +1,55 @@
+"""
+Gunicorn settings for ``ENVIRONMENT=production``.
+
+``DJANGO_INTERFACE=asgi`` (default) runs one uvicorn event loop per CPU,
+``wsgi`` runs threaded sync workers. Every value can be overridden with the
+``GUNICORN_*`` variables below.
+"""
+
+import os
+
+
+def get_cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+interface = os.environ.get("DJANGO_INTERFACE", "asgi")
+cpu_count = get_cpu_count()
+
+wsgi_app = f"core.{interface}:application"
+bind = (
+    f"{os.environ.get('DJANGO_HOST', '0.0.0.0')}:{os.environ.get('DJANGO_PORT', 8000)}"
+)
+
+if interface == "asgi":
+    worker_class = "uvicorn_worker.UvicornWorker"
+    default_workers = cpu_count
+else:
+    worker_class = "gthread"
+    threads = int(os.environ.get("GUNICORN_THREADS", 4))
+    default_workers = cpu_count * 2 + 1
+workers = int(os.environ.get("GUNICORN_WORKERS", default_workers))
+
+# Import Django once in the master; workers fork with the app loaded.
+preload_app = True
+# Recycle workers to bound leaks, jittered so they do not restart together.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+worker_tmp_dir = "/dev/shm"
+forwarded_allow_ips = os.environ.get("GUNICORN_FORWARDED_ALLOW_IPS", "127.0.0.1")
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading must not be shared across workers.
+    from django.db import connections
+
+    connections.close_all()
@@ -28,18 +28,21 @@ THIRD_PARTY_APPS = [
 ]
 
 APPS = [
+    "apps.auth",
     "apps.tickets",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + APPS
 
 MIDDLEWARE = [
+    "core.timing.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "utils.db.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -50,6 +53,23 @@ DATABASES = {
         "NAME": PROJECT_DIR / "db.sqlite3",
     }
 }
+# DJANGO_SQLITE_REPLICA names a second SQLite file used as a read replica,
+# a copy of db.sqlite3 taken for local testing (nothing replicates to it).
+if os.environ.get("DJANGO_SQLITE_REPLICA"):
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ["DJANGO_SQLITE_REPLICA"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+# Safe reads (ticket list, detail and export, the health check) go to one of
+# DATABASE_REPLICAS. After a write, the user's reads stay on the primary for
+# DATABASE_REPLICA_STICKY_SECONDS while the replicas catch up.
+DATABASE_ROUTERS = ["utils.db.routers.ReplicaRouter"]
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_REPLICA_STICKY_SECONDS = int(
+    os.environ.get("DJANGO_DB_REPLICA_STICKY_SECONDS", 5)
+)
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -78,6 +98,9 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATICFILES_DIRS = [SRC_DIR / "static"]
 STATIC_ROOT = SRC_DIR / "staticfiles"
+# Serve STATIC_ROOT with core.static ahead of the URLconf, see prod.py.
+SERVE_STATIC_FILES = False
+STATIC_MAX_AGE = 60
 
 MEDIA_URL = "media/"
 MEDIA_ROOT = SRC_DIR / "media"
@@ -107,11 +130,115 @@ DJANGO_SUPERUSER_PASSWORD = os.environ.get("DJANGO_SUPERUSER_PASSWORD", "admin")
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.TokenAuthentication",
+        "apps.auth.authentication.CachedTokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
+    "DEFAULT_THROTTLE_CLASSES": ("apps.auth.throttling.LeasedRateThrottle",),
+    # Per user, or per IP when anonymous: "auth" for the auth endpoints, "list"
+    # for reads and "write" for the other methods.
+    "DEFAULT_THROTTLE_RATES": {
+        "auth": os.environ.get("THROTTLE_RATE_AUTH", "20/min"),
+        "list": os.environ.get("THROTTLE_RATE_LIST", "600/min"),
+        "write": os.environ.get("THROTTLE_RATE_WRITE", "120/min"),
+    },
+}
+
+# Request counters of LeasedRateThrottle live in CACHE_ALIAS, which must be
+# shared by all workers to limit across them. Each process leases
+# LEASE_FRACTION of a rate per cache round trip and keeps MAX_CLIENTS states.
+THROTTLE = {
+    "CACHE_ALIAS": os.environ.get("THROTTLE_CACHE_ALIAS", "default"),
+    "LEASE_FRACTION": float(os.environ.get("THROTTLE_LEASE_FRACTION", 0.05)),
+    "MAX_CLIENTS": int(os.environ.get("THROTTLE_MAX_CLIENTS", 10000)),
 }
 
+# DJANGO_CACHE_BACKEND picks "file" (shared by all workers on the host, stored
+# under DJANGO_CACHE_LOCATION), "redis" (shared by every host, atomic counters,
+# DJANGO_CACHE_LOCATION=redis://host:6379/0, needs the redis extra) or
+# "locmem" (per process, for a single process only). The ticket response
+# cache, token revocations, sticky reads and rate limits rely on it being
+# shared.
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE_BACKEND", "file")
+CACHE_LOCATIONS = {
+    "locmem": "ticket-system",
+    "file": "/tmp/django_cache",
+    "redis": "redis://localhost:6379/0",
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.environ.get(
+            "DJANGO_CACHE_LOCATION", CACHE_LOCATIONS[CACHE_BACKEND]
+        ),
+        "TIMEOUT": int(os.environ.get("DJANGO_CACHE_TIMEOUT", 300)),
+        # Redis evicts by its own maxmemory policy.
+        "OPTIONS": (
+            {}
+            if CACHE_BACKEND == "redis"
+            else {
+                "MAX_ENTRIES": int(os.environ.get("DJANGO_CACHE_MAX_ENTRIES", 10000)),
+            }
+        ),
+    }
+}
+
+# Resolved API tokens are cached in-process for TIMEOUT seconds, and in the
+# Django cache named by CACHE_ALIAS for SHARED_TIMEOUT seconds. That cache
+# also carries revocations to every worker; an empty alias turns caching off.
+TOKEN_AUTH_CACHE = {
+    "MAX_SIZE": int(os.environ.get("TOKEN_AUTH_CACHE_MAX_SIZE", 10000)),
+    "TIMEOUT": int(os.environ.get("TOKEN_AUTH_CACHE_TIMEOUT", 30)),
+    "CACHE_ALIAS": os.environ.get("TOKEN_AUTH_CACHE_ALIAS", "default") or None,
+    "SHARED_TIMEOUT": int(os.environ.get("TOKEN_AUTH_CACHE_SHARED_TIMEOUT", 300)),
+}
+
+TICKET_SEARCH_BACKEND = "apps.tickets.search.SQLiteSearchBackend"
+TICKET_BULK_MAX_ITEMS = int(os.environ.get("TICKET_BULK_MAX_ITEMS", 1000))
+TICKET_BULK_CREATE_BATCH_SIZE = int(
+    os.environ.get("TICKET_BULK_CREATE_BATCH_SIZE", 500)
+)
+TICKET_EXPORT_CHUNK_SIZE = int(os.environ.get("TICKET_EXPORT_CHUNK_SIZE", 2000))
+# Rendered list/detail responses, invalidated per user on every write.
+TICKET_CACHE_ALIAS = os.environ.get("TICKET_CACHE_ALIAS", "default")
+TICKET_CACHE_TIMEOUT = int(os.environ.get("TICKET_CACHE_TIMEOUT", 60))
+# Serve ticket list, detail and create from the async views, on by default
+# under core.asgi.
+TICKET_ASYNC_VIEWS = os.environ.get("TICKET_ASYNC_VIEWS", "0") == "1"
+# Server-sent ticket events (core.asgi only): the pub/sub broker, events kept
+# per process for Last-Event-ID resume, events a slow client may fall behind
+# before it is reset, and the keep-alive and client retry intervals.
+TICKET_FEED_BROKER = "apps.tickets.feed.InProcessBroker"
+TICKET_FEED_HISTORY = int(os.environ.get("TICKET_FEED_HISTORY", 1000))
+TICKET_FEED_MAX_PENDING = int(os.environ.get("TICKET_FEED_MAX_PENDING", 100))
+TICKET_FEED_HEARTBEAT = int(os.environ.get("TICKET_FEED_HEARTBEAT", 15))
+TICKET_FEED_RETRY_MS = int(os.environ.get("TICKET_FEED_RETRY_MS", 3000))
+# Delta sync: how long deletions are remembered (older cursors get 410), and
+# how far behind now final cursors stop so commits in flight are not missed.
+TICKET_TOMBSTONE_RETENTION_DAYS = int(
+    os.environ.get("TICKET_TOMBSTONE_RETENTION_DAYS", 30)
+)
+TICKET_CHANGES_SETTLE_SECONDS = int(os.environ.get("TICKET_CHANGES_SETTLE_SECONDS", 5))
+# Postgres partitioning, applied by partition_tickets: tickets hashed by user
+# into TICKET_PARTITIONS tables, status events in monthly partitions that
+# manage_ticket_partitions creates TICKET_EVENT_PARTITIONS_AHEAD months ahead
+# and detaches after TICKET_EVENT_RETENTION_MONTHS (0 keeps every month).
+TICKET_PARTITIONS = int(os.environ.get("TICKET_PARTITIONS", 16))
+TICKET_EVENT_PARTITIONS_AHEAD = int(os.environ.get("TICKET_EVENT_PARTITIONS_AHEAD", 3))
+TICKET_EVENT_RETENTION_MONTHS = int(os.environ.get("TICKET_EVENT_RETENTION_MONTHS", 0))
+# archive_tickets moves tickets closed longer ago than this to tickets_archive.
+TICKET_ARCHIVE_AFTER_DAYS = int(os.environ.get("TICKET_ARCHIVE_AFTER_DAYS", 90))
+
+# RequestTimingMiddleware logs requests over these budgets as warnings, 0
+# turns a budget off; REQUEST_SERVER_TIMING=0 hides the Server-Timing header.
+REQUEST_QUERY_BUDGET = int(os.environ.get("REQUEST_QUERY_BUDGET", 50))
+REQUEST_LATENCY_BUDGET_MS = int(os.environ.get("REQUEST_LATENCY_BUDGET_MS", 500))
+REQUEST_SERVER_TIMING = os.environ.get("REQUEST_SERVER_TIMING", "1") == "1"
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
@@ -121,7 +248,13 @@ LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "filters": {"require_debug_true": {"()": "django.utils.log.RequireDebugTrue"}},
-    "formatters": {"rich": {"datefmt": "[%X]"}},
+    "formatters": {
+        "rich": {"datefmt": "[%X]"},
+        "logfmt": {
+            "format": "time=%(asctime)s level=%(levelname)s %(message)s",
+            "datefmt": "%Y-%m-%dT%H:%M:%S%z",
+        },
+    },
     "handlers": {
         "console": {
             "class": "rich.logging.RichHandler",
@@ -130,7 +263,12 @@ LOGGING = {
             "level": "DEBUG",
             "rich_tracebacks": True,
             "tracebacks_show_locals": True,
-        }
+        },
+        # The request timing lines, key=value on stderr in every environment.
+        "timing": {"class": "logging.StreamHandler", "formatter": "logfmt"},
+    },
+    "loggers": {
+        "django": {"handlers": ["console"], "level": "INFO"},
+        "core.timing": {"handlers": ["timing"], "level": "INFO", "propagate": False},
     },
-    "loggers": {"django": {"handlers": ["console"], "level": "INFO"}},
 }
@@ -1,12 +1,58 @@
 from core.settings.base import *
 
+# DJANGO_DB_POOL=1 borrows connections from a per-process psycopg pool (the
+# default under core.asgi, where persistent connections are not reused),
+# otherwise connections persist for DJANGO_CONN_MAX_AGE seconds.
+DATABASE_POOL = os.environ.get("DJANGO_DB_POOL", "0") == "1"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": (
+            "utils.db.postgresql_pool"
+            if DATABASE_POOL
+            else "django.db.backends.postgresql"
+        ),
         "NAME": os.environ.get("POSTGRES_DB"),
         "USER": os.environ.get("POSTGRES_USER"),
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": os.environ.get("POSTGRES_PORT"),
+        "CONN_MAX_AGE": (
+            0 if DATABASE_POOL else int(os.environ.get("DJANGO_CONN_MAX_AGE", 60))
+        ),
+        "CONN_HEALTH_CHECKS": os.environ.get("DJANGO_CONN_HEALTH_CHECKS", "1") == "1",
+        "OPTIONS": (
+            {
+                "pool": {
+                    "min_size": int(os.environ.get("DJANGO_DB_POOL_MIN_SIZE", 2)),
+                    "max_size": int(os.environ.get("DJANGO_DB_POOL_MAX_SIZE", 10)),
+                    "timeout": float(os.environ.get("DJANGO_DB_POOL_TIMEOUT", 10)),
+                    "max_idle": float(os.environ.get("DJANGO_DB_POOL_MAX_IDLE", 300)),
+                }
+            }
+            if DATABASE_POOL
+            else {}
+        ),
     }
 }
+
+# POSTGRES_REPLICAS lists read replicas as comma separated host[:port][/name],
+# aliased replica, replica_2, ... and otherwise configured like default. A
+# second database on the same server works for local testing.
+for number, address in enumerate(
+    filter(None, os.environ.get("POSTGRES_REPLICAS", "").split(",")), start=1
+):
+    address, _, name = address.strip().partition("/")
+    host, _, port = address.partition(":")
+    DATABASES["replica" if number == 1 else f"replica_{number}"] = {
+        **DATABASES["default"],
+        "NAME": name or DATABASES["default"]["NAME"],
+        "HOST": host or DATABASES["default"]["HOST"],
+        "PORT": port or DATABASES["default"]["PORT"],
+        "OPTIONS": dict(DATABASES["default"]["OPTIONS"]),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+
+TICKET_SEARCH_BACKEND = "apps.tickets.search.PostgresSearchBackend"
+TICKET_FEED_BROKER = "apps.tickets.feed.PostgresBroker"
@@ -0,0 +1,30 @@
+from django.core.exceptions import ImproperlyConfigured
+
+from core.settings.dev import *
+
+DEBUG = False
+SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
+
+# Collected files are compressed and content-hashed at build time and served
+# by core.static in front of Django, see core.asgi and core.wsgi.
+SERVE_STATIC_FILES = True
+STATIC_MAX_AGE = int(os.environ.get("DJANGO_STATIC_MAX_AGE", 3600))
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Several workers serve requests, each with its own locmem cache.
+if CACHE_BACKEND == "locmem":
+    raise ImproperlyConfigured("DJANGO_CACHE_BACKEND=locmem is per process; use redis.")
+# The rate limit counters take the concurrent increments of every worker,
+# which only redis applies atomically; the file cache reads and rewrites.
+if CACHES[THROTTLE["CACHE_ALIAS"]]["BACKEND"] != CACHE_BACKENDS["redis"]:
+    raise ImproperlyConfigured(
+        f"THROTTLE_CACHE_ALIAS={THROTTLE['CACHE_ALIAS']} needs an atomic incr; "
+        "set DJANGO_CACHE_BACKEND=redis."
+    )
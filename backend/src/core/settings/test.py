@@ -1,3 +1,5 @@
+import os
+
 from .base import *
 
 DATABASES = {
@@ -6,6 +8,20 @@ DATABASES = {
         "NAME": ":memory:",
     }
 }
+# POSTGRES_TEST_HOST adds a "postgres" alias for the tests of Postgres-only
+# DDL (partitioning), which are skipped without it.
+if os.environ.get("POSTGRES_TEST_HOST"):
+    DATABASES["postgres"] = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("POSTGRES_TEST_DB", "tickets"),
+        "USER": os.environ.get("POSTGRES_TEST_USER", "postgres"),
+        "PASSWORD": os.environ.get("POSTGRES_TEST_PASSWORD", ""),
+        "HOST": os.environ["POSTGRES_TEST_HOST"],
+        "PORT": os.environ.get("POSTGRES_TEST_PORT", "5432"),
+        # Created on its own when a test only uses this alias.
+        "TEST": {"DEPENDENCIES": []},
+    }
+DATABASE_REPLICAS = []
 
 
 # WYŁĄCZ LOGGING PODCZAS TESTÓW
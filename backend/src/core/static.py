@@ -0,0 +1,77 @@
+import asyncio
+import re
+
+from django.conf import settings
+
+# ManifestStaticFilesStorage names look like "app.0123456789ab.css".
+HASHED_FILE_PATTERN = re.compile(r"\.[0-9a-f]{12}\.\w+$")
+CHUNK_SIZE = 64 * 1024
+
+
+def get_static_files(application=None):
+    """
+    Index ``STATIC_ROOT`` once with whitenoise, outside the URLconf.
+
+    Hashed names from the manifest storage are served as immutable; other
+    files get ``STATIC_MAX_AGE``.
+    """
+    from whitenoise import WhiteNoise
+
+    return WhiteNoise(
+        application,
+        root=settings.STATIC_ROOT,
+        prefix=settings.STATIC_URL,
+        max_age=settings.STATIC_MAX_AGE,
+        immutable_file_test=lambda path, url: bool(HASHED_FILE_PATTERN.search(url)),
+    )
+
+
+class ASGIStaticFiles:
+    """
+    Serve collected static files in front of an ASGI application.
+
+    ``WhiteNoiseMiddleware`` is sync only and would push every request
+    through a thread under ASGI, so only the whitenoise file index is used
+    here; everything else goes straight to ``application``.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.static_files = get_static_files()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            static_file = self.static_files.files.get(scope["path"])
+            if static_file is not None:
+                return await self.serve(static_file, scope, send)
+        return await self.application(scope, receive, send)
+
+    async def serve(self, static_file, scope, send):
+        # whitenoise reads the request headers in WSGI environ form.
+        environ = {
+            "HTTP_" + name.decode("latin-1").upper().replace("-", "_"): value.decode(
+                "latin-1"
+            )
+            for name, value in scope["headers"]
+        }
+        response = static_file.get_response(scope["method"], environ)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(response.status),
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response.headers
+                ],
+            }
+        )
+        if response.file is None:
+            return await send({"type": "http.response.body", "body": b""})
+        try:
+            while chunk := await asyncio.to_thread(response.file.read, CHUNK_SIZE):
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        finally:
+            response.file.close()
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,191 @@
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_request_timing = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """Where the time of the current request went, in seconds."""
+
+    __slots__ = ("start", "queries", "db", "sections")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.sections = {}
+
+    def add_query(self, duration):
+        self.queries += 1
+        self.db += duration
+
+    def add_section(self, name, duration):
+        self.sections[name] = self.sections.get(name, 0.0) + duration
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper adding every query to the timing of the request."""
+    timing = _request_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.add_query(time.perf_counter() - start)
+
+
+def install_query_timer(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+# Connections are per thread, and under ASGI the queries run in other threads
+# than the middleware, so every connection gets the wrapper when it opens.
+connection_created.connect(install_query_timer)
+
+
+@contextmanager
+def timed(name):
+    """Add the time spent in the block, less its queries, to section ``name``."""
+    timing = _request_timing.get()
+    if timing is None:
+        yield
+        return
+    start, db = time.perf_counter(), timing.db
+    try:
+        yield
+    finally:
+        timing.add_section(name, time.perf_counter() - start - (timing.db - db))
+
+
+class TimedSerializerMixin:
+    """Add the time spent building ``data`` to the ``serialize`` section."""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+def format_field(name, value):
+    if isinstance(value, float):
+        value = f"{value:.1f}"
+    elif isinstance(value, (list, tuple)):
+        value = ",".join(value)
+    value = str(value)
+    if not value or any(char.isspace() or char in '"=' for char in value):
+        value = json.dumps(value)
+    return f"{name}={value}"
+
+
+class RequestTimingMiddleware:
+    """
+    Measure where the time of every request goes.
+
+    Reports the total time, the time and number of database queries, the
+    rendering of DRF and template responses, the sections marked with
+    ``timed`` (``serialize`` for serializers with ``TimedSerializerMixin``
+    and the ``.values()`` rows of the ticket list) and the rest as ``app``,
+    in a ``Server-Timing`` header (with ``REQUEST_SERVER_TIMING``) and one
+    ``key=value`` log line. Requests over ``REQUEST_QUERY_BUDGET`` queries or
+    ``REQUEST_LATENCY_BUDGET_MS`` are logged as warnings, with the budgets
+    they broke in ``over_budget``. Streaming responses are timed up to their
+    first byte.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # A sync hook would cost every async request a thread switch.
+            self.process_template_response = self.aprocess_template_response
+        # Connections opened before this module was imported.
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing = RequestTiming()
+        token = _request_timing.set(timing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_timing.reset(token)
+        self.report(request, response, timing)
+        return response
+
+    async def __acall__(self, request):
+        timing = RequestTiming()
+        token = _request_timing.set(timing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_timing.reset(token)
+        self.report(request, response, timing)
+        return response
+
+    def process_template_response(self, request, response):
+        timing = _request_timing.get()
+        if timing is not None:
+            start = time.perf_counter()
+            # Called right away when the response is already rendered.
+            response.add_post_render_callback(
+                lambda response: timing.add_section(
+                    "render", time.perf_counter() - start
+                )
+            )
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        return self.process_template_response(request, response)
+
+    def report(self, request, response, timing):
+        total = time.perf_counter() - timing.start
+        sections = dict(timing.sections)
+        sections["app"] = max(total - timing.db - sum(sections.values()), 0.0)
+
+        if settings.REQUEST_SERVER_TIMING:
+            metrics = [f'db;dur={timing.db * 1000:.1f};desc="{timing.queries} queries"']
+            metrics += [
+                f"{name};dur={duration * 1000:.1f}"
+                for name, duration in sections.items()
+            ]
+            metrics.append(f"total;dur={total * 1000:.1f}")
+            response["Server-Timing"] = ", ".join(metrics)
+
+        over_budget = []
+        if 0 < settings.REQUEST_QUERY_BUDGET < timing.queries:
+            over_budget.append("queries")
+        if 0 < settings.REQUEST_LATENCY_BUDGET_MS < total * 1000:
+            over_budget.append("latency")
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": total * 1000,
+            "db_ms": timing.db * 1000,
+            "queries": timing.queries,
+            **{f"{name}_ms": duration * 1000 for name, duration in sections.items()},
+        }
+        if over_budget:
+            fields["over_budget"] = over_budget
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            " ".join(format_field(name, value) for name, value in fields.items()),
+            extra={"request_timing": fields},
+        )
@@ -1,12 +1,22 @@
-from django.db import connection
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
 from django.http import JsonResponse
 
 
 def health_check(request):
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
+        for alias in [DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS]:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT 1")
 
-        return JsonResponse({"status": "healthy", "database": "connected"})
+        return JsonResponse(
+            {
+                "status": "healthy",
+                "database": "connected",
+                "replicas": len(settings.DATABASE_REPLICAS),
+            }
+        )
     except Exception as e:
-        return JsonResponse({"status": "unhealthy", "error": str(e)}, status=500)
+        return JsonResponse(
+            {"status": "unhealthy", "database": alias, "error": str(e)}, status=500
+        )
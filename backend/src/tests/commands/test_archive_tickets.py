@@ -0,0 +1,24 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.tickets.models import ArchivedTicket, Ticket
+from tests.factories import TicketFactory
+
+
+@pytest.mark.django_db
+class TestArchiveTicketsCommand:
+    def test_days_option(self, user):
+        ticket = TicketFactory(user=user, closed=True)
+        Ticket.objects.filter(pk=ticket.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(days=2)
+        )
+
+        call_command("archive_tickets", verbosity=0)
+        assert not ArchivedTicket.objects.exists()
+
+        call_command("archive_tickets", "--days", "1", verbosity=0)
+        assert ArchivedTicket.objects.get().pk == ticket.pk
+        assert not Ticket.objects.exists()
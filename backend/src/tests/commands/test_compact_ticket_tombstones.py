@@ -0,0 +1,37 @@
+import datetime
+import uuid
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.tickets.models import TicketTombstone
+
+
+@pytest.mark.django_db
+class TestCompactTicketTombstones:
+    def test_deletes_tombstones_past_retention(self, user, settings):
+        settings.TICKET_TOMBSTONE_RETENTION_DAYS = 30
+        now = timezone.now()
+        for days in (45, 31, 29, 0):
+            TicketTombstone.objects.create(
+                ticket_id=uuid.uuid4(),
+                user=user,
+                deleted_at=now - datetime.timedelta(days=days),
+            )
+
+        call_command("compact_ticket_tombstones", "--batch-size", "1", verbosity=0)
+
+        kept = TicketTombstone.objects.values_list("deleted_at", flat=True)
+        assert sorted((now - moment).days for moment in kept) == [0, 29]
+
+    def test_days_option(self, user):
+        TicketTombstone.objects.create(
+            ticket_id=uuid.uuid4(),
+            user=user,
+            deleted_at=timezone.now() - datetime.timedelta(days=2),
+        )
+
+        call_command("compact_ticket_tombstones", "--days", "1", verbosity=0)
+
+        assert not TicketTombstone.objects.exists()
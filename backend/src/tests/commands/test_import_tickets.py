@@ -0,0 +1,106 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket
+from tests.factories import TicketFactory, UserFactory
+
+
+def write_ndjson(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return path
+
+
+def ticket_row(username, title, **extra):
+    return {
+        "user": username,
+        "title": title,
+        "description": "Imported ticket description",
+        **extra,
+    }
+
+
+@pytest.mark.django_db
+class TestImportTickets:
+    def test_import_csv(self, tmp_path, user):
+        path = tmp_path / "tickets.csv"
+        path.write_text(
+            "user,title,description,status\n"
+            f"{user.username},First import,First imported description,\n"
+            f"{user.username},Second import,Second imported description,closed\n"
+        )
+
+        call_command("import_tickets", str(path), verbosity=0)
+
+        tickets = Ticket.objects.filter(user=user).order_by("title")
+        assert [(t.title, t.status) for t in tickets] == [
+            ("First import", TicketStatus.OPEN),
+            ("Second import", TicketStatus.CLOSED),
+        ]
+        assert not (tmp_path / "tickets.csv.checkpoint").exists()
+
+    def test_import_ndjson_rejects_invalid_rows(self, tmp_path, user, capsys):
+        TicketFactory(user=user, title="Already there")
+        path = write_ndjson(
+            tmp_path / "tickets.ndjson",
+            [
+                ticket_row(user.username, "Valid row"),
+                ticket_row(user.username, "Already there"),
+                ticket_row(user.username, "Valid row"),
+                ticket_row("nobody", "Unknown user"),
+                ticket_row(user.username, "ab", description="short"),
+                ticket_row(user.username, "Bad status", status="done"),
+            ],
+        )
+
+        call_command("import_tickets", str(path), batch_size=4)
+
+        assert set(Ticket.objects.values_list("title", flat=True)) == {
+            "Already there",
+            "Valid row",
+        }
+        err = capsys.readouterr().err
+        assert err.count("rejected") == 5
+
+    def test_import_keeps_ids_and_timestamps(self, tmp_path, user):
+        ticket_id = "0190b8a2-7c3e-7000-8000-000000000001"
+        path = write_ndjson(
+            tmp_path / "tickets.ndjson",
+            [
+                ticket_row(
+                    user.username,
+                    "Legacy",
+                    id=ticket_id,
+                    created_at="2020-01-02T03:04:05+00:00",
+                )
+            ],
+        )
+
+        call_command("import_tickets", str(path), verbosity=0)
+
+        ticket = Ticket.objects.get(title="Legacy")
+        assert str(ticket.id) == ticket_id
+        assert ticket.created_at.year == 2020
+
+    def test_import_resumes_from_checkpoint(self, tmp_path):
+        user = UserFactory(username="importer")
+        path = write_ndjson(
+            tmp_path / "tickets.ndjson",
+            [ticket_row(user.username, f"Row {i}") for i in range(1, 6)],
+        )
+        checkpoint = tmp_path / "tickets.ndjson.checkpoint"
+        checkpoint.write_text(json.dumps({"path": str(path.resolve()), "rows": 3}))
+
+        call_command("import_tickets", str(path), batch_size=2, verbosity=0)
+
+        assert set(Ticket.objects.values_list("title", flat=True)) == {"Row 4", "Row 5"}
+        assert not checkpoint.exists()
+
+    def test_import_requires_known_format(self, tmp_path):
+        path = tmp_path / "tickets.txt"
+        path.write_text("")
+        with pytest.raises(CommandError):
+            call_command("import_tickets", str(path))
@@ -0,0 +1,60 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.tickets.partitioning import (
+    add_months,
+    get_event_partitions,
+    get_month_bounds,
+    get_ticket_partitions,
+)
+
+
+class TestPartitionLayout:
+    @pytest.mark.parametrize(
+        "month, count, expected",
+        [
+            (datetime.date(2026, 10, 1), 0, datetime.date(2026, 10, 1)),
+            (datetime.date(2026, 10, 1), 3, datetime.date(2027, 1, 1)),
+            (datetime.date(2026, 1, 1), -1, datetime.date(2025, 12, 1)),
+            (datetime.date(2026, 1, 1), -13, datetime.date(2024, 12, 1)),
+        ],
+    )
+    def test_add_months(self, month, count, expected):
+        assert add_months(month, count) == expected
+
+    def test_month_bounds_are_utc(self):
+        assert get_month_bounds(datetime.date(2026, 12, 1)) == (
+            "'2026-12-01 00:00:00+00:00'",
+            "'2027-01-01 00:00:00+00:00'",
+        )
+
+    def test_event_partitions(self):
+        partitions = get_event_partitions(
+            datetime.date(2026, 11, 1), datetime.date(2027, 1, 1)
+        )
+        assert [name for name, _ in partitions] == [
+            "ticket_status_events_2026_11",
+            "ticket_status_events_2026_12",
+            "ticket_status_events_2027_01",
+            "ticket_status_events_default",
+        ]
+        assert partitions[1][1] == (
+            "FOR VALUES FROM ('2026-12-01 00:00:00+00:00') "
+            "TO ('2027-01-01 00:00:00+00:00')"
+        )
+
+    def test_ticket_partitions(self):
+        assert get_ticket_partitions(2) == [
+            ("tickets_p0", "FOR VALUES WITH (MODULUS 2, REMAINDER 0)"),
+            ("tickets_p1", "FOR VALUES WITH (MODULUS 2, REMAINDER 1)"),
+        ]
+
+
+@pytest.mark.django_db
+class TestManageTicketPartitions:
+    def test_requires_partitioned_postgres(self):
+        with pytest.raises(CommandError, match="is not partitioned"):
+            call_command("manage_ticket_partitions", verbosity=0)
@@ -0,0 +1,199 @@
+import datetime
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket, TicketStatusEvent
+from apps.tickets.partitioning import EVENTS_TABLE, TICKETS_TABLE, is_partitioned
+from apps.tickets.serializers import TITLE_EXISTS_MESSAGE
+
+POSTGRES = "postgres"
+
+
+class PostgresRouter:
+    """Send every query of the API to the Postgres test database."""
+
+    def db_for_read(self, model, **hints):
+        return POSTGRES
+
+    def db_for_write(self, model, **hints):
+        return POSTGRES
+
+
+def get_primary_key(connection, table):
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    (columns,) = [c["columns"] for c in constraints.values() if c["primary_key"]]
+    return sorted(columns)
+
+
+def get_foreign_keys(connection, table):
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return sorted(c["foreign_key"] for c in constraints.values() if c["foreign_key"])
+
+
+def count_partitions(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s",
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_requires_postgres():
+    with pytest.raises(CommandError, match="needs a Postgres database"):
+        call_command("partition_tickets", verbosity=0)
+
+
+@pytest.mark.skipif(
+    POSTGRES not in settings.DATABASES,
+    reason="Set POSTGRES_TEST_HOST to run the Postgres tests.",
+)
+@pytest.mark.django_db(databases=[POSTGRES], transaction=True)
+class TestPartitionTickets:
+    @pytest.fixture
+    def connection(self):
+        connection = connections[POSTGRES]
+        yield connection
+        # The test database is kept between runs, leave it unpartitioned.
+        if is_partitioned(connection, TICKETS_TABLE):
+            self.partition("--undo")
+
+    @pytest.fixture
+    def users(self):
+        return [
+            User.objects.db_manager(POSTGRES).create_user(f"partitioned{number}")
+            for number in range(3)
+        ]
+
+    @pytest.fixture
+    def rows(self, users):
+        now = timezone.now()
+        tickets = Ticket.objects.using(POSTGRES).bulk_create(
+            Ticket(
+                user=user,
+                title=f"Ticket {number}",
+                description="Ticket to partition",
+                status=TicketStatus.values[number % 4],
+            )
+            for user in users
+            for number in range(4)
+        )
+        TicketStatusEvent.objects.using(POSTGRES).bulk_create(
+            TicketStatusEvent(
+                ticket_id=ticket.pk,
+                user_id=ticket.user_id,
+                status=ticket.status,
+                created_at=now - datetime.timedelta(days=40 * number),
+            )
+            for number, ticket in enumerate(tickets)
+        )
+        return self.get_rows()
+
+    def get_rows(self):
+        return (
+            set(
+                Ticket.objects.using(POSTGRES).values_list(
+                    "id", "user_id", "title", "status", "created_at", "changed_at"
+                )
+            ),
+            set(
+                TicketStatusEvent.objects.using(POSTGRES).values_list(
+                    "id", "ticket_id", "status", "created_at"
+                )
+            ),
+        )
+
+    def add_event(self, user):
+        return TicketStatusEvent.objects.using(POSTGRES).create(
+            ticket_id=Ticket.objects.using(POSTGRES).values("id")[0]["id"],
+            user=user,
+            status=TicketStatus.OPEN,
+            created_at=timezone.now(),
+        )
+
+    def partition(self, *args):
+        call_command("partition_tickets", *args, database=POSTGRES, verbosity=0)
+
+    def test_partition_keeps_rows_and_constraints(self, connection, users, rows):
+        last_id = max(pk for pk, *_ in rows[1])
+
+        self.partition("--partitions", "4")
+
+        assert is_partitioned(connection, TICKETS_TABLE)
+        assert is_partitioned(connection, EVENTS_TABLE)
+        assert count_partitions(connection, TICKETS_TABLE) == 4
+        # Months of the oldest to the newest event, the next ones and default.
+        assert count_partitions(connection, EVENTS_TABLE) > 12
+        assert self.get_rows() == rows
+        assert get_primary_key(connection, TICKETS_TABLE) == ["id", "user_id"]
+        assert get_primary_key(connection, EVENTS_TABLE) == ["created_at", "id"]
+        for table in (TICKETS_TABLE, EVENTS_TABLE):
+            assert get_foreign_keys(connection, table) == [("auth_user", "id")]
+        # New events are numbered after the copied ones.
+        assert self.add_event(users[0]).pk == last_id + 1
+        with pytest.raises(IntegrityError), transaction.atomic(using=POSTGRES):
+            Ticket.objects.using(POSTGRES).bulk_create(
+                [Ticket(user=users[0], title="Ticket 0", description="Duplicate")]
+            )
+        assert Ticket.objects.using(POSTGRES).filter(user=users[1]).count() == 4
+
+    # Some writes open their transaction on the default alias.
+    @pytest.mark.django_db(databases=["default", POSTGRES], transaction=True)
+    def test_duplicate_title_is_a_validation_error(
+        self, settings, connection, users, rows
+    ):
+        settings.DATABASE_ROUTERS = [PostgresRouter()]
+        token = Token.objects.using(POSTGRES).create(user=users[0])
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.partition()
+
+        response = client.post(
+            reverse("tickets-list"),
+            {"title": "Ticket 0", "description": "Duplicate of a partitioned row"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["title"] == [TITLE_EXISTS_MESSAGE]
+
+    def test_undo_restores_plain_tables(self, connection, users, rows):
+        self.partition()
+        event = self.add_event(users[0])
+
+        self.partition("--undo")
+
+        assert not is_partitioned(connection, TICKETS_TABLE)
+        assert not is_partitioned(connection, EVENTS_TABLE)
+        tickets, events = rows
+        assert self.get_rows() == (tickets, events | {self.get_event_row(event)})
+        assert get_primary_key(connection, TICKETS_TABLE) == ["id"]
+        assert get_primary_key(connection, EVENTS_TABLE) == ["id"]
+        assert self.add_event(users[0]).pk == event.pk + 1
+
+    def test_runs_once(self, connection, rows, capsys):
+        self.partition()
+
+        call_command("partition_tickets", database=POSTGRES)
+
+        assert "already partitioned" in capsys.readouterr().out
+        assert self.get_rows() == rows
+
+    @staticmethod
+    def get_event_row(event):
+        return event.pk, event.ticket_id, event.status, event.created_at
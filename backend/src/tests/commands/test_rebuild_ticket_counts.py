@@ -0,0 +1,41 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.tickets.counters import get_status_counts
+from apps.tickets.models import Ticket, TicketStatusCount
+from tests.factories import TicketFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestRebuildTicketCounts:
+    def test_rebuild_repairs_drifted_counters(self, user):
+        TicketFactory.create_batch(2, user=user, open=True)
+        TicketFactory(user=user, closed=True)
+        # Writes that bypass the ORM leave the counters behind.
+        Ticket.objects.filter(user=user, status="open").update(status="resolved")
+        TicketStatusCount.objects.filter(user=user, status="closed").update(count=7)
+
+        call_command("rebuild_ticket_counts", verbosity=0)
+
+        assert get_status_counts(user.pk) == {
+            "open": 0,
+            "in_progress": 0,
+            "resolved": 2,
+            "closed": 1,
+        }
+
+    def test_rebuild_selected_users(self, user):
+        other = UserFactory()
+        TicketFactory(user=user)
+        TicketFactory(user=other)
+        TicketStatusCount.objects.update(count=0)
+
+        call_command("rebuild_ticket_counts", user.username, verbosity=0)
+
+        assert get_status_counts(user.pk)["open"] == 1
+        assert get_status_counts(other.pk)["open"] == 0
+
+    def test_unknown_user(self):
+        with pytest.raises(CommandError, match="Unknown users: nobody"):
+            call_command("rebuild_ticket_counts", "nobody")
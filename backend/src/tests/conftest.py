@@ -1,12 +1,27 @@
 # conftest.py w root projektu
 import pytest
+from django.core.cache import cache
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from apps.auth.authentication import get_token_cache
+from apps.auth.throttling import get_throttle_store
 from apps.tickets.enums import TicketStatus
 from tests.factories import TicketFactory, UserFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Tokens and responses cached by one test must not leak into the next"""
+    get_token_cache().clear()
+    get_throttle_store().clear()
+    cache.clear()
+    yield
+    get_token_cache().clear()
+    get_throttle_store().clear()
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """API client for testing"""
@@ -0,0 +1,44 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+
+from core.disconnect import ASGIDisconnectEvent
+
+
+def run(path, messages):
+    """Call the wrapped app with ``messages`` as the client's side."""
+    seen = {}
+
+    async def application(scope, receive, send):
+        seen["message"] = await receive()
+        seen["disconnected"] = scope.get("disconnected")
+        if seen["disconnected"] is not None:
+            await asyncio.wait_for(seen["disconnected"].wait(), 1)
+
+    async def call():
+        queue = asyncio.Queue()
+        for message in messages:
+            queue.put_nowait(message)
+        scope = {"type": "http", "method": "GET", "path": path}
+        await ASGIDisconnectEvent(application, ["/events/"])(scope, queue.get, None)
+
+    async_to_sync(call)()
+    return seen
+
+
+class TestASGIDisconnectEvent:
+    def test_disconnect_after_body_sets_event(self):
+        seen = run(
+            "/events/",
+            [{"type": "http.request", "body": b""}, {"type": "http.disconnect"}],
+        )
+        assert seen["message"]["type"] == "http.request"
+        assert seen["disconnected"].is_set()
+
+    def test_disconnect_before_body_sets_event(self):
+        seen = run("/events/", [{"type": "http.disconnect"}])
+        assert seen["disconnected"].is_set()
+
+    def test_other_paths_are_passed_through(self):
+        seen = run("/api/tickets/", [{"type": "http.request", "body": b""}])
+        assert seen["disconnected"] is None
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+SRC = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_prod_settings(**environ):
+    """Import core.settings.prod in a fresh interpreter, return the result."""
+    return subprocess.run(
+        [sys.executable, "-c", "import core.settings.prod"],
+        cwd=SRC,
+        env={**os.environ, "DJANGO_SECRET_KEY": "secret", **environ},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_prod_refuses_throttle_cache_without_atomic_incr():
+    result = import_prod_settings(DJANGO_CACHE_BACKEND="file")
+
+    assert result.returncode != 0
+    assert "THROTTLE_CACHE_ALIAS=default needs an atomic incr" in result.stderr
+
+
+def test_prod_accepts_redis():
+    result = import_prod_settings(DJANGO_CACHE_BACKEND="redis")
+
+    assert result.returncode == 0, result.stderr
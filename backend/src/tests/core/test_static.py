@@ -0,0 +1,61 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from core.static import ASGIStaticFiles
+
+pytest.importorskip("whitenoise")
+
+
+@pytest.fixture
+def static_root(settings, tmp_path):
+    (tmp_path / "app.css").write_text("body{}")
+    (tmp_path / "app.0123456789ab.css").write_text("body{}")
+    settings.STATIC_ROOT = tmp_path
+    settings.STATIC_URL = "/static/"
+    return tmp_path
+
+
+def request(application, path, headers=()):
+    scope = {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async_to_sync(application)(scope, receive, send)
+    start, *body = messages
+    return start["status"], dict(start["headers"]), b"".join(m["body"] for m in body)
+
+
+async def fallback(scope, receive, send):
+    await send({"type": "http.response.start", "status": 404, "headers": []})
+    await send({"type": "http.response.body", "body": b"django"})
+
+
+class TestASGIStaticFiles:
+    def test_serves_collected_file(self, static_root):
+        status, headers, body = request(ASGIStaticFiles(fallback), "/static/app.css")
+        assert status == 200
+        assert body == b"body{}"
+        assert headers[b"cache-control"] == b"max-age=60, public"
+
+    def test_hashed_file_is_immutable(self, static_root):
+        application = ASGIStaticFiles(fallback)
+        _, headers, _ = request(application, "/static/app.0123456789ab.css")
+        assert b"immutable" in headers[b"cache-control"]
+
+    def test_not_modified(self, static_root):
+        application = ASGIStaticFiles(fallback)
+        _, headers, _ = request(application, "/static/app.css")
+        status, _, body = request(
+            application, "/static/app.css", [(b"if-none-match", headers[b"etag"])]
+        )
+        assert status == 304
+        assert body == b""
+
+    def test_other_paths_reach_application(self, static_root):
+        status, _, body = request(ASGIStaticFiles(fallback), "/api/tickets/")
+        assert (status, body) == (404, b"django")
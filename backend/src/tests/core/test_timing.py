@@ -0,0 +1,152 @@
+import io
+import logging
+import logging.config
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.tickets.models import Ticket
+from core.settings import base
+from core.timing import RequestTimingMiddleware, timed
+
+
+def get_metrics(response):
+    """``Server-Timing`` as ``{name: (duration, description)}``."""
+    metrics = {}
+    for metric in response["Server-Timing"].split(", "):
+        match = re.fullmatch(r'(\w+);dur=([\d.]+)(?:;desc="(.*)")?', metric)
+        metrics[match[1]] = (float(match[2]), match[3])
+    return metrics
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO, logger="core.timing")
+    return caplog
+
+
+@pytest.fixture
+def production_logging():
+    """
+    The ``core.timing`` logging of the base settings, not of the tests, with
+    its stream as the fixture value.
+    """
+    logger = logging.getLogger("core.timing")
+    saved = logger.handlers[:], logger.level, logger.propagate
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": base.LOGGING["formatters"],
+            "handlers": {"timing": base.LOGGING["handlers"]["timing"]},
+            "loggers": {"core.timing": base.LOGGING["loggers"]["core.timing"]},
+        }
+    )
+    stream = io.StringIO()
+    (handler,) = logger.handlers
+    handler.setStream(stream)
+    yield stream
+    logger.handlers[:], logger.level, logger.propagate = saved
+
+
+@pytest.mark.django_db
+class TestRequestTimingMiddleware:
+    list_url = reverse("tickets-list")
+
+    def test_server_timing(self, authenticated_client, ticket):
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(self.list_url)
+
+        metrics = get_metrics(response)
+        assert set(metrics) == {"db", "serialize", "render", "app", "total"}
+        assert metrics["db"][1] == f"{len(queries)} queries"
+        parts = sum(
+            duration for name, (duration, _) in metrics.items() if name != "total"
+        )
+        assert parts == pytest.approx(metrics["total"][0], abs=0.5)
+
+    def test_retrieve_times_serialization(self, caplog, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.pk})
+
+        response = authenticated_client.get(url)
+
+        assert set(get_metrics(response)) == {
+            "db",
+            "serialize",
+            "render",
+            "app",
+            "total",
+        }
+        assert "serialize_ms" in caplog.records[0].request_timing
+
+    def test_log_line(self, caplog, authenticated_client, ticket):
+        authenticated_client.get(self.list_url)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.INFO
+        assert record.request_timing["path"] == self.list_url
+        assert record.request_timing["status"] == 200
+        assert record.request_timing["queries"] > 0
+        assert record.getMessage().startswith(f"method=GET path={self.list_url} ")
+        assert "over_budget" not in record.request_timing
+
+    def test_over_query_budget(self, settings, caplog, authenticated_client, ticket):
+        settings.REQUEST_QUERY_BUDGET = 1
+
+        authenticated_client.get(self.list_url)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.WARNING
+        assert record.request_timing["over_budget"] == ["queries"]
+        assert "over_budget=queries" in record.getMessage()
+
+    def test_over_budget_is_logged_without_debug(
+        self, settings, production_logging, authenticated_client, ticket
+    ):
+        settings.DEBUG = False
+        settings.REQUEST_QUERY_BUDGET = 1
+
+        authenticated_client.get(self.list_url)
+
+        (line,) = production_logging.getvalue().splitlines()
+        assert line.startswith("time=")
+        assert " level=WARNING method=GET " in line
+        assert line.endswith(" over_budget=queries")
+
+    def test_budgets_off(self, settings, caplog, authenticated_client, ticket):
+        settings.REQUEST_QUERY_BUDGET = 0
+        settings.REQUEST_LATENCY_BUDGET_MS = 0
+
+        authenticated_client.get(self.list_url)
+
+        assert caplog.records[0].levelno == logging.INFO
+
+    def test_header_disabled(self, settings, authenticated_client):
+        settings.REQUEST_SERVER_TIMING = False
+
+        response = authenticated_client.get(self.list_url)
+
+        assert "Server-Timing" not in response
+
+    def test_async_requests(self, ticket):
+        async def get_response(request):
+            return HttpResponse(str(await Ticket.objects.acount()))
+
+        middleware = RequestTimingMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+
+        metrics = get_metrics(response)
+        assert metrics["db"][1] == "1 queries"
+        assert set(metrics) == {"db", "app", "total"}
+
+    def test_nothing_is_timed_outside_requests(self, ticket):
+        RequestTimingMiddleware(lambda request: HttpResponse())
+
+        with timed("serialize"):
+            assert Ticket.objects.count() == 1
@@ -0,0 +1,73 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+pytest.importorskip("psycopg_pool")
+
+from utils.db.postgresql_pool.base import DatabaseWrapper  # noqa: E402
+
+
+def make_connection(alias="pool-test", **overrides):
+    settings_dict = {
+        "ENGINE": "utils.db.postgresql_pool",
+        "NAME": "tickets",
+        "USER": "tickets",
+        "PASSWORD": "secret",
+        "HOST": "localhost",
+        "PORT": "5432",
+        "OPTIONS": {"pool": {"min_size": 1, "max_size": 3}},
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "AUTOCOMMIT": True,
+        "ATOMIC_REQUESTS": False,
+        "TIME_ZONE": None,
+        "TEST": {},
+        **overrides,
+    }
+    return DatabaseWrapper(settings_dict, alias=alias)
+
+
+@pytest.fixture
+def connection():
+    connection = make_connection()
+    yield connection
+    connection.close_pool()
+
+
+class TestPostgresPoolBackend:
+    def test_pool_option_is_not_a_connection_parameter(self, connection):
+        params = connection.get_connection_params()
+        assert "pool" not in params
+        assert params["dbname"] == "tickets"
+
+    def test_pool_is_shared_per_alias(self, connection):
+        pool = connection.pool
+        assert pool.min_size == 1
+        assert pool.max_size == 3
+        assert pool.kwargs["autocommit"] is True
+        assert pool.closed  # opened on first use
+        assert make_connection().pool is pool
+        other = make_connection(alias="pool-other")
+        assert other.pool is not pool
+        other.close_pool()
+
+    def test_health_checks_enable_pool_check(self):
+        enabled = make_connection(alias="pool-checked")
+        disabled = make_connection(alias="pool-unchecked", CONN_HEALTH_CHECKS=False)
+        assert enabled.pool._check is not None
+        assert disabled.pool._check is None
+        enabled.close_pool()
+        disabled.close_pool()
+
+    def test_close_pool_forgets_pool(self, connection):
+        pool = connection.pool
+        connection.close_pool()
+        assert connection.pool is not pool
+
+    def test_persistent_connections_are_rejected(self):
+        connection = make_connection(alias="pool-persistent", CONN_MAX_AGE=60)
+        with pytest.raises(ImproperlyConfigured):
+            connection.pool
+
+    def test_without_pool_option(self):
+        connection = make_connection(alias="pool-disabled", OPTIONS={})
+        assert connection.pool is None
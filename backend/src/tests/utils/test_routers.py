@@ -0,0 +1,136 @@
+import pytest
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import reverse
+from rest_framework import status
+
+from apps.tickets.models import Ticket
+from utils.db import routers
+from utils.db.routers import (
+    ReplicaRouter,
+    get_sticky_key,
+    start_request,
+    stick_to_primary,
+    use_replica,
+)
+
+
+@pytest.fixture
+def replica(settings):
+    """A ``replica`` alias sharing the test connection, so it sees its rows."""
+    settings.DATABASE_REPLICAS = ["replica"]
+    connections["replica"] = connections[DEFAULT_DB_ALIAS]
+    yield "replica"
+    del connections["replica"]
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Record the database chosen for every read."""
+    chosen = []
+    db_for_read = ReplicaRouter.db_for_read
+
+    def record(self, model, **hints):
+        chosen.append(db_for_read(self, model, **hints))
+        return chosen[-1]
+
+    monkeypatch.setattr(ReplicaRouter, "db_for_read", record)
+    return chosen
+
+
+class TestReplicaRouter:
+    router = ReplicaRouter()
+
+    def test_reads_stay_on_primary_outside_a_request(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+        routers._routing_state.set(None)
+        assert use_replica(1) is None
+        assert self.router.db_for_read(Ticket) == DEFAULT_DB_ALIAS
+
+    def test_reads_stay_on_primary_without_replicas(self, settings):
+        settings.DATABASE_REPLICAS = []
+        start_request()
+        assert use_replica(1) is None
+        assert self.router.db_for_read(Ticket) == DEFAULT_DB_ALIAS
+
+    def test_opted_in_reads_go_to_a_replica(self, settings):
+        settings.DATABASE_REPLICAS = ["replica", "replica_2"]
+        start_request()
+        assert self.router.db_for_read(Ticket) == DEFAULT_DB_ALIAS
+
+        alias = use_replica(1)
+        assert alias in settings.DATABASE_REPLICAS
+        assert self.router.db_for_read(Ticket) == alias
+
+    def test_writes_go_to_primary_and_pin_the_request(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+        start_request()
+        use_replica(1)
+
+        assert self.router.db_for_write(Ticket) == DEFAULT_DB_ALIAS
+        assert self.router.db_for_read(Ticket) == DEFAULT_DB_ALIAS
+        assert use_replica(1) is None
+
+    def test_sticky_user_stays_on_primary(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+        start_request()
+        stick_to_primary(1)
+
+        assert use_replica(1) is None
+        assert use_replica(2) == "replica"
+
+
+@pytest.mark.django_db
+class TestReplicaRouting:
+    list_url = reverse("tickets-list")
+
+    def test_list_reads_from_replica(
+        self, authenticated_client, multiple_tickets, replica, reads
+    ):
+        response = authenticated_client.get(self.list_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 3
+        assert reads[-1] == replica
+
+    def test_retrieve_reads_from_replica(
+        self, authenticated_client, ticket, replica, reads
+    ):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert reads[-1] == replica
+
+    def test_write_sticks_user_to_primary(self, authenticated_client, replica, reads):
+        response = authenticated_client.post(
+            self.list_url,
+            {"title": "Fresh", "description": "Fresh description"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert cache.get(get_sticky_key(authenticated_client.user.pk))
+
+        reads.clear()
+        response = authenticated_client.get(self.list_url)
+        assert [row["title"] for row in response.data["results"]] == ["Fresh"]
+        assert set(reads) == {DEFAULT_DB_ALIAS}
+
+    def test_writes_never_use_replica(
+        self, authenticated_client, ticket, replica, reads
+    ):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = authenticated_client.patch(url, {"status": "in_progress"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert replica not in reads
+
+    def test_health_check_connects_to_replicas(self, api_client, replica):
+        response = api_client.get("/health/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "status": "healthy",
+            "database": "connected",
+            "replicas": 1,
+        }
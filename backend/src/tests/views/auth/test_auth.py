@@ -1,9 +1,12 @@
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 
+from apps.auth.authentication import get_shared_cache, get_token_cache, revoke
 from tests.factories import UserFactory
 
 
@@ -159,3 +162,92 @@ class TestAuthViewSet:
 
         # Then
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    def token_queries(self, client, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return [q for q in queries if "authtoken_token" in q["sql"]]
+
+    def test_token_is_resolved_once(self, authenticated_client):
+        """Test repeated requests reuse the cached token."""
+        url = reverse("tickets-list")
+
+        assert len(self.token_queries(authenticated_client, url)) == 1
+        assert self.token_queries(authenticated_client, url) == []
+
+    def test_logout_invalidates_cached_token(self, authenticated_client):
+        """Test a logged out token is rejected even when cached."""
+        url = reverse("tickets-list")
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+
+        authenticated_client.post(reverse("auth-logout"))
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_token_deletion_invalidates_cached_token(self, authenticated_client):
+        """Test deleting a token directly drops it from the cache."""
+        url = reverse("tickets-list")
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+
+        Token.objects.get(user=authenticated_client.user).delete()
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deactivation_invalidates_cached_token(self, authenticated_client):
+        """Test deactivating a user rejects their cached token."""
+        url = reverse("tickets-list")
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+
+        user = User.objects.get(pk=authenticated_client.user.pk)
+        user.is_active = False
+        user.save()
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_shared_cache_tier(self, authenticated_client, settings):
+        """Test tokens are served from the shared cache after a local miss."""
+        settings.TOKEN_AUTH_CACHE = {
+            **settings.TOKEN_AUTH_CACHE,
+            "CACHE_ALIAS": "default",
+        }
+        url = reverse("tickets-list")
+        assert len(self.token_queries(authenticated_client, url)) == 1
+
+        get_token_cache().clear()
+
+        assert self.token_queries(authenticated_client, url) == []
+        authenticated_client.post(reverse("auth-logout"))
+        get_token_cache().clear()
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revocation_by_another_process(self, authenticated_client):
+        """Test a token revoked elsewhere is refused despite the local entry."""
+        url = reverse("tickets-list")
+        key = Token.objects.get(user=authenticated_client.user).key
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+        # Deleted by another process: no signal runs in this one.
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM authtoken_token")
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+
+        revoke(get_shared_cache(), [key])
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_no_caching_without_shared_cache(self, authenticated_client, settings):
+        """Test tokens are not cached when revocations could not be shared."""
+        settings.TOKEN_AUTH_CACHE = {**settings.TOKEN_AUTH_CACHE, "CACHE_ALIAS": None}
+        url = reverse("tickets-list")
+
+        assert len(self.token_queries(authenticated_client, url)) == 1
+        assert len(self.token_queries(authenticated_client, url)) == 1
+        assert len(get_token_cache()) == 0
@@ -0,0 +1,142 @@
+import types
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from apps.auth import throttling
+from apps.tickets.async_views import TicketListAsyncView
+from tests.factories import UserFactory
+
+START = 60 * 1_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=START)
+    monkeypatch.setattr(
+        throttling, "time", types.SimpleNamespace(time=lambda: clock.now)
+    )
+    return clock
+
+
+@pytest.fixture
+def rates(settings, clock):
+    def set_rates(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                "auth": "3/min",
+                "list": "3/min",
+                "write": "3/min",
+                **rates,
+            },
+        }
+
+    set_rates()
+    return set_rates
+
+
+@pytest.mark.django_db
+class TestLeasedRateThrottle:
+    list_url = reverse("tickets-list")
+    login_url = reverse("auth-login")
+
+    def get_list(self, client, times=1):
+        return [client.get(self.list_url) for _ in range(times)][-1]
+
+    def test_throttled_after_the_limit(self, rates, authenticated_client):
+        assert self.get_list(authenticated_client, 3).status_code == status.HTTP_200_OK
+
+        response = self.get_list(authenticated_client)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) > 0
+
+    def test_allowed_again_after_retry_after(self, rates, clock, authenticated_client):
+        self.get_list(authenticated_client, 3)
+        retry_after = int(self.get_list(authenticated_client)["Retry-After"])
+
+        clock.now += retry_after - 1
+        response = self.get_list(authenticated_client)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        clock.now += 1
+        assert self.get_list(authenticated_client).status_code == status.HTTP_200_OK
+
+    def test_previous_window_slides_out(self, rates, clock, authenticated_client):
+        self.get_list(authenticated_client, 3)
+
+        # Halfway through the next window, 1.5 of the 3 requests still count.
+        clock.now += 90
+        assert self.get_list(authenticated_client).status_code == status.HTTP_200_OK
+        response = self.get_list(authenticated_client)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_blocked_clients_are_rejected_without_the_cache(
+        self, rates, authenticated_client
+    ):
+        self.get_list(authenticated_client, 4)
+        cache.clear()
+
+        response = self.get_list(authenticated_client)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_leases_skip_the_cache(self, rates, authenticated_client):
+        rates(list="100/min")
+        key = f"throttle:list:user:{authenticated_client.user.pk}:{int(START // 60)}"
+
+        self.get_list(authenticated_client, 5)
+        assert cache.get(key) == 5
+
+        self.get_list(authenticated_client)
+        assert cache.get(key) == 10
+
+    def test_scopes_are_separate(self, rates, authenticated_client):
+        self.get_list(authenticated_client, 4)
+
+        response = authenticated_client.post(
+            self.list_url,
+            {"title": "Still allowed", "description": "Writes have their own limit"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_users_are_separate(self, rates, authenticated_client, api_client):
+        other = Token.objects.create(user=UserFactory())
+        self.get_list(authenticated_client, 4)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {other.key}")
+
+        assert self.get_list(api_client).status_code == status.HTTP_200_OK
+
+    def test_anonymous_clients_are_limited_by_ip(self, rates, api_client):
+        data = {"username": "nobody", "password": "wrong"}
+        for _ in range(3):
+            api_client.post(self.login_url, data, REMOTE_ADDR="10.0.0.1")
+
+        response = api_client.post(self.login_url, data, REMOTE_ADDR="10.0.0.1")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        response = api_client.post(self.login_url, data, REMOTE_ADDR="10.0.0.2")
+        assert response.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_async_view(self, rates, user):
+        view = TicketListAsyncView.as_view()
+        token, _ = Token.objects.get_or_create(user=user)
+        request = APIRequestFactory().get(
+            self.list_url, HTTP_AUTHORIZATION=f"Token {token.key}"
+        )
+        for _ in range(3):
+            assert async_to_sync(view)(request).status_code == status.HTTP_200_OK
+
+        response = async_to_sync(view)(request)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # The 4 counted requests must slide out to 2 of 3 in the next window.
+        assert response["Retry-After"] == "90"
@@ -0,0 +1,198 @@
+import datetime
+import uuid
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.tickets.enums import TicketStatus
+from apps.tickets.history import get_time_in_status
+from apps.tickets.models import TicketStatusEvent
+
+
+def record_history(user, start, *steps):
+    """Events of one ticket entering each status ``seconds`` after ``start``."""
+    ticket_id = uuid.uuid4()
+    previous = ""
+    for seconds, ticket_status in steps:
+        TicketStatusEvent.objects.create(
+            ticket_id=ticket_id,
+            user=user,
+            previous_status=previous,
+            status=ticket_status,
+            created_at=start + datetime.timedelta(seconds=seconds),
+        )
+        previous = ticket_status
+    return ticket_id
+
+
+@pytest.mark.django_db
+class TestStatusEvents:
+    def test_create_and_transitions_are_recorded(self, authenticated_client):
+        user = authenticated_client.user
+        response = authenticated_client.post(
+            reverse("tickets-list"),
+            {"title": "Tracked", "description": "Tracked description"},
+            format="json",
+        )
+        url = reverse("tickets-detail", kwargs={"pk": response.data["id"]})
+        authenticated_client.patch(url, {"status": TicketStatus.IN_PROGRESS})
+        authenticated_client.patch(url, {"title": "Renamed"})
+        authenticated_client.patch(url, {"status": TicketStatus.RESOLVED})
+
+        events = TicketStatusEvent.objects.filter(user=user).order_by("created_at")
+        assert [(e.previous_status, e.status) for e in events] == [
+            ("", TicketStatus.OPEN),
+            (TicketStatus.OPEN, TicketStatus.IN_PROGRESS),
+            (TicketStatus.IN_PROGRESS, TicketStatus.RESOLVED),
+        ]
+        assert {str(e.ticket_id) for e in events} == {response.data["id"]}
+
+    def test_bulk_operations_are_recorded(self, authenticated_client):
+        user = authenticated_client.user
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(3)
+        ]
+        response = authenticated_client.post(
+            reverse("tickets-bulk-create"), data, format="json"
+        )
+        ids = [result["ticket"]["id"] for result in response.json()["results"]]
+        authenticated_client.post(
+            reverse("tickets-bulk-transition"),
+            {"ids": ids[:2], "status": TicketStatus.CLOSED},
+            format="json",
+        )
+
+        events = TicketStatusEvent.objects.filter(user=user)
+        assert events.filter(previous_status="").count() == 3
+        closed = events.filter(status=TicketStatus.CLOSED)
+        assert sorted(str(e.ticket_id) for e in closed) == sorted(ids[:2])
+        assert {e.previous_status for e in closed} == {TicketStatus.OPEN}
+
+
+@pytest.mark.django_db
+class TestTicketAnalytics:
+    url = reverse("tickets-analytics")
+
+    def test_time_in_status(self, authenticated_client):
+        user = authenticated_client.user
+        start = timezone.now() - datetime.timedelta(days=1)
+        record_history(
+            user,
+            start,
+            (0, TicketStatus.OPEN),
+            (100, TicketStatus.IN_PROGRESS),
+            (400, TicketStatus.RESOLVED),
+        )
+        record_history(
+            user, start, (0, TicketStatus.OPEN), (300, TicketStatus.IN_PROGRESS)
+        )
+
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()["time_in_status"]
+        assert stats[TicketStatus.OPEN] == {
+            "count": 2,
+            "mean": 200.0,
+            "p50": 100.0,
+            "p90": 300.0,
+            "p99": 300.0,
+        }
+        # The second ticket is still in progress, its interval has not ended.
+        assert stats[TicketStatus.IN_PROGRESS]["count"] == 1
+        assert stats[TicketStatus.IN_PROGRESS]["mean"] == 300.0
+        assert stats[TicketStatus.CLOSED] == {
+            "count": 0,
+            "mean": None,
+            "p50": None,
+            "p90": None,
+            "p99": None,
+        }
+
+    def test_percentiles_use_nearest_rank(self, user):
+        start = timezone.now() - datetime.timedelta(days=1)
+        for seconds in range(10, 110, 10):
+            record_history(
+                user,
+                start,
+                (0, TicketStatus.OPEN),
+                (seconds, TicketStatus.CLOSED),
+            )
+
+        stats = get_time_in_status(user.pk, start - datetime.timedelta(seconds=1))
+
+        assert stats[TicketStatus.OPEN]["count"] == 10
+        assert stats[TicketStatus.OPEN]["mean"] == 55.0
+        assert stats[TicketStatus.OPEN]["p50"] == 50.0
+        assert stats[TicketStatus.OPEN]["p90"] == 90.0
+        assert stats[TicketStatus.OPEN]["p99"] == 100.0
+
+    def test_window_and_other_users(self, authenticated_client, admin_user):
+        user = authenticated_client.user
+        old = timezone.now() - datetime.timedelta(days=10)
+        record_history(user, old, (0, TicketStatus.OPEN), (60, TicketStatus.CLOSED))
+        recent = timezone.now() - datetime.timedelta(hours=1)
+        record_history(
+            admin_user, recent, (0, TicketStatus.OPEN), (60, TicketStatus.CLOSED)
+        )
+
+        response = authenticated_client.get(self.url, {"days": 7})
+
+        data = response.json()
+        assert data["days"] == 7
+        assert data["time_in_status"][TicketStatus.OPEN]["count"] == 0
+        assert len(data["throughput"]) == 8
+        assert not any(
+            day[ticket_status]
+            for day in data["throughput"]
+            for ticket_status in TicketStatus.values
+        )
+
+    def test_throughput_per_day(self, authenticated_client):
+        user = authenticated_client.user
+        today = timezone.localdate()
+        noon = timezone.make_aware(datetime.datetime.combine(today, datetime.time(12)))
+        yesterday = noon - datetime.timedelta(days=1)
+        record_history(
+            user, yesterday, (0, TicketStatus.OPEN), (60, TicketStatus.IN_PROGRESS)
+        )
+        record_history(user, yesterday, (0, TicketStatus.OPEN))
+        record_history(
+            user,
+            noon - datetime.timedelta(minutes=10),
+            (0, TicketStatus.OPEN),
+            (60, TicketStatus.CLOSED),
+        )
+
+        response = authenticated_client.get(self.url, {"days": 2})
+
+        throughput = {day.pop("date"): day for day in response.json()["throughput"]}
+        assert list(throughput)[-2:] == [
+            str(today - datetime.timedelta(days=1)),
+            str(today),
+        ]
+        assert throughput[str(today - datetime.timedelta(days=1))] == {
+            "open": 2,
+            "in_progress": 1,
+            "resolved": 0,
+            "closed": 0,
+        }
+        assert throughput[str(today)] == {
+            "open": 1,
+            "in_progress": 0,
+            "resolved": 0,
+            "closed": 1,
+        }
+
+    @pytest.mark.parametrize("days", ["0", "366", "many"])
+    def test_invalid_days(self, authenticated_client, days):
+        response = authenticated_client.get(self.url, {"days": days})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "days" in response.json()
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
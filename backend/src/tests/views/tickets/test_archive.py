@@ -0,0 +1,146 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.tickets.archive import archive_tickets
+from apps.tickets.counters import get_status_counts, rebuild_counts
+from apps.tickets.models import ArchivedTicket, Ticket
+from tests.factories import TicketFactory, UserFactory
+
+
+def close_days_ago(ticket, days):
+    Ticket.objects.filter(pk=ticket.pk).update(
+        updated_at=timezone.now() - datetime.timedelta(days=days)
+    )
+
+
+@pytest.fixture
+def archived(user):
+    """Two archived and two hot tickets of ``user``, one archived elsewhere."""
+    old = TicketFactory.create_batch(2, user=user, closed=True)
+    other = TicketFactory(user=UserFactory(), closed=True)
+    for ticket in (*old, other):
+        close_days_ago(ticket, 100)
+    TicketFactory(user=user, closed=True)
+    TicketFactory(user=user, open=True)
+    archive_tickets(timezone.now() - datetime.timedelta(days=90))
+    return old
+
+
+@pytest.mark.django_db
+class TestArchiveTickets:
+    def test_moves_old_closed_tickets(self, user):
+        old = TicketFactory(user=user, closed=True)
+        close_days_ago(old, 100)
+        recent = TicketFactory(user=user, closed=True)
+        stale_open = TicketFactory(user=user, open=True)
+        close_days_ago(stale_open, 100)
+
+        archived = archive_tickets(
+            timezone.now() - datetime.timedelta(days=90), batch_size=1
+        )
+
+        assert archived == 1
+        assert set(Ticket.objects.values_list("pk", flat=True)) == {
+            recent.pk,
+            stale_open.pk,
+        }
+        copy = ArchivedTicket.objects.get()
+        assert (copy.pk, copy.title, copy.created_at) == (
+            old.pk,
+            old.title,
+            old.created_at,
+        )
+
+    def test_archiving_keeps_counters(self, user):
+        ticket = TicketFactory(user=user, closed=True)
+        close_days_ago(ticket, 100)
+
+        archive_tickets(timezone.now() - datetime.timedelta(days=90))
+
+        assert get_status_counts(user.pk)["closed"] == 1
+
+    def test_rebuild_keeps_archived_tickets_counted(self, authenticated_client, user):
+        TicketFactory(user=user, open=True)
+        ticket = TicketFactory(user=user, closed=True)
+        close_days_ago(ticket, 100)
+        url = reverse("tickets-stats")
+        before = authenticated_client.get(url).json()
+
+        archive_tickets(timezone.now() - datetime.timedelta(days=90))
+        rebuild_counts()
+
+        assert ArchivedTicket.objects.filter(pk=ticket.pk).exists()
+        assert authenticated_client.get(url).json() == before
+        assert (before["open"], before["closed"], before["total"]) == (1, 1, 2)
+
+
+@pytest.mark.django_db
+class TestIncludeArchived:
+    list_url = reverse("tickets-list")
+
+    def test_list_excludes_archive_by_default(self, authenticated_client, archived):
+        response = authenticated_client.get(self.list_url)
+        assert len(response.data["results"]) == 2
+
+    def test_list_includes_archive_when_asked(self, authenticated_client, archived):
+        response = authenticated_client.get(self.list_url, {"include_archived": "true"})
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert len(results) == 4
+        assert {str(ticket.pk) for ticket in archived} <= {r["id"] for r in results}
+        created = [r["created_at"] for r in results]
+        assert created == sorted(created, reverse=True)
+
+    def test_pages_through_both_tables(self, authenticated_client, archived):
+        seen = []
+        url = f"{self.list_url}?include_archived=1&limit=1&ordering=created_at"
+        while url:
+            response = authenticated_client.get(url)
+            seen += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+
+        assert len(seen) == len(set(seen)) == 4
+
+    def test_each_table_is_limited_before_the_union(
+        self, authenticated_client, archived
+    ):
+        with CaptureQueriesContext(connection) as queries:
+            authenticated_client.get(self.list_url, {"include_archived": 1, "limit": 1})
+
+        (union,) = [q["sql"] for q in queries if "UNION ALL" in q["sql"]]
+        # One LIMIT 2 per table and one for the merged page.
+        assert union.count("LIMIT 2") == 3
+
+    def test_filters_apply_to_archive(self, authenticated_client, archived):
+        response = authenticated_client.get(
+            self.list_url, {"include_archived": "true", "status": "closed"}
+        )
+        assert len(response.data["results"]) == 3
+
+    def test_search_with_archive_is_rejected(self, authenticated_client, archived):
+        response = authenticated_client.get(
+            self.list_url, {"include_archived": "true", "q": "ticket"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retrieve_archived(self, authenticated_client, archived):
+        url = reverse("tickets-detail", kwargs={"pk": archived[0].pk})
+
+        assert authenticated_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+        response = authenticated_client.get(url, {"include_archived": "true"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == archived[0].title
+
+    def test_archived_tickets_are_read_only(self, authenticated_client, archived):
+        url = reverse("tickets-detail", kwargs={"pk": archived[0].pk})
+        url += "?include_archived=true"
+
+        assert authenticated_client.delete(url).status_code == 404
+        assert authenticated_client.patch(url, {"title": "New"}).status_code == 404
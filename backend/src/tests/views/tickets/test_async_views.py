@@ -0,0 +1,203 @@
+import datetime
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from apps.tickets.archive import archive_tickets
+from apps.tickets.async_views import TicketDetailAsyncView, TicketListAsyncView
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket
+from apps.tickets.urls import get_async_urls
+from tests.factories import TicketFactory, UserFactory
+
+list_view = TicketListAsyncView.as_view()
+detail_view = TicketDetailAsyncView.as_view()
+
+
+@pytest.fixture
+def factory():
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def auth(user):
+    token, _ = Token.objects.get_or_create(user=user)
+    return {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+
+
+def call(view, request, **kwargs):
+    response = async_to_sync(view)(request, **kwargs)
+    if hasattr(response, "render") and not response.is_rendered:
+        response.render()
+    return response
+
+
+@pytest.mark.django_db
+class TestTicketAsyncViews:
+    list_url = reverse("tickets-list")
+
+    def test_list_matches_sync_view(
+        self, factory, auth, authenticated_client, multiple_tickets
+    ):
+        params = {"limit": 2, "ordering": "title"}
+        response = call(list_view, factory.get(self.list_url, params, **auth))
+        expected = authenticated_client.get(self.list_url, params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == expected.content
+        assert response["ETag"] == expected["ETag"]
+        assert response["Vary"] == "Authorization, Accept"
+        assert response["Allow"] == expected["Allow"]
+
+    def test_list_next_page(self, factory, auth, multiple_tickets):
+        first = call(list_view, factory.get(self.list_url, {"limit": 2}, **auth))
+        second = call(list_view, factory.get(first.data["next"], **auth))
+
+        ids = [t["id"] for t in first.data["results"] + second.data["results"]]
+        assert len(set(ids)) == len(multiple_tickets)
+
+    def test_list_filters_by_status(
+        self, factory, auth, tickets_with_different_statuses
+    ):
+        request = factory.get(self.list_url, {"status": "closed"}, **auth)
+        response = call(list_view, request)
+        assert {t["status"] for t in response.data["results"]} == {"closed"}
+
+    def test_list_served_from_cache(self, factory, auth, ticket):
+        call(list_view, factory.get(self.list_url, **auth))
+        with CaptureQueriesContext(connection) as queries:
+            response = call(list_view, factory.get(self.list_url, **auth))
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 0
+
+    def test_list_not_modified(self, factory, auth, ticket):
+        etag = call(list_view, factory.get(self.list_url, **auth))["ETag"]
+        request = factory.get(self.list_url, HTTP_IF_NONE_MATCH=etag, **auth)
+        assert call(list_view, request).status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_requires_authentication(self, factory):
+        response = call(list_view, factory.get(self.list_url))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response["WWW-Authenticate"] == "Token"
+
+    def test_invalid_token(self, factory):
+        request = factory.get(self.list_url, HTTP_AUTHORIZATION="Token invalid")
+        response = call(list_view, request)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Invalid token."
+
+    def test_create(self, factory, auth, user):
+        data = {"title": "Async ticket", "description": "Created on the event loop"}
+        response = call(
+            list_view, factory.post(self.list_url, data, format="json", **auth)
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["title"] == "Async ticket"
+        assert response.data["status"] == TicketStatus.OPEN
+        assert Ticket.objects.get(id=response.data["id"]).user == user
+
+    def test_create_validation_error(self, factory, auth):
+        data = {"title": "AB", "description": "short"}
+        response = call(
+            list_view, factory.post(self.list_url, data, format="json", **auth)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) == {"title", "description"}
+
+    def test_create_duplicate_title(self, factory, auth, ticket):
+        data = {"title": ticket.title, "description": "Another description"}
+        response = call(
+            list_view, factory.post(self.list_url, data, format="json", **auth)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"title": ["A ticket with this title already exists."]}
+
+    def test_create_is_atomic(self, factory, auth):
+        def fail(sender, **kwargs):
+            raise RuntimeError("receiver failed")
+
+        data = {"title": "Async ticket", "description": "Rolled back together"}
+        post_save.connect(fail, sender=Ticket)
+        try:
+            with pytest.raises(RuntimeError):
+                call(
+                    list_view, factory.post(self.list_url, data, format="json", **auth)
+                )
+        finally:
+            post_save.disconnect(fail, sender=Ticket)
+
+        assert not Ticket.objects.exists()
+
+    def test_retrieve(self, factory, auth, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = call(detail_view, factory.get(url, **auth), pk=str(ticket.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == authenticated_client.get(url).content
+
+    @pytest.mark.parametrize(
+        "pk", ["not-a-uuid", "0190a6f4-0000-7000-8000-000000000000"]
+    )
+    def test_retrieve_not_found(self, factory, auth, pk):
+        url = reverse("tickets-detail", kwargs={"pk": pk})
+        response = call(detail_view, factory.get(url, **auth), pk=pk)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_other_users_ticket(self, factory, auth):
+        ticket = TicketFactory(user=UserFactory())
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = call(detail_view, factory.get(url, **auth), pk=str(ticket.id))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_writes_are_delegated(self, factory, auth, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        request = factory.patch(url, {"status": "in_progress"}, format="json", **auth)
+        response = call(detail_view, request, pk=str(ticket.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        ticket.refresh_from_db()
+        assert ticket.status == TicketStatus.IN_PROGRESS
+
+    def test_browsable_api_is_delegated(self, factory, auth, ticket):
+        request = factory.get(self.list_url, HTTP_ACCEPT="text/html", **auth)
+        response = call(list_view, request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/html")
+
+    def test_archived_reads_are_delegated(self, factory, auth, user):
+        ticket = TicketFactory(user=user, closed=True)
+        Ticket.objects.filter(pk=ticket.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(days=100)
+        )
+        archive_tickets(timezone.now())
+
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        request = factory.get(url, {"include_archived": "true"}, **auth)
+        response = call(detail_view, request, pk=str(ticket.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == str(ticket.id)
+
+
+def test_async_urls_replace_list_and_detail_only():
+    views = {
+        url.name: getattr(url.callback, "view_class", None)
+        for url in get_async_urls()
+        if "format" not in url.pattern.regex.groupindex
+    }
+    assert views["tickets-list"] is TicketListAsyncView
+    assert views["tickets-detail"] is TicketDetailAsyncView
+    assert views["tickets-export"] is None
+    assert views["tickets-bulk-create"] is None
@@ -0,0 +1,195 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.tickets import bulk
+from apps.tickets.counters import get_status_counts, rebuild_counts
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket, TicketStatusEvent
+from tests.factories import TicketFactory
+
+
+@pytest.mark.django_db
+class TestTicketBulkCreate:
+    url = reverse("tickets-bulk-create")
+
+    def test_bulk_create_success(self, authenticated_client, settings):
+        settings.TICKET_BULK_CREATE_BATCH_SIZE = 2
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(5)
+        ]
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response.json()
+        assert response_data["created"] == 5
+        assert response_data["failed"] == 0
+        assert [r["index"] for r in response_data["results"]] == list(range(5))
+        assert all(
+            r["ticket"]["status"] == TicketStatus.OPEN for r in response_data["results"]
+        )
+        assert Ticket.objects.filter(user=authenticated_client.user).count() == 5
+
+    def test_bulk_create_uses_one_title_query(self, authenticated_client):
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        selects = [
+            q
+            for q in queries
+            if q["sql"].startswith("SELECT") and "tickets" in q["sql"]
+        ]
+        assert len(selects) == 1
+
+    def test_bulk_create_reports_per_item_errors(self, authenticated_client):
+        TicketFactory(user=authenticated_client.user, title="Existing")
+        data = [
+            {"title": "Fresh one", "description": "Bulk description text"},
+            {"title": "Existing", "description": "Bulk description text"},
+            {"title": "Fresh one", "description": "Bulk description text"},
+            {"title": "ab", "description": "short"},
+        ]
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        results = response.json()["results"]
+        assert "ticket" in results[0]
+        duplicate = "A ticket with this title already exists."
+        assert results[1]["errors"] == {"title": [duplicate]}
+        assert results[2]["errors"] == {"title": [duplicate]}
+        assert set(results[3]["errors"]) == {"title", "description"}
+        assert Ticket.objects.filter(user=authenticated_client.user).count() == 2
+
+    def test_bulk_create_all_invalid(self, authenticated_client):
+        data = [{"title": "ab", "description": "short"}]
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["created"] == 0
+
+    @pytest.mark.parametrize("data", [[], {"title": "Not a list"}])
+    def test_bulk_create_requires_list(self, authenticated_client, data):
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_limit(self, authenticated_client, settings):
+        settings.TICKET_BULK_MAX_ITEMS = 2
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(3)
+        ]
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Ticket.objects.exists()
+
+    def test_bulk_create_requires_authentication(self, api_client):
+        response = api_client.post(self.url, [], format="json")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestTicketBulkTransition:
+    url = reverse("tickets-bulk-transition")
+
+    def test_bulk_transition_updates_allowed_and_reports_skipped(
+        self, authenticated_client
+    ):
+        user = authenticated_client.user
+        open_ticket = TicketFactory(user=user, open=True)
+        resolved_ticket = TicketFactory(user=user, resolved=True)
+        in_progress_ticket = TicketFactory(user=user, in_progress=True)
+        closed_ticket = TicketFactory(user=user, closed=True)
+        data = {
+            "ids": [
+                str(open_ticket.id),
+                str(resolved_ticket.id),
+                str(in_progress_ticket.id),
+                str(closed_ticket.id),
+            ],
+            "status": TicketStatus.CLOSED,
+        }
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert response_data["updated"] == [
+            str(open_ticket.id),
+            str(resolved_ticket.id),
+        ]
+        skipped = {item["id"]: item for item in response_data["skipped"]}
+        assert skipped[str(in_progress_ticket.id)]["errors"] == [
+            "Cannot change status from in_progress to closed."
+        ]
+        assert skipped[str(closed_ticket.id)]["errors"] == [
+            "Cannot modify status of a closed ticket."
+        ]
+        open_ticket.refresh_from_db()
+        in_progress_ticket.refresh_from_db()
+        assert open_ticket.status == TicketStatus.CLOSED
+        assert open_ticket.updated_at > open_ticket.created_at
+        assert in_progress_ticket.status == TicketStatus.IN_PROGRESS
+
+    def test_bulk_transition_uses_single_update(self, authenticated_client):
+        tickets = TicketFactory.create_batch(5, user=authenticated_client.user)
+        data = {
+            "ids": [str(ticket.id) for ticket in tickets],
+            "status": TicketStatus.IN_PROGRESS,
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(self.url, data, format="json")
+        assert len(response.json()["updated"]) == 5
+        updates = [q for q in queries if q["sql"].startswith('UPDATE "tickets"')]
+        assert len(updates) == 1
+
+    def test_bulk_transition_skips_rows_changed_after_read(
+        self, authenticated_client, monkeypatch
+    ):
+        user = authenticated_client.user
+        moved, changed = TicketFactory.create_batch(2, user=user, open=True)
+        # What the read sees when another request resolves a row right after.
+        stale = {moved.id: TicketStatus.OPEN, changed.id: TicketStatus.OPEN}
+        monkeypatch.setattr(bulk, "get_current_statuses", lambda user, ids: stale)
+        Ticket.objects.filter(pk=changed.pk).update(status=TicketStatus.RESOLVED)
+        rebuild_counts()
+        data = {"ids": [str(moved.id), str(changed.id)], "status": TicketStatus.CLOSED}
+
+        response = authenticated_client.post(self.url, data, format="json")
+
+        assert response.json()["updated"] == [str(moved.id)]
+        assert response.json()["skipped"][0]["errors"] == [bulk.CHANGED_MESSAGE]
+        changed.refresh_from_db()
+        assert changed.status == TicketStatus.RESOLVED
+        assert get_status_counts(user.pk) == {
+            "open": 0,
+            "in_progress": 0,
+            "resolved": 1,
+            "closed": 1,
+        }
+        assert not TicketStatusEvent.objects.filter(
+            ticket_id=changed.pk, status=TicketStatus.CLOSED
+        ).exists()
+
+    def test_bulk_transition_skips_other_users_tickets(self, authenticated_client):
+        other_ticket = TicketFactory(open=True)
+        data = {"ids": [str(other_ticket.id)], "status": TicketStatus.CLOSED}
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.json()["skipped"] == [
+            {"id": str(other_ticket.id), "errors": ["Not found."]}
+        ]
+        other_ticket.refresh_from_db()
+        assert other_ticket.status == TicketStatus.OPEN
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"ids": [], "status": TicketStatus.CLOSED},
+            {"ids": ["not-a-uuid"], "status": TicketStatus.CLOSED},
+            {"ids": ["00000000-0000-0000-0000-000000000000"], "status": "done"},
+        ],
+    )
+    def test_bulk_transition_invalid_payload(self, authenticated_client, data):
+        response = authenticated_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
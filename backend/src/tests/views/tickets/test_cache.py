@@ -0,0 +1,138 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.tickets.cache import get_generation
+from apps.tickets.checks import check_shared_caches
+from apps.tickets.enums import TicketStatus
+from tests.factories import TicketFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestTicketResponseCache:
+    list_url = reverse("tickets-list")
+
+    def get_without_queries(self, client, url, **extra):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, **extra)
+        # The token is cached as well, so nothing reaches the database.
+        assert len(queries) == 0
+        return response
+
+    def test_list_hit_skips_database(self, authenticated_client, multiple_tickets):
+        first = authenticated_client.get(self.list_url)
+        assert first.status_code == status.HTTP_200_OK
+
+        second = self.get_without_queries(authenticated_client, self.list_url)
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+        assert "Last-Modified" not in second
+
+    def test_hit_answers_not_modified(self, authenticated_client, ticket):
+        etag = authenticated_client.get(self.list_url)["ETag"]
+
+        response = self.get_without_queries(
+            authenticated_client, self.list_url, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_detail_hit_skips_database(self, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        first = authenticated_client.get(url)
+
+        second = self.get_without_queries(authenticated_client, url)
+        assert second.json() == first.json()
+
+    def test_query_string_is_part_of_key(self, authenticated_client, user):
+        TicketFactory(user=user, status=TicketStatus.OPEN)
+        TicketFactory(user=user, status=TicketStatus.CLOSED)
+
+        all_tickets = authenticated_client.get(self.list_url).json()["results"]
+        closed = authenticated_client.get(self.list_url, {"status": "closed"})
+        assert len(all_tickets) == 2
+        assert [t["status"] for t in closed.json()["results"]] == ["closed"]
+
+    def test_update_invalidates(self, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        authenticated_client.get(self.list_url)
+        authenticated_client.get(url)
+
+        authenticated_client.patch(url, {"title": "Renamed"})
+        assert authenticated_client.get(url).json()["title"] == "Renamed"
+        results = authenticated_client.get(self.list_url).json()["results"]
+        assert results[0]["title"] == "Renamed"
+
+    def test_create_and_delete_invalidate(self, authenticated_client, ticket):
+        authenticated_client.get(self.list_url)
+
+        authenticated_client.post(
+            self.list_url, {"title": "New ticket", "description": "Description"}
+        )
+        assert len(authenticated_client.get(self.list_url).json()["results"]) == 2
+
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        authenticated_client.delete(url)
+        assert len(authenticated_client.get(self.list_url).json()["results"]) == 1
+        assert authenticated_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_bulk_writes_invalidate(self, authenticated_client, ticket):
+        authenticated_client.get(self.list_url)
+
+        authenticated_client.post(
+            reverse("tickets-bulk-create"),
+            [{"title": "Bulk ticket", "description": "Description"}],
+            format="json",
+        )
+        results = authenticated_client.get(self.list_url).json()["results"]
+        assert len(results) == 2
+
+        authenticated_client.post(
+            reverse("tickets-bulk-transition"),
+            {"ids": [str(ticket.id)], "status": TicketStatus.IN_PROGRESS},
+            format="json",
+        )
+        results = authenticated_client.get(self.list_url).json()["results"]
+        assert {t["status"] for t in results} == {"open", "in_progress"}
+
+    def test_writes_only_invalidate_owner(self, authenticated_client, ticket):
+        other = UserFactory()
+        generation = get_generation(other.pk)
+
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        authenticated_client.patch(url, {"title": "Renamed"})
+        assert get_generation(other.pk) == generation
+        assert get_generation(ticket.user_id) != generation
+
+    def test_users_do_not_share_entries(self, authenticated_client, api_client, ticket):
+        authenticated_client.get(self.list_url)
+
+        other = UserFactory()
+        TicketFactory(user=other, title="Other ticket")
+        api_client.force_authenticate(other)
+        results = api_client.get(self.list_url).json()["results"]
+        assert [t["title"] for t in results] == ["Other ticket"]
+
+
+class TestCheckSharedCaches:
+    def test_warns_about_process_local_caches(self, settings):
+        settings.DEBUG = False
+
+        (warning,) = check_shared_caches(None)
+
+        assert warning.id == "tickets.W001"
+        assert "ticket response cache" in warning.msg
+        assert "rate limits" in warning.msg
+
+    def test_shared_caches_pass(self, settings, tmp_path):
+        settings.DEBUG = False
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": str(tmp_path),
+            }
+        }
+
+        assert check_shared_caches(None) == []
@@ -0,0 +1,208 @@
+import datetime
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.tickets.archive import archive_tickets
+from apps.tickets.changes import MIN_ID, encode_cursor
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket, TicketTombstone
+from tests.factories import TicketFactory, UserFactory
+
+
+@pytest.fixture(autouse=True)
+def no_settle(settings):
+    settings.TICKET_CHANGES_SETTLE_SECONDS = 0
+
+
+def ago(**kwargs):
+    return timezone.now() - datetime.timedelta(**kwargs)
+
+
+def cursor_at(moment):
+    return encode_cursor((moment, MIN_ID))
+
+
+@pytest.mark.django_db
+class TestTicketChanges:
+    url = reverse("tickets-changes")
+
+    def sync(self, client, since, **params):
+        response = client.get(self.url, {"since": since, **params})
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_without_cursor_returns_current_cursor(self, authenticated_client, ticket):
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert (data["tickets"], data["deleted"], data["has_more"]) == ([], [], False)
+        # The ticket existed before the cursor, it is not a change.
+        assert self.sync(authenticated_client, data["cursor"])["tickets"] == []
+
+    def test_returns_only_changed_tickets(self, authenticated_client, user):
+        start = cursor_at(ago(minutes=1))
+        old = TicketFactory(user=user)
+        Ticket.objects.filter(pk=old.pk).update(changed_at=ago(hours=1))
+        changed = TicketFactory(user=user)
+        TicketFactory(user=UserFactory())
+
+        data = self.sync(authenticated_client, start)
+
+        assert [row["id"] for row in data["tickets"]] == [str(changed.pk)]
+        assert data["tickets"][0]["description"] == changed.description
+        assert data["has_more"] is False
+
+    def test_follow_cursor(self, authenticated_client, user):
+        start = cursor_at(ago(minutes=1))
+        first = TicketFactory(user=user)
+
+        data = self.sync(authenticated_client, start)
+        assert [row["id"] for row in data["tickets"]] == [str(first.pk)]
+
+        assert self.sync(authenticated_client, data["cursor"])["tickets"] == []
+
+        url = reverse("tickets-detail", kwargs={"pk": first.pk})
+        authenticated_client.patch(url, {"status": TicketStatus.IN_PROGRESS})
+        second = TicketFactory(user=user)
+
+        data = self.sync(authenticated_client, data["cursor"])
+        assert [(row["id"], row["status"]) for row in data["tickets"]] == [
+            (str(first.pk), TicketStatus.IN_PROGRESS),
+            (str(second.pk), TicketStatus.OPEN),
+        ]
+
+    def test_deletes_leave_tombstones(self, authenticated_client, user):
+        start = cursor_at(ago(minutes=1))
+        ticket = TicketFactory(user=user)
+        url = reverse("tickets-detail", kwargs={"pk": ticket.pk})
+
+        response = authenticated_client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        data = self.sync(authenticated_client, start)
+        assert data["tickets"] == []
+        assert [row["id"] for row in data["deleted"]] == [str(ticket.pk)]
+
+    def test_imported_tickets_are_changes(self, authenticated_client, user, tmp_path):
+        start = cursor_at(ago(minutes=1))
+        path = tmp_path / "tickets.ndjson"
+        row = {
+            "user": user.username,
+            "title": "Imported",
+            "description": "Imported ticket description",
+            "updated_at": "2020-01-01T00:00:00Z",
+        }
+        path.write_text(json.dumps(row) + "\n")
+
+        call_command("import_tickets", str(path), verbosity=0)
+
+        data = self.sync(authenticated_client, start)
+        assert [row["title"] for row in data["tickets"]] == ["Imported"]
+        assert data["tickets"][0]["updated_at"].startswith("2020-01-01")
+
+    def test_archived_tickets_leave_tombstones(self, authenticated_client, user):
+        ticket = TicketFactory(user=user, closed=True)
+        start = cursor_at(ago(minutes=1))
+
+        archive_tickets(timezone.now())
+
+        data = self.sync(authenticated_client, start)
+        assert data["tickets"] == []
+        assert [row["id"] for row in data["deleted"]] == [str(ticket.pk)]
+
+    def test_pages_through_changes(self, authenticated_client, user):
+        start = cursor_at(ago(minutes=1))
+        tickets = TicketFactory.create_batch(3, user=user)
+        TicketTombstone.objects.create(
+            ticket_id=MIN_ID, user=user, deleted_at=timezone.now()
+        )
+        # Two changes at the same instant are split across pages.
+        Ticket.objects.filter(pk__in=[t.pk for t in tickets[:2]]).update(
+            changed_at=ago(seconds=30)
+        )
+
+        first = self.sync(authenticated_client, start, limit=1)
+        second = self.sync(authenticated_client, first["cursor"], limit=1)
+        rest = self.sync(authenticated_client, second["cursor"], limit=10)
+
+        assert (first["has_more"], second["has_more"], rest["has_more"]) == (
+            True,
+            True,
+            False,
+        )
+        seen = [row["id"] for page in (first, second, rest) for row in page["tickets"]]
+        assert sorted(seen) == sorted(str(t.pk) for t in tickets)
+        assert [row["id"] for row in rest["deleted"]] == [str(MIN_ID)]
+
+    def test_recent_changes_wait_to_settle(self, authenticated_client, user, settings):
+        settings.TICKET_CHANGES_SETTLE_SECONDS = 60
+        start = cursor_at(ago(minutes=5))
+        ticket = TicketFactory(user=user)
+
+        data = self.sync(authenticated_client, start)
+        assert data["tickets"] == []
+
+        settings.TICKET_CHANGES_SETTLE_SECONDS = 0
+        data = self.sync(authenticated_client, data["cursor"])
+        assert [row["id"] for row in data["tickets"]] == [str(ticket.pk)]
+
+    def test_late_commit_after_paging_is_not_lost(
+        self, authenticated_client, user, settings
+    ):
+        settings.TICKET_CHANGES_SETTLE_SECONDS = 60
+        start = cursor_at(ago(minutes=10))
+        backlog = TicketFactory.create_batch(3, user=user)
+        Ticket.objects.filter(pk__in=[t.pk for t in backlog]).update(
+            changed_at=ago(minutes=5)
+        )
+        TicketFactory.create_batch(2, user=user)
+
+        data = {"cursor": start, "has_more": True}
+        while data["has_more"]:
+            data = self.sync(authenticated_client, data["cursor"], limit=1)
+        # A write stamped before the newest change, committed only now.
+        late = TicketFactory(user=user)
+        Ticket.objects.filter(pk=late.pk).update(changed_at=ago(seconds=30))
+
+        settings.TICKET_CHANGES_SETTLE_SECONDS = 0
+        data = self.sync(authenticated_client, data["cursor"])
+        assert str(late.pk) in [row["id"] for row in data["tickets"]]
+
+    def test_expired_cursor(self, authenticated_client, settings):
+        settings.TICKET_TOMBSTONE_RETENTION_DAYS = 7
+        response = authenticated_client.get(self.url, {"since": cursor_at(ago(days=8))})
+        assert response.status_code == status.HTTP_410_GONE
+
+    @pytest.mark.parametrize(
+        "since",
+        ["garbage", "WzEsMl0", encode_cursor((datetime.datetime(2030, 1, 1), MIN_ID))],
+    )
+    def test_invalid_cursor(self, authenticated_client, since):
+        response = authenticated_client.get(self.url, {"since": since})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_queries_are_bounded_by_changes(self, authenticated_client, user):
+        TicketFactory.create_batch(5, user=user)
+        start = cursor_at(timezone.now())
+        with CaptureQueriesContext(connection) as queries:
+            self.sync(authenticated_client, start)
+
+        sync_queries = [
+            q["sql"]
+            for q in queries
+            if "ticket_tombstones" in q["sql"] or "changed_at" in q["sql"]
+        ]
+        assert len(sync_queries) == 2
+        assert all("LIMIT" in sql for sql in sync_queries)
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
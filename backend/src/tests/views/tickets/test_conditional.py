@@ -0,0 +1,83 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.tickets.enums import TicketStatus
+from tests.factories import TicketFactory
+
+
+@pytest.mark.django_db
+class TestTicketConditionalGet:
+    list_url = reverse("tickets-list")
+
+    def test_list_returns_not_modified_for_matching_etag(
+        self, authenticated_client, multiple_tickets
+    ):
+        response = authenticated_client.get(self.list_url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+        assert "Authorization" in response["Vary"]
+
+        response = authenticated_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    def test_list_has_no_last_modified(self, authenticated_client, user):
+        kept, deleted = TicketFactory(user=user), TicketFactory(user=user)
+        url = reverse("tickets-detail", kwargs={"pk": kept.id})
+        since = authenticated_client.get(url)["Last-Modified"]
+        response = authenticated_client.get(self.list_url)
+        assert "Last-Modified" not in response
+
+        authenticated_client.delete(reverse("tickets-detail", kwargs={"pk": deleted.id}))
+        response = authenticated_client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=since)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 1
+
+    def test_list_etag_changes_on_write(self, authenticated_client, ticket):
+        etag = authenticated_client.get(self.list_url)["ETag"]
+
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        authenticated_client.patch(url, {"status": TicketStatus.IN_PROGRESS})
+        response = authenticated_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response["ETag"]
+        authenticated_client.delete(url)
+        response = authenticated_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["results"] == []
+
+    def test_list_etag_depends_on_query(self, authenticated_client, ticket):
+        etag = authenticated_client.get(self.list_url)["ETag"]
+        response = authenticated_client.get(
+            self.list_url, {"status": "closed"}, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_is_per_user(self, authenticated_client, api_client, user):
+        etag = authenticated_client.get(self.list_url)["ETag"]
+        other = TicketFactory().user
+        api_client.force_authenticate(other)
+        response = api_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_returns_not_modified(self, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = authenticated_client.get(url)
+        etag = response["ETag"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        authenticated_client.patch(url, {"title": "Changed title"})
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "Changed title"
+
+    def test_retrieve_if_modified_since(self, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        last_modified = authenticated_client.get(url)["Last-Modified"]
+        response = authenticated_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from apps.tickets.enums import TicketStatus
+from tests.factories import TicketFactory, UserFactory
+
+
+def read_stream(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestTicketExport:
+    url = reverse("tickets-export")
+
+    def test_export_csv(self, authenticated_client, multiple_tickets):
+        response = authenticated_client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert 'filename="tickets.csv"' in response["Content-Disposition"]
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        assert len(rows) == 3
+        assert {row["title"] for row in rows} == {t.title for t in multiple_tickets}
+        assert all(row["user"] == authenticated_client.user.username for row in rows)
+
+    def test_export_ndjson(self, authenticated_client, ticket):
+        response = authenticated_client.get(self.url, {"export_format": "ndjson"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = read_stream(response).splitlines()
+        assert len(lines) == 1
+        row = json.loads(lines[0])
+        assert row["id"] == str(ticket.id)
+        assert row["description"] == ticket.description
+        assert row["status"] == TicketStatus.OPEN
+
+    def test_export_honours_filters(self, authenticated_client):
+        user = authenticated_client.user
+        TicketFactory(user=user, open=True)
+        TicketFactory(user=user, closed=True)
+        response = authenticated_client.get(
+            self.url, {"export_format": "ndjson", "status": "closed"}
+        )
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        assert [row["status"] for row in rows] == [TicketStatus.CLOSED]
+
+    def test_export_user_isolation(self, authenticated_client, ticket):
+        TicketFactory(user=UserFactory())
+        response = authenticated_client.get(self.url, {"export_format": "ndjson"})
+        assert len(read_stream(response).splitlines()) == 1
+
+    def test_export_staff_sees_all_tickets(self, api_client, admin_user):
+        TicketFactory.create_batch(2, user=UserFactory())
+        TicketFactory(user=admin_user, title="Admin ticket")
+        token = Token.objects.create(user=admin_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        response = api_client.get(self.url, HTTP_ACCEPT="text/csv")
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        assert len(rows) == 3
+
+    def test_export_invalid_format(self, authenticated_client):
+        response = authenticated_client.get(self.url, {"export_format": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_requires_authentication(self, api_client):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,268 @@
+import asyncio
+import datetime
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from apps.tickets.archive import archive_tickets
+from apps.tickets.async_views import TicketEventStreamView
+from apps.tickets.enums import TicketStatus
+from apps.tickets.feed import RESET, Event, PostgresBroker, get_broker
+from apps.tickets.models import Ticket
+from tests.factories import TicketFactory
+
+events_view = TicketEventStreamView.as_view()
+EVENTS_URL = "/api/tickets/events/"
+
+
+@pytest.fixture(autouse=True)
+def broker(settings):
+    settings.TICKET_FEED_BROKER = "apps.tickets.feed.InProcessBroker"
+    get_broker.cache_clear()
+    yield get_broker()
+    get_broker.cache_clear()
+
+
+@pytest.fixture
+def auth(user):
+    token, _ = Token.objects.get_or_create(user=user)
+    return {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+
+
+def parse(chunk):
+    """The events of a ``text/event-stream`` chunk as dicts."""
+    events = []
+    for block in chunk.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        if "event" in fields:
+            fields["data"] = json.loads(fields["data"])
+            events.append(fields)
+    return events
+
+
+def read_stream(headers, publish=(), chunks=1, **params):
+    """Open the stream, deliver ``publish`` and read ``chunks`` chunks."""
+
+    async def read():
+        request = APIRequestFactory().get(EVENTS_URL, params, **headers)
+        response = await events_view(request)
+        if response.status_code != status.HTTP_200_OK:
+            return response, []
+        content = aiter(response.streaming_content)
+        assert await anext(content) == b"retry: 3000\n\n"
+        for event in publish:
+            get_broker().deliver(event)
+        received = []
+        for _ in range(chunks):
+            chunk = await asyncio.wait_for(anext(content), 1)
+            received += parse(chunk.decode())
+        await content.aclose()
+        return response, received
+
+    return async_to_sync(read)()
+
+
+@pytest.mark.django_db
+class TestTicketEventStream:
+    def test_stream_delivers_user_events(self, auth, user, admin_user):
+        mine = Event(user.pk, "created", {"id": "1"})
+        other = Event(admin_user.pk, "created", {"id": "2"})
+
+        response, events = read_stream(auth, publish=[other, mine])
+
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["Cache-Control"] == "no-cache"
+        assert events == [{"id": mine.id, "event": "created", "data": {"id": "1"}}]
+
+    def test_resume_after_last_event_id(self, auth, user, broker):
+        first, second, third = (
+            Event(user.pk, "updated", {"id": str(n)}) for n in range(3)
+        )
+        for event in (first, second, third):
+            broker.deliver(event)
+
+        _, events = read_stream({**auth, "HTTP_LAST_EVENT_ID": first.id})
+
+        assert [event["id"] for event in events] == [second.id, third.id]
+
+    def test_resume_follows_delivery_order(self, auth, user, broker):
+        # The earlier write commits last, after the client saw the later one.
+        earlier, later = (Event(user.pk, "updated", {"id": str(n)}) for n in range(2))
+        broker.deliver(later)
+        broker.deliver(earlier)
+
+        _, events = read_stream({**auth, "HTTP_LAST_EVENT_ID": later.id})
+
+        assert [event["id"] for event in events] == [earlier.id]
+
+    def test_resume_from_query_parameter(self, auth, user, broker):
+        first, second = (Event(user.pk, "updated", {"id": str(n)}) for n in range(2))
+        broker.deliver(first)
+        broker.deliver(second)
+
+        _, events = read_stream(auth, last_event_id=first.id)
+
+        assert [event["id"] for event in events] == [second.id]
+
+    def test_unknown_last_event_id_resets(self, auth, user, broker, settings):
+        settings.TICKET_FEED_HISTORY = 2
+        get_broker.cache_clear()
+        broker = get_broker()
+        old, *recent = (Event(user.pk, "updated", {"id": str(n)}) for n in range(3))
+        for event in (old, *recent):
+            broker.deliver(event)
+
+        _, events = read_stream({**auth, "HTTP_LAST_EVENT_ID": old.id})
+
+        assert events == [{"id": recent[-1].id, "event": RESET, "data": {}}]
+
+    def test_slow_consumer_is_reset(self, auth, user, settings):
+        settings.TICKET_FEED_MAX_PENDING = 2
+        published = [Event(user.pk, "updated", {"id": str(n)}) for n in range(5)]
+
+        _, events = read_stream(auth, publish=published)
+
+        assert events == [{"id": published[-1].id, "event": RESET, "data": {}}]
+
+    def test_closed_stream_unsubscribes(self, auth, user, broker):
+        read_stream(auth, publish=[Event(user.pk, "created", {"id": "1"})])
+        assert broker.subscriptions == {}
+
+    def test_requires_authentication(self):
+        response, _ = read_stream({})
+        response.render()
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_url_is_routed_under_asgi_only(self):
+        from apps.tickets.urls import get_async_urls, router
+
+        assert "tickets-events" in {url.name for url in get_async_urls()}
+        assert "tickets-events" not in {url.name for url in router.urls}
+
+
+@pytest.mark.django_db
+class TestTicketEventPublishing:
+    def published(self, broker, user):
+        return [
+            (event.type, event.data.get("id"), event.data.get("status"))
+            for event in broker.history
+            if event.user_id == user.pk
+        ]
+
+    def test_writes_publish_on_commit(
+        self, authenticated_client, broker, django_capture_on_commit_callbacks
+    ):
+        user = authenticated_client.user
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                reverse("tickets-list"),
+                {"title": "Streamed", "description": "Streamed description"},
+                format="json",
+            )
+            ticket_id = response.data["id"]
+            url = reverse("tickets-detail", kwargs={"pk": ticket_id})
+            authenticated_client.patch(url, {"status": TicketStatus.IN_PROGRESS})
+            authenticated_client.delete(url)
+
+        assert self.published(broker, user) == [
+            ("created", ticket_id, TicketStatus.OPEN),
+            ("updated", ticket_id, TicketStatus.IN_PROGRESS),
+            ("deleted", ticket_id, None),
+        ]
+
+    def test_nothing_is_published_before_commit(self, authenticated_client, broker):
+        TicketFactory(user=authenticated_client.user)
+        assert list(broker.history) == []
+
+    def test_bulk_writes_publish(
+        self, authenticated_client, broker, django_capture_on_commit_callbacks
+    ):
+        user = authenticated_client.user
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(2)
+        ]
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                reverse("tickets-bulk-create"), data, format="json"
+            )
+            ids = [r["ticket"]["id"] for r in response.json()["results"]]
+            authenticated_client.post(
+                reverse("tickets-bulk-transition"),
+                {"ids": ids, "status": TicketStatus.CLOSED},
+                format="json",
+            )
+
+        published = self.published(broker, user)
+        assert sorted(published[:2]) == sorted(
+            ("created", pk, TicketStatus.OPEN) for pk in ids
+        )
+        assert sorted(published[2:]) == sorted(
+            ("updated", pk, TicketStatus.CLOSED) for pk in ids
+        )
+
+    def test_archiving_publishes_deletions(
+        self, user, broker, django_capture_on_commit_callbacks
+    ):
+        old = TicketFactory(user=user, closed=True)
+        Ticket.objects.filter(pk=old.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(days=100)
+        )
+        TicketFactory(user=user, closed=True)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            archive_tickets(timezone.now() - datetime.timedelta(days=90))
+
+        assert self.published(broker, user) == [("deleted", str(old.pk), None)]
+
+
+class TestPostgresBroker:
+    def test_batch_is_one_statement(self, monkeypatch):
+        executed = []
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            def execute(self, sql, params):
+                executed.append((sql, params))
+
+        connection = type("Connection", (), {"cursor": lambda self: Cursor()})()
+        monkeypatch.setattr("apps.tickets.feed.connections", {"default": connection})
+        events = [Event(1, "updated", {"id": str(n)}) for n in range(3)]
+
+        PostgresBroker().publish(events)
+        PostgresBroker().publish([])
+
+        ((sql, (channel, payloads)),) = executed
+        assert "unnest" in sql
+        assert channel == PostgresBroker.channel
+        assert payloads == [event.to_json() for event in events]
+
+
+class TestEvent:
+    def test_encode(self):
+        event = Event(1, "deleted", {"id": "abc"}, id="0001")
+        assert event.encode() == 'id: 0001\nevent: deleted\ndata: {"id": "abc"}\n\n'
+
+    def test_encode_without_id(self):
+        assert Event(1, RESET, {}, id="").encode() == "event: reset\ndata: {}\n\n"
+
+    def test_notify_payload_round_trip(self):
+        event = Event(7, "created", {"id": "abc", "title": "Title"})
+        decoded = Event.from_json(event.to_json())
+        assert (decoded.id, decoded.user_id, decoded.type, decoded.data) == (
+            event.id,
+            7,
+            "created",
+            {"id": "abc", "title": "Title"},
+        )
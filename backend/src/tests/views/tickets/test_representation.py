@@ -0,0 +1,86 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from apps.tickets.models import Ticket
+from apps.tickets.renderers import TicketJSONRenderer
+from apps.tickets.representation import get_values_representation
+from apps.tickets.serializers import TicketDetailSerializer, TicketListSerializer
+from tests.factories import TicketFactory
+
+
+@pytest.mark.django_db
+class TestValuesRepresentation:
+    list_url = reverse("tickets-list")
+
+    @pytest.mark.parametrize(
+        "serializer_class", [TicketListSerializer, TicketDetailSerializer]
+    )
+    def test_matches_serializer(self, user, serializer_class):
+        TicketFactory(user=user, title="Zażółć   gęślą", description="")
+        TicketFactory.create_batch(3, user=user)
+        queryset = Ticket.objects.filter(user=user).order_by("-created_at", "id")
+
+        representation = get_values_representation(serializer_class)
+        data = representation.many(representation.values(queryset))
+        assert data == serializer_class(queryset, many=True).data
+
+    def test_list_response_is_byte_compatible(
+        self, authenticated_client, user, multiple_tickets
+    ):
+        TicketFactory(user=user, title='Quotes " and \\ and  ')
+        response = authenticated_client.get(self.list_url, {"limit": 3})
+
+        queryset = Ticket.objects.filter(user=user).order_by("-created_at", "id")
+        expected = JSONRenderer().render(
+            {
+                "next": response.json()["next"],
+                "results": TicketListSerializer(queryset[:3], many=True).data,
+            }
+        )
+        assert response.content == expected
+
+    def test_list_pages_with_values_rows(self, authenticated_client, multiple_tickets):
+        first = authenticated_client.get(
+            self.list_url, {"limit": 2, "ordering": "title"}
+        ).json()
+        second = authenticated_client.get(first["next"]).json()
+
+        titles = [t["title"] for t in first["results"] + second["results"]]
+        assert titles == sorted(t.title for t in multiple_tickets)
+
+
+class TestTicketJSONRenderer:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"text": 'ünïcødé    \x00\x1f\x7f "quoted" \\ \n\t'},
+            {"emoji": "\U0001f600", "empty": "", "none": None, "bool": True},
+            {"nested": [{"a": 1, "b": [1.5, -2, 10**18]}, (1, 2)]},
+            {"when": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456)},
+            {"when": timezone.now(), "day": datetime.date(2024, 1, 2)},
+            {"time": datetime.time(3, 4, 5, 678)},
+            {"id": uuid.uuid4(), "amount": decimal.Decimal("1.10")},
+            {"lazy": gettext_lazy("Not found.")},
+            {"big": 2**70},
+            [],
+        ],
+    )
+    def test_matches_json_renderer(self, data):
+        assert TicketJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indent_falls_back(self):
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=4"
+        assert TicketJSONRenderer().render(data, media_type) == (
+            JSONRenderer().render(data, media_type)
+        )
+
+    def test_none_renders_empty(self):
+        assert TicketJSONRenderer().render(None) == b""
@@ -0,0 +1,122 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.tickets.counters import get_status_counts
+from apps.tickets.enums import TicketStatus
+from apps.tickets.models import Ticket
+from tests.factories import TicketFactory, UserFactory
+
+
+def expected_counts(user):
+    counts = dict.fromkeys(TicketStatus.values, 0)
+    for ticket_status in Ticket.objects.filter(user=user).values_list(
+        "status", flat=True
+    ):
+        counts[ticket_status] += 1
+    return counts
+
+
+@pytest.mark.django_db
+class TestTicketStats:
+    url = reverse("tickets-stats")
+
+    def test_stats(self, authenticated_client, tickets_with_different_statuses):
+        TicketFactory(user=authenticated_client.user, open=True)
+        TicketFactory(user=UserFactory(), open=True)
+
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "open": 2,
+            "in_progress": 1,
+            "resolved": 1,
+            "closed": 1,
+            "total": 5,
+        }
+
+    def test_stats_read_counters_only(self, authenticated_client, multiple_tickets):
+        authenticated_client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(self.url)
+
+        assert response.json()["total"] == 3
+        assert [q["sql"] for q in queries if '"tickets"' in q["sql"]] == []
+
+    def test_stats_without_tickets(self, authenticated_client):
+        response = authenticated_client.get(self.url)
+        assert response.json() == {
+            "open": 0,
+            "in_progress": 0,
+            "resolved": 0,
+            "closed": 0,
+            "total": 0,
+        }
+
+    def test_stats_requires_authentication(self, api_client):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestStatusCounters:
+    def test_create_update_and_delete(self, authenticated_client):
+        user = authenticated_client.user
+        response = authenticated_client.post(
+            reverse("tickets-list"),
+            {"title": "Counted", "description": "Counted description"},
+            format="json",
+        )
+        url = reverse("tickets-detail", kwargs={"pk": response.data["id"]})
+        assert get_status_counts(user.pk) == expected_counts(user)
+
+        authenticated_client.patch(url, {"status": TicketStatus.IN_PROGRESS})
+        assert get_status_counts(user.pk)[TicketStatus.IN_PROGRESS] == 1
+        assert get_status_counts(user.pk) == expected_counts(user)
+
+        authenticated_client.patch(url, {"title": "Renamed"})
+        assert get_status_counts(user.pk) == expected_counts(user)
+
+        authenticated_client.delete(url)
+        assert get_status_counts(user.pk) == expected_counts(user)
+        assert sum(get_status_counts(user.pk).values()) == 0
+
+    def test_rejected_transition_keeps_counts(self, authenticated_client):
+        user = authenticated_client.user
+        ticket = TicketFactory(user=user, closed=True)
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+
+        response = authenticated_client.patch(url, {"status": TicketStatus.OPEN})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert get_status_counts(user.pk) == expected_counts(user)
+
+    def test_bulk_create_and_transition(self, authenticated_client):
+        user = authenticated_client.user
+        data = [
+            {"title": f"Bulk ticket {i}", "description": "Bulk description text"}
+            for i in range(4)
+        ]
+        response = authenticated_client.post(
+            reverse("tickets-bulk-create"), data, format="json"
+        )
+        assert get_status_counts(user.pk) == expected_counts(user)
+
+        ids = [result["ticket"]["id"] for result in response.json()["results"][:3]]
+        closed = TicketFactory(user=user, closed=True)
+        authenticated_client.post(
+            reverse("tickets-bulk-transition"),
+            {"ids": [*ids, str(closed.id)], "status": TicketStatus.IN_PROGRESS},
+            format="json",
+        )
+
+        assert get_status_counts(user.pk) == {
+            "open": 1,
+            "in_progress": 3,
+            "resolved": 0,
+            "closed": 1,
+        }
+        assert get_status_counts(user.pk) == expected_counts(user)
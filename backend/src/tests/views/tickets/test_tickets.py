@@ -1,6 +1,8 @@
 import uuid
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -26,6 +28,16 @@ class TestTicketViewSet:
         assert "id" in response_data
         assert "created_at" in response_data
 
+    def test_create_ticket_ids_are_time_ordered(self, authenticated_client):
+        url = reverse("tickets-list")
+        ids = []
+        for i in range(3):
+            data = {"title": f"Ordered {i}", "description": "Ordered description"}
+            response = authenticated_client.post(url, data, format="json")
+            ids.append(uuid.UUID(response.json()["id"]))
+        assert all(ticket_id.version == 7 for ticket_id in ids)
+        assert ids == sorted(ids)
+
     def test_create_ticket_failure_duplicate_title(self, authenticated_client):
         user = authenticated_client.user
         TicketFactory(user=user, title="Duplicate Title")
@@ -39,11 +51,52 @@ class TestTicketViewSet:
         response_data = response.json()
         assert "A ticket with this title already exists." in response_data["title"]
 
+    def test_create_ticket_duplicate_title_needs_no_lookup(self, authenticated_client):
+        TicketFactory(user=authenticated_client.user, title="Duplicate Title")
+        url = reverse("tickets-list")
+        data = {
+            "title": "Duplicate Title",
+            "description": "This is a valid description",
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {
+            "title": ["A ticket with this title already exists."]
+        }
+        assert not any(query["sql"].startswith("SELECT 1") for query in queries)
+
+    def test_same_title_allowed_for_different_users(self, authenticated_client):
+        TicketFactory(user=UserFactory(), title="Shared Title")
+        url = reverse("tickets-list")
+        data = {"title": "Shared Title", "description": "This is a valid description"}
+        response = authenticated_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_update_ticket_failure_duplicate_title(self, authenticated_client, ticket):
+        TicketFactory(user=authenticated_client.user, title="Taken Title")
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        response = authenticated_client.patch(
+            url, {"title": "Taken Title"}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {
+            "title": ["A ticket with this title already exists."]
+        }
+        ticket.refresh_from_db()
+        assert ticket.title == "Test Ticket"
+
+    def test_update_ticket_keeps_own_title(self, authenticated_client, ticket):
+        url = reverse("tickets-detail", kwargs={"pk": ticket.id})
+        data = {"title": ticket.title, "status": TicketStatus.IN_PROGRESS}
+        response = authenticated_client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
     def test_list_tickets_success(self, authenticated_client, multiple_tickets):
         url = reverse("tickets-list")
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        response_data = response.json()
+        response_data = response.json()["results"]
         assert len(response_data) == 3
         expected_keys = {"id", "title", "status", "created_at"}
         assert all(set(ticket.keys()) == expected_keys for ticket in response_data)
@@ -56,7 +109,7 @@ class TestTicketViewSet:
         url = reverse("tickets-list")
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        response_data = response.json()
+        response_data = response.json()["results"]
         assert len(response_data) == 1
         assert response_data[0]["title"] == "My Ticket"
 
@@ -100,7 +153,7 @@ class TestTicketViewSet:
         url = reverse("tickets-list")
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        response_data = response.json()
+        response_data = response.json()["results"]
         statuses = [ticket["status"] for ticket in response_data]
         # Sprawdź, czy wszystkie wymagane statusy są obecne
         required_statuses = {
@@ -159,6 +212,159 @@ class TestTicketViewSet:
         else:
             assert len(response.json()) == 15
 
+    def test_ticket_list_cursor_walks_all_pages(self, authenticated_client):
+        tickets = TicketFactory.create_batch(7, user=authenticated_client.user)
+        url = reverse("tickets-list")
+        seen = []
+        response = authenticated_client.get(url, {"limit": 3})
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            response_data = response.json()
+            seen.extend(ticket["id"] for ticket in response_data["results"])
+            if response_data["next"] is None:
+                break
+            response = authenticated_client.get(response_data["next"])
+        assert len(seen) == len(set(seen)) == 7
+        assert set(seen) == {str(ticket.id) for ticket in tickets}
+
+    def test_ticket_list_cursor_orders_by_created_at_and_id(self, authenticated_client):
+        user = authenticated_client.user
+        tickets = TicketFactory.create_batch(4, user=user)
+        created_at = tickets[0].created_at
+        Ticket.objects.filter(user=user).update(created_at=created_at)
+        url = reverse("tickets-list")
+        first = authenticated_client.get(url, {"limit": 2}).json()
+        second = authenticated_client.get(first["next"]).json()
+        ids = [t["id"] for t in first["results"] + second["results"]]
+        assert ids == sorted(str(ticket.id) for ticket in tickets)
+        assert second["next"] is None
+
+    def test_ticket_list_invalid_cursor(self, authenticated_client):
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_ticket_list_filter_by_status(
+        self, authenticated_client, tickets_with_different_statuses
+    ):
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"status": "open,closed"})
+        assert response.status_code == status.HTTP_200_OK
+        statuses = {ticket["status"] for ticket in response.json()["results"]}
+        assert statuses == {TicketStatus.OPEN, TicketStatus.CLOSED}
+
+    def test_ticket_list_filter_invalid_status(self, authenticated_client):
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"status": "unknown"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "status" in response.json()
+
+    def test_ticket_list_filter_by_title_prefix(self, authenticated_client):
+        user = authenticated_client.user
+        TicketFactory(user=user, title="Printer broken")
+        TicketFactory(user=user, title="Printer jammed")
+        TicketFactory(user=user, title="VPN down")
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"title": "Printer"})
+        titles = {ticket["title"] for ticket in response.json()["results"]}
+        assert titles == {"Printer broken", "Printer jammed"}
+
+    def test_ticket_list_filter_by_created_range(self, authenticated_client):
+        user = authenticated_client.user
+        old_ticket = TicketFactory(user=user)
+        new_ticket = TicketFactory(user=user)
+        Ticket.objects.filter(pk=old_ticket.pk).update(
+            created_at=old_ticket.created_at.replace(year=2020)
+        )
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"created_after": "2021-01-01"})
+        ids = [ticket["id"] for ticket in response.json()["results"]]
+        assert ids == [str(new_ticket.id)]
+        response = authenticated_client.get(url, {"created_before": "2021-01-01"})
+        ids = [ticket["id"] for ticket in response.json()["results"]]
+        assert ids == [str(old_ticket.id)]
+
+    def test_ticket_list_filter_invalid_date(self, authenticated_client):
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"updated_after": "yesterday"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "updated_after" in response.json()
+
+    def test_ticket_list_ordering_with_cursor(self, authenticated_client):
+        user = authenticated_client.user
+        titles = ["Delta", "Alpha", "Echo", "Charlie", "Bravo"]
+        for title in titles:
+            TicketFactory(user=user, title=title)
+        url = reverse("tickets-list")
+        first = authenticated_client.get(url, {"ordering": "title", "limit": 3})
+        second = authenticated_client.get(first.json()["next"])
+        results = first.json()["results"] + second.json()["results"]
+        assert [ticket["title"] for ticket in results] == sorted(titles)
+
+    def test_ticket_list_ordering_ignores_unknown_fields(
+        self, authenticated_client, multiple_tickets
+    ):
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"ordering": "description"})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 3
+
+    def test_ticket_list_search_ranks_title_matches_first(self, authenticated_client):
+        user = authenticated_client.user
+        in_description = TicketFactory(
+            user=user, title="Network issue", description="The printer is offline"
+        )
+        in_title = TicketFactory(
+            user=user, title="Printer offline", description="Nothing prints at all"
+        )
+        TicketFactory(user=user, title="Unrelated", description="Keyboard is broken")
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"q": "printer"})
+        assert response.status_code == status.HTTP_200_OK
+        ids = [ticket["id"] for ticket in response.json()["results"]]
+        assert ids == [str(in_title.id), str(in_description.id)]
+
+    def test_ticket_list_search_follows_updates_and_deletes(self, authenticated_client):
+        user = authenticated_client.user
+        ticket = TicketFactory(user=user, title="Old words", description="Nothing")
+        url = reverse("tickets-list")
+        ticket.title = "Fresh words"
+        ticket.save()
+        assert len(authenticated_client.get(url, {"q": "old"}).json()["results"]) == 0
+        assert len(authenticated_client.get(url, {"q": "fresh"}).json()["results"]) == 1
+        ticket.delete()
+        assert len(authenticated_client.get(url, {"q": "fresh"}).json()["results"]) == 0
+
+    def test_ticket_list_search_paginates(self, authenticated_client):
+        user = authenticated_client.user
+        for i in range(5):
+            TicketFactory(user=user, title=f"Outage {i}", description="Mail outage")
+        TicketFactory(
+            user=authenticated_client.user, title="Other", description="x" * 10
+        )
+        url = reverse("tickets-list")
+        first = authenticated_client.get(url, {"q": "outage", "limit": 3}).json()
+        second = authenticated_client.get(first["next"]).json()
+        ids = [ticket["id"] for ticket in first["results"] + second["results"]]
+        assert len(ids) == len(set(ids)) == 5
+        assert second["next"] is None
+
+    def test_ticket_list_search_ignores_query_syntax(self, authenticated_client):
+        TicketFactory(
+            user=authenticated_client.user, title="Quoted", description="a" * 10
+        )
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"q": '"quoted" OR NEAR(*'})
+        assert response.status_code == status.HTTP_200_OK
+        response = authenticated_client.get(url, {"q": "!!!"})
+        assert response.json()["results"] == []
+
+    def test_ticket_list_search_user_isolation(self, authenticated_client):
+        TicketFactory(user=UserFactory(), title="Secret plan", description="a" * 10)
+        url = reverse("tickets-list")
+        response = authenticated_client.get(url, {"q": "secret"})
+        assert response.json()["results"] == []
+
     def test_create_ticket_with_non_open_status_fails(self, authenticated_client):
         url = reverse("tickets-list")
         data = {
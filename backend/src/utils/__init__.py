@@ -1,5 +1,7 @@
+from utils.ids import uuid7
 from utils.models import TimestampedModel
 
 __all__ = [
     "TimestampedModel",
+    "uuid7",
 ]
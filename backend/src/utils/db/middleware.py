@@ -0,0 +1,54 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from utils.db.routers import (
+    astick_to_primary,
+    get_replicas,
+    start_request,
+    stick_to_primary,
+)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Track database writes per request for ``ReplicaRouter``.
+
+    After a request of an authenticated user wrote to the primary, the reads
+    of that user stay on the primary for ``DATABASE_REPLICA_STICKY_SECONDS``,
+    long enough for the replicas to replay the write.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = start_request()
+        response = self.get_response(request)
+        user_id = self.get_writer(request, state)
+        if user_id is not None:
+            stick_to_primary(user_id)
+        return response
+
+    async def __acall__(self, request):
+        state = start_request()
+        response = await self.get_response(request)
+        user_id = self.get_writer(request, state)
+        if user_id is not None:
+            await astick_to_primary(user_id)
+        return response
+
+    @staticmethod
+    def get_writer(request, state):
+        if not state.wrote or not get_replicas():
+            return None
+        # Set by DRF or by AuthenticationMiddleware.
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user.pk
@@ -0,0 +1,101 @@
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from psycopg import IsolationLevel
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that borrows connections from a psycopg 3 pool.
+
+    Enable it with ``"ENGINE": "utils.db.postgresql_pool"`` and
+    ``OPTIONS["pool"]`` set to ``True`` or to ``ConnectionPool`` keyword
+    arguments (``min_size``, ``max_size``, ``timeout``, ``max_idle``, ...).
+    Closing the Django connection hands it back to the pool, so
+    ``CONN_MAX_AGE`` must stay 0. One pool per alias and process; the pool
+    opens on the first query, after gunicorn has forked the worker.
+    """
+
+    _connection_pools = {}
+    _connection_pools_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not options:
+            return None
+        if self.alias not in self._connection_pools:
+            with self._connection_pools_lock:
+                if self.alias not in self._connection_pools:
+                    self._connection_pools[self.alias] = self.create_pool(
+                        {} if options is True else options
+                    )
+        return self._connection_pools[self.alias]
+
+    def create_pool(self, options):
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured(
+                f"Database {self.alias!r} uses a connection pool, "
+                "set CONN_MAX_AGE to 0."
+            )
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError as error:
+            raise ImproperlyConfigured(
+                "Error loading psycopg_pool, install psycopg[pool]."
+            ) from error
+
+        kwargs = self.get_connection_params()
+        # Django switches autocommit on checkout, start from the default.
+        kwargs["autocommit"] = True
+        check = (
+            ConnectionPool.check_connection
+            if self.settings_dict["CONN_HEALTH_CHECKS"]
+            else None
+        )
+        return ConnectionPool(
+            kwargs=kwargs, open=False, check=check, name=self.alias, **options
+        )
+
+    def close_pool(self):
+        with self._connection_pools_lock:
+            pool = self._connection_pools.pop(self.alias, None)
+        if pool is not None:
+            pool.close()
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        pool.open()
+        connection = pool.getconn()
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(
+                isolation_level or IsolationLevel.READ_COMMITTED
+            )
+        except ValueError:
+            pool.putconn(connection)
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {isolation_level} "
+                f"specified. Use one of the psycopg.IsolationLevel values."
+            )
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is None or self.pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            self.pool.putconn(self.connection)
+        # The pool may hand the connection to another thread right away.
+        self.connection = None
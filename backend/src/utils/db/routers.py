@@ -0,0 +1,100 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+_routing_state = ContextVar("replica_routing_state", default=None)
+
+
+class RoutingState:
+    """Where the reads of the current request may go."""
+
+    __slots__ = ("replica", "wrote")
+
+    def __init__(self):
+        self.replica = None
+        self.wrote = False
+
+
+def start_request():
+    state = RoutingState()
+    _routing_state.set(state)
+    return state
+
+
+def get_replicas():
+    return settings.DATABASE_REPLICAS
+
+
+def get_sticky_key(user_id):
+    return f"db:primary:{user_id}"
+
+
+def stick_to_primary(user_id):
+    """Keep the reads of ``user_id`` on the primary while replicas catch up."""
+    cache.set(get_sticky_key(user_id), True, settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+async def astick_to_primary(user_id):
+    await cache.aset(
+        get_sticky_key(user_id), True, settings.DATABASE_REPLICA_STICKY_SECONDS
+    )
+
+
+def choose_replica(state, sticky):
+    replicas = get_replicas()
+    if state is None or state.wrote or sticky or not replicas:
+        return None
+    state.replica = random.choice(replicas)
+    return state.replica
+
+
+def use_replica(user_id):
+    """
+    Send the remaining reads of the request to a replica.
+
+    Only for requests that read and never write. Returns the chosen alias, or
+    ``None`` when reads stay on the primary: no replica is configured, the
+    request already wrote, or ``user_id`` wrote within the sticky window.
+    """
+    state = _routing_state.get()
+    if state is None or not get_replicas():
+        return None
+    return choose_replica(state, cache.get(get_sticky_key(user_id)))
+
+
+async def ause_replica(user_id):
+    state = _routing_state.get()
+    if state is None or not get_replicas():
+        return None
+    return choose_replica(state, await cache.aget(get_sticky_key(user_id)))
+
+
+class ReplicaRouter:
+    """
+    Route the reads of requests that opted in with ``use_replica`` to a read
+    replica and everything else to ``default``.
+
+    Writes, including ``select_for_update``, and every read after a write of
+    the same request stay on the primary, so a request sees its own writes.
+    ``ReplicaRoutingMiddleware`` keeps the following requests of the writing
+    user on the primary for ``DATABASE_REPLICA_STICKY_SECONDS``.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None or state.replica is None or state.wrote:
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
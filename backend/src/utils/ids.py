@@ -0,0 +1,43 @@
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+
+def uuid7():
+    """
+    Return a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new keys land at
+    the right edge of a B-tree index instead of on a random page. The 12-bit
+    ``rand_a`` field is used as a counter that keeps ids generated within the
+    same millisecond monotonic in this process.
+    """
+    global _last_timestamp, _counter
+
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            _last_timestamp = timestamp
+            # Start low in the counter range to leave room for increments.
+            _counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_timestamp += 1
+                _counter = 0
+        timestamp, counter = _last_timestamp, _counter
+
+    rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+    value = (
+        (timestamp & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
@@ -22,5 +22,20 @@ if [ "${ENVIRONMENT:-development}" == "development" ]; then
 	python manage.py collectstatic --noinput
 fi
 
+if [ "${ENVIRONMENT:-development}" == "production" ]; then
+	# Forced: the compose env file points every container at core.settings.dev.
+	export DJANGO_SETTINGS_MODULE=core.settings.prod
+	mkdir -p static staticfiles
+
+	echo "Do database migrations..."
+	python manage.py migrate --noinput
+
+	echo "Collect static..."
+	python manage.py collectstatic --noinput
+
+	# exec so gunicorn gets SIGTERM and shuts workers down gracefully
+	echo "Starting gunicorn (${DJANGO_INTERFACE:-asgi})..."
+	exec gunicorn --config core/gunicorn.py
+fi
 
 python manage.py runserver "${DJANGO_HOST}":"${DJANGO_PORT}"
\ No newline at end of file
@@ -10,6 +10,11 @@ export interface Ticket {
   updated_at?: string;
 }
 
+export interface TicketPage {
+  next: string | null;
+  results: Ticket[];
+}
+
 export interface TicketCreateRequest {
   title: string;
   description: string;
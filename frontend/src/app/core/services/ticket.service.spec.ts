@@ -51,26 +51,35 @@ describe('TicketService', () => {
   });
 
   describe('getTickets', () => {
-    it('should fetch all tickets', () => {
-      service.getTickets().subscribe(tickets => {
-        expect(tickets).toEqual(mockTickets);
-        expect(tickets.length).toBe(2);
+    it('should fetch the first page', () => {
+      service.getTickets().subscribe(page => {
+        expect(page.results).toEqual(mockTickets);
+        expect(page.next).toBeNull();
       });
 
       const req = httpMock.expectOne(`${apiUrl}/`);
       expect(req.request.method).toBe('GET');
-      req.flush(mockTickets);
+      req.flush({ next: null, results: mockTickets });
+    });
+
+    it('should fetch only the requested page', () => {
+      const next = `${apiUrl}/?cursor=abc`;
+
+      service.getTickets(next).subscribe(page => {
+        expect(page.results).toEqual([mockTickets[1]]);
+      });
+
+      httpMock.expectOne(next).flush({ next: null, results: [mockTickets[1]] });
     });
 
     it('should handle empty ticket list', () => {
-      service.getTickets().subscribe(tickets => {
-        expect(tickets).toEqual([]);
-        expect(tickets.length).toBe(0);
+      service.getTickets().subscribe(page => {
+        expect(page.results).toEqual([]);
       });
 
       const req = httpMock.expectOne(`${apiUrl}/`);
       expect(req.request.method).toBe('GET');
-      req.flush([]);
+      req.flush({ next: null, results: [] });
     });
   });
 
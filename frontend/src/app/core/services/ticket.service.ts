@@ -2,7 +2,12 @@ import { Injectable } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { environment } from '@environments/environment';
 import { Observable, BehaviorSubject } from 'rxjs';
-import { Ticket, TicketCreateRequest, TicketUpdateRequest } from '@core/interfaces/ticket.interface';
+import {
+  Ticket,
+  TicketCreateRequest,
+  TicketPage,
+  TicketUpdateRequest,
+} from '@core/interfaces/ticket.interface';
 
 @Injectable({
   providedIn: 'root',
@@ -22,8 +27,9 @@ export class TicketService {
     this.ticketChangedSubject.next(null);
   }
 
-  getTickets(): Observable<Ticket[]> {
-    return this.http.get<Ticket[]>(`${this.apiUrl}/`);
+  getTickets(next?: string | null): Observable<TicketPage> {
+    // One cursor page, pass its next link for the following one.
+    return this.http.get<TicketPage>(next ?? `${this.apiUrl}/`);
   }
 
   getTicket(id: string): Observable<Ticket> {
@@ -5,7 +5,7 @@ import { of, throwError } from 'rxjs';
 import { TicketListComponent } from './ticket-list.component';
 import { TicketService } from '@core/services/ticket.service';
 import { ErrorService } from '@core/services/error.service';
-import { Ticket } from '@core/interfaces/ticket.interface';
+import { Ticket, TicketPage } from '@core/interfaces/ticket.interface';
 import { TicketStatus } from '@core/enums';
 
 describe('TicketListComponent', () => {
@@ -34,6 +34,8 @@ describe('TicketListComponent', () => {
     }
   ];
 
+  const page = (results: Ticket[], next: string | null = null): TicketPage => ({ next, results });
+
   beforeEach(async () => {
     const ticketServiceSpy = jasmine.createSpyObj('TicketService', [
       'getTickets',
@@ -70,7 +72,7 @@ describe('TicketListComponent', () => {
   });
 
   beforeEach(() => {
-    ticketService.getTickets.and.returnValue(of(mockTickets));
+    ticketService.getTickets.and.returnValue(of(page(mockTickets)));
     errorService.getGeneralErrors.and.returnValue([]);
   });
 
@@ -90,7 +92,7 @@ describe('TicketListComponent', () => {
     });
 
     it('should show error message when no tickets exist', () => {
-      ticketService.getTickets.and.returnValue(of([]));
+      ticketService.getTickets.and.returnValue(of(page([])));
 
       component.ngOnInit();
 
@@ -140,6 +142,50 @@ describe('TicketListComponent', () => {
     });
   });
 
+  describe('loadMoreTickets', () => {
+    const next = 'http://localhost:8000/api/tickets/?cursor=abc';
+
+    it('should load only the first page', () => {
+      ticketService.getTickets.and.returnValue(of(page([mockTickets[0]], next)));
+
+      component.loadTickets();
+
+      expect(ticketService.getTickets).toHaveBeenCalledTimes(1);
+      expect(component.tickets).toEqual([mockTickets[0]]);
+      expect(component.next).toBe(next);
+    });
+
+    it('should append the next page', () => {
+      component.tickets = [mockTickets[0]];
+      component.next = next;
+      ticketService.getTickets.and.returnValue(of(page([mockTickets[1]])));
+
+      component.loadMoreTickets();
+
+      expect(ticketService.getTickets).toHaveBeenCalledWith(next);
+      expect(component.tickets).toEqual(mockTickets);
+      expect(component.next).toBeNull();
+      expect(component.isLoading).toBe(false);
+    });
+
+    it('should not load past the last page', () => {
+      component.next = null;
+
+      component.loadMoreTickets();
+
+      expect(ticketService.getTickets).not.toHaveBeenCalled();
+    });
+
+    it('should load the next page when scrolled to the bottom', () => {
+      component.next = next;
+      const panel = { scrollTop: 400, clientHeight: 300, scrollHeight: 700 };
+
+      component.onScroll({ target: panel } as unknown as Event);
+
+      expect(ticketService.getTickets).toHaveBeenCalledWith(next);
+    });
+  });
+
   describe('viewTicketDetails', () => {
     it('should navigate to ticket details', () => {
       const ticket = mockTickets[0];
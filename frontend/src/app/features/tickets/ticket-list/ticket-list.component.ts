@@ -16,6 +16,8 @@ import { first, Subscription } from 'rxjs';
 })
 export class TicketListComponent implements OnInit, OnDestroy {
   tickets: Ticket[] = [];
+  // Cursor link of the next page, null once the last page is loaded.
+  next: string | null = null;
   isLoading = false;
   hasLoaded = false;
   subscription: Subscription | null = null;
@@ -64,12 +66,13 @@ export class TicketListComponent implements OnInit, OnDestroy {
     this.errorService.clearAllErrors();
 
     this.ticketService.getTickets().subscribe({
-      next: (tickets) => {
+      next: (page) => {
         this.isLoading = false;
         this.hasLoaded = true;
-        this.tickets = tickets;
+        this.tickets = page.results;
+        this.next = page.next;
 
-        if (tickets.length === 0) {
+        if (page.results.length === 0) {
           this.errorService.addGeneralError('You must first create ticket');
         }
       },
@@ -81,6 +84,34 @@ export class TicketListComponent implements OnInit, OnDestroy {
     });
   }
 
+  loadMoreTickets(): void {
+    if (this.isLoading || !this.next) {
+      return;
+    }
+
+    this.isLoading = true;
+
+    this.ticketService.getTickets(this.next).subscribe({
+      next: (page) => {
+        this.isLoading = false;
+        this.tickets = this.tickets.concat(page.results);
+        this.next = page.next;
+      },
+      error: (error) => {
+        this.isLoading = false;
+        this.errorService.getServerErrors(error);
+      },
+    });
+  }
+
+  onScroll(event: Event): void {
+    // Fetch the next page once the panel is scrolled near its bottom.
+    const panel = event.target as HTMLElement;
+    if (panel.scrollTop + panel.clientHeight >= panel.scrollHeight - 100) {
+      this.loadMoreTickets();
+    }
+  }
+
   viewTicketDetails(ticket: Ticket): void {
     if (ticket.id) {
       this.router.navigate(['/tickets', ticket.id]);